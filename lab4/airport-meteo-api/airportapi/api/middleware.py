@@ -0,0 +1,75 @@
+"""A module containing the ASGI middleware of the app."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from airportapi.utils.metrics import RequestMetrics
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """A class of the middleware measuring HTTP requests.
+
+    Requests are labelled with the path template of the matched route,
+    not the path, so the number of series stays bounded. The duration
+    covers the whole response, including a streamed body.
+    """
+
+    _app: ASGIApp
+    _metrics: RequestMetrics
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics) -> None:
+        """The initializer of the `metrics middleware`.
+
+        Args:
+            app (ASGIApp): The wrapped app.
+            metrics (RequestMetrics): The collected request metrics.
+        """
+
+        self._app = app
+        self._metrics = metrics
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """The method handling the ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The channel of incoming messages.
+            send (Send): The channel of outgoing messages.
+        """
+
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_status(message: Message) -> None:
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+            await send(message)
+
+        started = time.perf_counter()
+        self._metrics.in_flight += 1
+
+        try:
+            await self._app(scope, receive, send_status)
+        finally:
+            self._metrics.in_flight -= 1
+            route = scope.get("route")
+            self._metrics.observe(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                status,
+                time.perf_counter() - started,
+            )
@@ -2,14 +2,32 @@
 
 from typing import Iterable
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
+from airportapi.api.utils.conditional import ConditionalGet
+from airportapi.api.utils.paging import MAX_LIMIT, page_request
+from airportapi.api.utils.streaming import json_array_response
 from airportapi.container import Container
-from airportapi.core.domain.airport import Airport, AirportIn
-from airportapi.infrastructure.dto.airportdto import AirportDTO
+from airportapi.core.domain.airport import (
+    Airport,
+    AirportCodesIn,
+    AirportImportReport,
+    AirportIn,
+)
+from airportapi.core.domain.page import Page
+from airportapi.infrastructure.dto.airportdto import (
+    AirportDTO,
+    AirportLookupDTO,
+    AirportRouteDTO,
+    DistanceMatrixDTO,
+)
 from airportapi.infrastructure.services.iairport import IAirportService
+from airportapi.infrastructure.services.iairportimport import \
+    IAirportImportService
 
 router = APIRouter()
+conditional = ConditionalGet("airports", "countries", "continents")
 
 
 @router.post("/create", response_model=Airport, status_code=201)
@@ -33,20 +51,86 @@ async def create_airport(
     return new_airport.model_dump() if new_airport else {}
 
 
-@router.get("/all", response_model=Iterable[AirportDTO], status_code=200)
+@router.post(
+        "/import",
+        response_model=AirportImportReport,
+        status_code=200,
+        openapi_extra={
+            "requestBody": {
+                "required": True,
+                "content": {"text/csv": {"schema": {"type": "string"}}},
+            },
+        },
+)
+@inject
+async def import_airports(
+    request: Request,
+    service: IAirportImportService = Depends(
+        Provide[Container.airport_import_service]
+    ),
+) -> AirportImportReport:
+    """An endpoint for importing airports from a CSV document.
+
+    The body is read as a stream, so the document is never held in memory
+    at once. Rejected rows are listed in the report.
+
+    Args:
+        request (Request): The request with the CSV document as the body.
+        service (IAirportImportService, optional): The injected service
+            dependency.
+
+    Raises:
+        HTTPException: 400 if the header lacks a required column.
+
+    Returns:
+        AirportImportReport: The outcome of the import.
+    """
+
+    try:
+        return await service.import_csv(request.stream())
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
+
+
+@router.get(
+        "/all",
+        response_model=Page[AirportDTO] | list[AirportDTO],
+        status_code=200,
+)
 @inject
 async def get_all_airports(
+    stream: bool = False,
+    limit: int | None = Query(default=None, ge=1, le=MAX_LIMIT),
+    sort: str | None = None,
+    cursor: str | None = None,
+    cache_headers: dict[str, str] = Depends(conditional),
     service: IAirportService = Depends(Provide[Container.airport_service]),
-) -> Iterable:
+) -> Iterable | Page | StreamingResponse:
     """An endpoint for getting all airports.
 
     Args:
+        stream (bool): If the airports should be streamed from a DB cursor
+            instead of being loaded at once. Defaults to False.
+        limit (int | None): The maximal number of airports of the page.
+            Passing any of `limit`, `sort` and `cursor` returns a page.
+        sort (str | None): The sort key, `name` or `icao_code`, descending
+            if prefixed with `-`. Defaults to `name`.
+        cursor (str | None): The `next` cursor of the previous page.
+        cache_headers (dict[str, str]): The `ETag` and `Cache-Control`
+            headers, 304 is answered if the client has the current data.
         service (IAirportService, optional): The injected service dependency.
 
     Returns:
-        Iterable: The airport attributes collection.
+        Iterable | Page | StreamingResponse: The airport attributes
+            collection or its page.
     """
 
+    if page := page_request(limit, sort, cursor):
+        return await service.get_all_page(page)
+
+    if stream:
+        return json_array_response(service.stream_all(), cache_headers)
+
     airports = await service.get_all()
 
     return airports
@@ -54,24 +138,35 @@ async def get_all_airports(
 
 @router.get(
         "/country/{country_id}",
-        response_model=Iterable[Airport],
+        response_model=Page[Airport] | list[Airport],
         status_code=200,
 )
 @inject
 async def get_airports_by_country(
     country_id: int,
+    limit: int | None = Query(default=None, ge=1, le=MAX_LIMIT),
+    sort: str | None = None,
+    cursor: str | None = None,
     service: IAirportService = Depends(Provide[Container.airport_service]),
-) -> Iterable:
+) -> Iterable | Page:
     """An endpoint for getting airports by country.
 
     Args:
         country_id (int): The id of the country.
+        limit (int | None): The maximal number of airports of the page.
+            Passing any of `limit`, `sort` and `cursor` returns a page.
+        sort (str | None): The sort key, `name` or `icao_code`, descending
+            if prefixed with `-`. Defaults to `name`.
+        cursor (str | None): The `next` cursor of the previous page.
         service (IAirportService, optional): The injected service dependency.
 
     Returns:
-        Iterable: The airport details collection.
+        Iterable | Page: The airport details collection or its page.
     """
 
+    if page := page_request(limit, sort, cursor):
+        return await service.get_by_country_page(country_id, page)
+
     airports = await service.get_by_country(country_id)
 
     return airports
@@ -79,29 +174,146 @@ async def get_airports_by_country(
 
 @router.get(
         "/continent/{continent_id}",
-        response_model=Iterable[Airport],
+        response_model=Page[Airport] | list[Airport],
         status_code=200,
 )
 @inject
 async def get_airports_by_continent(
     continent_id: int,
+    limit: int | None = Query(default=None, ge=1, le=MAX_LIMIT),
+    sort: str | None = None,
+    cursor: str | None = None,
     service: IAirportService = Depends(Provide[Container.airport_service]),
-) -> Iterable:
+) -> Iterable | Page:
     """An endpoint for getting airports by continent.
 
     Args:
         country_id (int): The id of the continent.
+        limit (int | None): The maximal number of airports of the page.
+            Passing any of `limit`, `sort` and `cursor` returns a page.
+        sort (str | None): The sort key, `name` or `icao_code`, descending
+            if prefixed with `-`. Defaults to `name`.
+        cursor (str | None): The `next` cursor of the previous page.
         service (IAirportService, optional): The injected service dependency.
 
     Returns:
-        Iterable: The airport details collection.
+        Iterable | Page: The airport details collection or its page.
     """
 
+    if page := page_request(limit, sort, cursor):
+        return await service.get_by_continent_page(continent_id, page)
+
     airports = await service.get_by_continent(continent_id)
 
     return airports
 
 
+@router.get(
+        "/location",
+        response_model=Iterable[Airport],
+        status_code=200,
+)
+@inject
+async def get_airports_by_location(
+    latitude: float,
+    longitude: float,
+    radius: float,
+    service: IAirportService = Depends(Provide[Container.airport_service]),
+) -> Iterable:
+    """An endpoint for getting airports by location.
+
+    Args:
+        latitude (float): The latitude of search center point.
+        longitude (float): The longitude of search center point.
+        radius (float): The radius of search in kilometres.
+        service (IAirportService, optional): The injected service dependency.
+
+    Returns:
+        Iterable: The airport details collection ordered by distance.
+    """
+
+    airports = await service.get_by_location(
+        latitude=latitude,
+        longitude=longitude,
+        radius=radius,
+    )
+
+    return airports
+
+
+@router.get(
+        "/nearest",
+        response_model=Iterable[Airport],
+        status_code=200,
+)
+@inject
+async def get_nearest_airports(
+    latitude: float,
+    longitude: float,
+    count: int = Query(default=5, ge=1, le=100),
+    service: IAirportService = Depends(Provide[Container.airport_service]),
+) -> Iterable:
+    """An endpoint for getting airports closest to the location.
+
+    Args:
+        latitude (float): The latitude of search center point.
+        longitude (float): The longitude of search center point.
+        count (int): The number of airports to find.
+        service (IAirportService, optional): The injected service dependency.
+
+    Returns:
+        Iterable: The airport details collection ordered by distance.
+    """
+
+    airports = await service.get_nearest(
+        latitude=latitude,
+        longitude=longitude,
+        count=count,
+    )
+
+    return airports
+
+
+@router.get(
+        "/corridor",
+        response_model=list[AirportRouteDTO],
+        status_code=200,
+)
+@inject
+async def get_airports_along_route(
+    origin: str,
+    destination: str,
+    width: float = Query(default=50.0, gt=0, le=1000),
+    service: IAirportService = Depends(Provide[Container.airport_service]),
+) -> list:
+    """An endpoint for getting airports close to the great-circle route.
+
+    Args:
+        origin (str): The ICAO code of the origin airport.
+        destination (str): The ICAO code of the destination airport.
+        width (float): The maximal distance from the route in kilometres.
+        service (IAirportService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if any of the airports does not exist.
+        HTTPException: 400 if the airports are at the same place.
+
+    Returns:
+        list: The airports with distances from and along the route,
+            ordered along it.
+    """
+
+    try:
+        airports = await service.get_along_route(origin, destination, width)
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
+
+    if airports is None:
+        raise HTTPException(status_code=404, detail="Airport not found")
+
+    return airports
+
+
 @router.get(
         "/{airport_id}",
         response_model=AirportDTO,
@@ -128,6 +340,78 @@ async def get_airport_by_id(
     raise HTTPException(status_code=404, detail="Airport not found")
 
 
+@router.post(
+        "/icao/batch",
+        response_model=list[AirportLookupDTO],
+        status_code=200,
+)
+@inject
+async def get_airports_by_icao_codes(
+    body: AirportCodesIn,
+    service: IAirportService = Depends(Provide[Container.airport_service]),
+) -> list:
+    """An endpoint for getting airports by a list of ICAO codes.
+
+    Args:
+        body (AirportCodesIn): The ICAO codes of the airports.
+        service (IAirportService, optional): The injected service dependency.
+
+    Returns:
+        list: The lookups in order of the codes, without the airport
+            if not found.
+    """
+
+    return await service.get_by_icao_codes(body.codes)
+
+
+@router.post(
+        "/iata/batch",
+        response_model=list[AirportLookupDTO],
+        status_code=200,
+)
+@inject
+async def get_airports_by_iata_codes(
+    body: AirportCodesIn,
+    service: IAirportService = Depends(Provide[Container.airport_service]),
+) -> list:
+    """An endpoint for getting airports by a list of IATA codes.
+
+    Args:
+        body (AirportCodesIn): The IATA codes of the airports.
+        service (IAirportService, optional): The injected service dependency.
+
+    Returns:
+        list: The lookups in order of the codes, without the airport
+            if not found.
+    """
+
+    return await service.get_by_iata_codes(body.codes)
+
+
+@router.post(
+        "/icao/distances",
+        response_model=DistanceMatrixDTO,
+        status_code=200,
+)
+@inject
+async def get_distance_matrix(
+    body: AirportCodesIn,
+    service: IAirportService = Depends(Provide[Container.airport_service]),
+) -> DistanceMatrixDTO:
+    """An endpoint for getting distances between airports by ICAO codes.
+
+    Args:
+        body (AirportCodesIn): The ICAO codes of the airports.
+        service (IAirportService, optional): The injected service dependency.
+
+    Returns:
+        DistanceMatrixDTO: The great-circle distances in kilometres
+            between the found airports, in order of the codes.
+    """
+
+    return await service.get_distance_matrix(body.codes)
+
+
 @router.get(
         "/icao/{icao_code}",
         response_model=AirportDTO,
@@ -208,39 +492,6 @@ async def get_airports_by_user(
     return airports
 
 
-@router.get(
-        "/location",
-        response_model=Iterable[Airport],
-        status_code=200,
-)
-@inject
-async def get_airports_by_location(
-    latitude: float,
-    longitude: float,
-    radius: float,
-    service: IAirportService = Depends(Provide[Container.airport_service]),
-) -> Iterable:
-    """An endpoint for getting airports by location.
-
-    Args:
-        latitude (float): The latitude of search center point.
-        longitude (float): The longitude of search center point.
-        radius (float): The radius of search.
-        service (IAirportService, optional): The injected service dependency.
-
-    Returns:
-        Iterable: The airport details collection.
-    """
-
-    airports = await service.get_by_location(
-        latitude=latitude,
-        longitude=longitude,
-        radius=radius,
-    )
-
-    return airports
-
-
 @router.put("/{airport_id}", response_model=Airport, status_code=201)
 @inject
 async def update_airport(
@@ -262,12 +513,11 @@ async def update_airport(
         dict: The updated airport details.
     """
 
-    if await service.get_by_id(airport_id=airport_id):
-        await service.update_airport(
-            airport_id=airport_id,
-            data=updated_airport,
-        )
-        return {**updated_airport.model_dump(), "id": airport_id}
+    if airport := await service.update_airport(
+        airport_id=airport_id,
+        data=updated_airport,
+    ):
+        return airport.model_dump()
 
     raise HTTPException(status_code=404, detail="Airport not found")
 
@@ -288,9 +538,7 @@ async def delete_airport(
         HTTPException: 404 if airport does not exist.
     """
 
-    if await service.get_by_id(airport_id=airport_id):
-        await service.delete_airport(airport_id)
-
+    if await service.delete_airport(airport_id):
         return
 
     raise HTTPException(status_code=404, detail="Airport not found")
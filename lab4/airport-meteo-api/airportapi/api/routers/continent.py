@@ -4,11 +4,13 @@ from typing import Iterable
 from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, HTTPException
 
+from airportapi.api.utils.conditional import ConditionalGet
 from airportapi.container import Container
 from airportapi.core.domain.location import Continent, ContinentIn
 from airportapi.infrastructure.services.icontinent import IContinentService
 
 router = APIRouter()
+conditional = ConditionalGet("continents")
 
 
 @router.post("/create", response_model=Continent, status_code=201)
@@ -32,7 +34,12 @@ async def create_continent(
     return new_continent.model_dump() if new_continent else {}
 
 
-@router.get("/all", response_model=Iterable[Continent], status_code=200)
+@router.get(
+        "/all",
+        response_model=Iterable[Continent],
+        status_code=200,
+        dependencies=[Depends(conditional)],
+)
 @inject
 async def get_all_continents(
     service: IContinentService = Depends(Provide[Container.continent_service]),
@@ -51,7 +58,12 @@ async def get_all_continents(
     return continents
 
 
-@router.get("/{continent_id}", response_model=Continent, status_code=200)
+@router.get(
+        "/{continent_id}",
+        response_model=Continent,
+        status_code=200,
+        dependencies=[Depends(conditional)],
+)
 @inject
 async def get_continent_by_id(
     continent_id: int,
@@ -97,13 +109,11 @@ async def update_continent(
         dict: The updated continent details.
     """
 
-    if await service.get_continent_by_id(continent_id=continent_id):
-        new_updated_continent = await service.update_continent(
-            continent_id=continent_id,
-            data=updated_continent,
-        )
-        return new_updated_continent.model_dump() if new_updated_continent \
-            else {}
+    if continent := await service.update_continent(
+        continent_id=continent_id,
+        data=updated_continent,
+    ):
+        return continent.model_dump()
 
     raise HTTPException(status_code=404, detail="Continent not found")
 
@@ -127,8 +137,7 @@ async def delete_continent(
         dict: Empty if operation finished.
     """
 
-    if await service.get_continent_by_id(continent_id=continent_id):
-        await service.delete_continent(continent_id)
+    if await service.delete_continent(continent_id):
         return
 
     raise HTTPException(status_code=404, detail="Continent not found")
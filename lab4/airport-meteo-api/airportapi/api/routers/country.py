@@ -4,11 +4,13 @@ from typing import Iterable
 from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, HTTPException
 
+from airportapi.api.utils.conditional import ConditionalGet
 from airportapi.container import Container
 from airportapi.core.domain.location import Country, CountryIn
 from airportapi.infrastructure.services.icountry import ICountryService
 
 router = APIRouter()
+conditional = ConditionalGet("countries")
 
 
 @router.post("/create", response_model=Country, status_code=201)
@@ -32,7 +34,12 @@ async def create_country(
     return new_country.model_dump() if new_country else {}
 
 
-@router.get("/all", response_model=Iterable[Country], status_code=200)
+@router.get(
+        "/all",
+        response_model=Iterable[Country],
+        status_code=200,
+        dependencies=[Depends(conditional)],
+)
 @inject
 async def get_all_countries(
     service: ICountryService = Depends(Provide[Container.country_service]),
@@ -51,7 +58,12 @@ async def get_all_countries(
     return countries
 
 
-@router.get("/{country_id}", response_model=Country, status_code=200)
+@router.get(
+        "/{country_id}",
+        response_model=Country,
+        status_code=200,
+        dependencies=[Depends(conditional)],
+)
 @inject
 async def get_country_by_id(
     country_id: int,
@@ -80,6 +92,7 @@ async def get_country_by_id(
         "/continent/{continent_id}",
         response_model=list[Country],
         status_code=200,
+        dependencies=[Depends(conditional)],
 )
 @inject
 async def get_country_by_continent(
@@ -122,12 +135,11 @@ async def update_country(
         dict: The updated country data.
     """
 
-    if await service.get_country_by_id(country_id=country_id):
-        new_updated_country = await service.update_country(
-            country_id=country_id,
-            data=updated_country,
-        )
-        return new_updated_country.model_dump() if new_updated_country else {}
+    if country := await service.update_country(
+        country_id=country_id,
+        data=updated_country,
+    ):
+        return country.model_dump()
 
     raise HTTPException(status_code=404, detail="Country not found")
 
@@ -148,9 +160,7 @@ async def delete_country(
         HTTPException: 404 if country does not exist.
     """
 
-    if await service.get_country_by_id(country_id=country_id):
-        await service.delete_country(country_id)
-
+    if await service.delete_country(country_id):
         return
 
     raise HTTPException(status_code=404, detail="Country not found")
@@ -0,0 +1,30 @@
+"""A module containing the metrics endpoint."""
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from airportapi.container import Container
+from airportapi.infrastructure.services.imetrics import IMetricsService
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+@inject
+async def get_metrics(
+    service: IMetricsService = Depends(Provide[Container.metrics_service]),
+) -> PlainTextResponse:
+    """An endpoint exposing the metrics in the Prometheus text format.
+
+    Args:
+        service (IMetricsService, optional): The injected service
+            dependency.
+
+    Returns:
+        PlainTextResponse: The metrics.
+    """
+
+    return PlainTextResponse(service.render(), media_type=CONTENT_TYPE)
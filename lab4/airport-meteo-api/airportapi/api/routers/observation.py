@@ -0,0 +1,170 @@
+"""A module containing observation endpoints."""
+
+from datetime import datetime
+from typing import AsyncIterator
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from airportapi.container import Container
+from airportapi.core.domain.observation import (
+    LatestObservation,
+    Observation,
+    ObservationStats,
+)
+from airportapi.infrastructure.services.iobservation import \
+    IObservationService
+
+router = APIRouter()
+
+
+@router.get(
+        "/icao/{icao_code}/metar/latest",
+        response_model=LatestObservation,
+        status_code=200,
+)
+@inject
+async def get_latest_observation(
+    icao_code: str,
+    service: IObservationService = Depends(
+        Provide[Container.observation_service]
+    ),
+) -> LatestObservation:
+    """An endpoint getting the current METAR of the station from memory.
+
+    Args:
+        icao_code (str): The ICAO code of the station.
+        service (IObservationService, optional): The injected service
+            dependency.
+
+    Raises:
+        HTTPException: 404 if no recent observation of the station
+            is known.
+
+    Returns:
+        LatestObservation: The decoded observation with its age.
+    """
+
+    if observation := service.get_latest(icao_code):
+        return observation
+
+    raise HTTPException(status_code=404, detail="Observation not found")
+
+
+@router.get(
+        "/icao/{icao_code}/observations/stats",
+        response_model=ObservationStats,
+        status_code=200,
+)
+@inject
+async def get_observation_stats(
+    icao_code: str,
+    start: datetime = Query(alias="from"),
+    end: datetime = Query(alias="to"),
+    service: IObservationService = Depends(
+        Provide[Container.observation_service]
+    ),
+) -> ObservationStats:
+    """An endpoint getting weather statistics of the station in the period.
+
+    Args:
+        icao_code (str): The ICAO code of the station.
+        start (datetime): The beginning of the period (inclusive).
+        end (datetime): The end of the period (exclusive).
+        service (IObservationService, optional): The injected service
+            dependency.
+
+    Raises:
+        HTTPException: 422 if the period is empty.
+
+    Returns:
+        ObservationStats: The count, min, max and mean of every metric.
+    """
+
+    if start >= end:
+        raise HTTPException(
+            status_code=422,
+            detail="The period must end after it starts",
+        )
+
+    return await service.get_stats(icao_code, start, end)
+
+
+@router.get(
+        "/icao/{icao_code}/observations",
+        response_class=StreamingResponse,
+        status_code=200,
+        responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+@inject
+async def get_observations(
+    icao_code: str,
+    start: datetime = Query(alias="from"),
+    end: datetime = Query(alias="to"),
+    after_time: datetime | None = None,
+    after_id: int | None = None,
+    limit: int | None = Query(default=None, ge=1),
+    service: IObservationService = Depends(
+        Provide[Container.observation_service]
+    ),
+) -> StreamingResponse:
+    """An endpoint streaming historical observations as NDJSON.
+
+    Every line holds one observation. To continue a limited read, pass
+    `observation_time` and `id` of the last received line as `after_time`
+    and `after_id`.
+
+    Args:
+        icao_code (str): The ICAO code of the station.
+        start (datetime): The beginning of the period (inclusive).
+        end (datetime): The end of the period (exclusive).
+        after_time (datetime | None): The time of the last received
+            observation.
+        after_id (int | None): The id of the last received observation.
+        limit (int | None): The maximal number of observations.
+        service (IObservationService, optional): The injected service
+            dependency.
+
+    Raises:
+        HTTPException: 422 if only one part of the `after` key is passed.
+
+    Returns:
+        StreamingResponse: The observations ordered by time.
+    """
+
+    if (after_time is None) != (after_id is None):
+        raise HTTPException(
+            status_code=422,
+            detail="Both after_time and after_id are required",
+        )
+
+    observations = service.get_history(
+        icao_code=icao_code,
+        start=start,
+        end=end,
+        after=(after_time, after_id)
+        if after_time and after_id is not None else None,
+        limit=limit,
+    )
+
+    return StreamingResponse(
+        _encode_lines(observations),
+        media_type="application/x-ndjson",
+    )
+
+
+async def _encode_lines(
+    observations: AsyncIterator[Observation],
+) -> AsyncIterator[bytes]:
+    """A private function encoding observations as NDJSON lines.
+
+    Args:
+        observations (AsyncIterator[Observation]): The observations.
+
+    Yields:
+        bytes: The encoded line.
+    """
+
+    async for observation in observations:
+        yield observation.model_dump_json().encode() + b"\n"
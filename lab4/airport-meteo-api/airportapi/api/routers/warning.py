@@ -0,0 +1,41 @@
+"""A module containing weather warning endpoints."""
+
+from datetime import datetime
+from typing import Iterable
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, Query
+
+from airportapi.container import Container
+from airportapi.core.domain.warning import WeatherWarning
+from airportapi.infrastructure.services.iwarning import IWarningService
+
+router = APIRouter()
+
+
+@router.get(
+        "/icao/{icao_code}/warnings",
+        response_model=Iterable[WeatherWarning],
+        status_code=200,
+)
+@inject
+async def get_warnings(
+    icao_code: str,
+    start: datetime = Query(alias="from"),
+    end: datetime = Query(alias="to"),
+    service: IWarningService = Depends(Provide[Container.warning_service]),
+) -> Iterable:
+    """An endpoint getting archived warnings of the station in the period.
+
+    Args:
+        icao_code (str): The ICAO code of the station.
+        start (datetime): The beginning of the period (inclusive).
+        end (datetime): The end of the period (exclusive).
+        service (IWarningService, optional): The injected service
+            dependency.
+
+    Returns:
+        Iterable: The warnings ordered by time.
+    """
+
+    return await service.get_by_icao(icao_code, start, end)
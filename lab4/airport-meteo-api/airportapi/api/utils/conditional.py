@@ -0,0 +1,94 @@
+"""A module containing the dependency of conditional GET endpoints."""
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import Depends, HTTPException, Request, Response
+
+from airportapi.config import config
+from airportapi.container import Container
+from airportapi.infrastructure.repositories.versions import TableVersions
+
+
+class ConditionalGet:
+    """A dependency answering conditional requests of reference data.
+
+    The entity tag is built from the in-memory versions of the tables,
+    so a matching `If-None-Match` is answered with 304 before the
+    endpoint reads the database. Other responses get the tag and
+    the `Cache-Control` header, which the endpoint passes on if it
+    builds its response by itself.
+    """
+
+    tables: tuple[str, ...]
+    max_age: int
+
+    def __init__(self, *tables: str, max_age: int | None = None) -> None:
+        """The initializer of the `conditional get` dependency.
+
+        Args:
+            *tables (str): The names of the tables the response is read
+                from.
+            max_age (int | None, optional): The time in seconds caches may
+                reuse the response without revalidation.
+                Defaults to None, which means `HTTP_CACHE_MAX_AGE`.
+        """
+
+        self.tables = tables
+        self.max_age = (
+            config.HTTP_CACHE_MAX_AGE if max_age is None else max_age
+        )
+
+    @inject
+    async def __call__(
+        self,
+        request: Request,
+        response: Response,
+        versions: TableVersions = Depends(Provide[Container.table_versions]),
+    ) -> dict[str, str]:
+        """The method checking the request against the current version.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            response (Response): The response the headers are set on.
+            versions (TableVersions, optional): The injected versions
+                of the tables.
+
+        Raises:
+            HTTPException: 304 if the client has the current version.
+
+        Returns:
+            dict[str, str]: The caching headers of the response.
+        """
+
+        headers = {
+            "ETag": versions.etag(*self.tables),
+            "Cache-Control": f"public, max-age={self.max_age}",
+        }
+
+        if _matches(request.headers.get("if-none-match"), headers["ETag"]):
+            raise HTTPException(status_code=304, headers=headers)
+
+        response.headers.update(headers)
+
+        return headers
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    """A private function comparing the tags sent by the client.
+
+    Tags are compared weakly, as required for `If-None-Match`.
+
+    Args:
+        if_none_match (str | None): The value of the header.
+        etag (str): The current tag.
+
+    Returns:
+        bool: True if any of the tags is the current one.
+    """
+
+    if not if_none_match:
+        return False
+
+    return any(
+        tag == "*" or tag.removeprefix("W/") == etag
+        for tag in (tag.strip() for tag in if_none_match.split(","))
+    )
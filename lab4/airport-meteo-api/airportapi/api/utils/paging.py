@@ -0,0 +1,62 @@
+"""A module containing helpers of keyset paginated endpoints."""
+
+from fastapi import HTTPException
+
+from airportapi.core.domain.page import PageRequest
+from airportapi.utils.cursor import decode_cursor
+
+SORT_KEYS = ("name", "icao_code")
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+
+def page_request(
+    limit: int | None,
+    sort: str | None,
+    cursor: str | None,
+) -> PageRequest | None:
+    """Function preparing the page request from the query parameters.
+
+    The cursor keeps the sort order of the first page, so only the limit
+    may change between pages.
+
+    Args:
+        limit (int | None): The maximal number of items of the page.
+        sort (str | None): The sort key, descending if prefixed with `-`.
+        cursor (str | None): The cursor returned with the previous page.
+
+    Raises:
+        HTTPException: 400 if the sort key or the cursor is invalid.
+
+    Returns:
+        PageRequest | None: The page request, None if no parameter
+            is passed and the results are not paginated.
+    """
+
+    if limit is None and sort is None and cursor is None:
+        return None
+
+    limit = limit or DEFAULT_LIMIT
+
+    if cursor is not None:
+        try:
+            page = decode_cursor(cursor, limit)
+        except ValueError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+    else:
+        sort = sort or SORT_KEYS[0]
+        page = PageRequest(
+            sort=sort.removeprefix("-"),
+            descending=sort.startswith("-"),
+            limit=limit,
+        )
+
+    if page.sort not in SORT_KEYS or (
+        page.after is not None and not isinstance(page.after[0], str)
+    ):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Sort key must be one of: {', '.join(SORT_KEYS)}",
+        )
+
+    return page
@@ -0,0 +1,62 @@
+"""A module containing helpers of streamed responses."""
+
+from typing import AsyncIterator, Mapping
+
+from fastapi.responses import StreamingResponse
+
+
+async def json_array(
+    documents: AsyncIterator[bytes],
+    chunk_size: int = 500,
+) -> AsyncIterator[bytes]:
+    """Function joining encoded JSON documents into a streamed JSON array.
+
+    Documents are sent in chunks, so the response is not written
+    with a separate send per document.
+
+    Args:
+        documents (AsyncIterator[bytes]): The encoded JSON documents.
+        chunk_size (int, optional): The number of documents in a chunk.
+            Defaults to 500.
+
+    Yields:
+        bytes: The next part of the array.
+    """
+
+    chunk = [b"["]
+    count = 0
+
+    async for document in documents:
+        if count:
+            chunk.append(b",")
+        chunk.append(document)
+        count += 1
+
+        if count % chunk_size == 0:
+            yield b"".join(chunk)
+            chunk = []
+
+    chunk.append(b"]")
+    yield b"".join(chunk)
+
+
+def json_array_response(
+    documents: AsyncIterator[bytes],
+    headers: Mapping[str, str] | None = None,
+) -> StreamingResponse:
+    """Function preparing the streamed JSON array response.
+
+    Args:
+        documents (AsyncIterator[bytes]): The encoded JSON documents.
+        headers (Mapping[str, str] | None, optional): The additional
+            headers of the response. Defaults to None.
+
+    Returns:
+        StreamingResponse: The response.
+    """
+
+    return StreamingResponse(
+        json_array(documents),
+        media_type="application/json",
+        headers=headers,
+    )
@@ -0,0 +1 @@
+"""Package containing command line tools of the app."""
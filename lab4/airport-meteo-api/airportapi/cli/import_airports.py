@@ -0,0 +1,76 @@
+"""A command importing airports from a CSV document.
+
+Run from the project directory with `DB_FORCE_ROLLBACK=false`, since
+otherwise the import is rolled back on exit:
+
+    python -m airportapi.cli.import_airports airports.csv
+
+The document may use the columns of the OurAirports dataset. Running
+instances of the app are notified of the import, so they reload their
+cached airports and spatial index.
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator
+
+from airportapi.config import config
+from airportapi.container import Container
+from airportapi.db import database, init_db
+
+CHUNK_SIZE = 64 * 1024
+
+
+async def read_chunks(path: Path) -> AsyncIterator[bytes]:
+    """Function reading the file in chunks.
+
+    Args:
+        path (Path): The path of the file.
+
+    Yields:
+        bytes: The next chunk of the file.
+    """
+
+    with path.open("rb") as file:
+        while chunk := file.read(CHUNK_SIZE):
+            yield chunk
+
+
+async def main(path: Path) -> None:
+    """Function importing the airports and printing the report.
+
+    Args:
+        path (Path): The path of the CSV document.
+    """
+
+    if config.DB_FORCE_ROLLBACK:
+        print(
+            "DB_FORCE_ROLLBACK is enabled, "
+            "the import will be rolled back on exit."
+        )
+
+    await init_db()
+    await database.connect()
+
+    try:
+        service = Container().airport_import_service()
+        report = await service.import_csv(read_chunks(path))
+    finally:
+        await database.disconnect()
+
+    for error in report.errors:
+        print(f"line {error.line} ({error.icao_code}): {error.message}")
+
+    print(
+        f"{report.rows} rows, {report.imported} imported, "
+        f"{report.failed} failed"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.path))
@@ -0,0 +1,24 @@
+"""A command applying pending DB migrations.
+
+Run from the project directory, e.g. before starting the app workers
+with `DB_MIGRATE_ON_STARTUP=false`:
+
+    python -m airportapi.cli.migrate
+"""
+
+import argparse
+import asyncio
+
+from airportapi.db import init_db
+
+
+async def main() -> None:
+    """Function applying the migrations."""
+
+    await init_db()
+
+
+if __name__ == "__main__":
+    argparse.ArgumentParser(description=__doc__.splitlines()[0]).parse_args()
+
+    asyncio.run(main())
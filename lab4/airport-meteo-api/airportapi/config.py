@@ -3,6 +3,8 @@
 from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from airportapi.utils.consts import METAR_ENDPOINT
+
 
 class BaseConfig(BaseSettings):
     """A class containing base settings configuration."""
@@ -15,6 +17,39 @@ class AppConfig(BaseConfig):
     DB_NAME: Optional[str] = None
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
+    DB_FORCE_ROLLBACK: bool = True
+    DB_POOL_MIN_SIZE: int = 2
+    DB_POOL_MAX_SIZE: int = 10
+    DB_POOL_ACQUIRE_TIMEOUT: Optional[float] = 10.0
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_REPLICA_HOST: Optional[str] = None
+    DB_QUERY_STATS_ENABLED: bool = False
+    DB_SLOW_QUERY_THRESHOLD: Optional[float] = 0.5
+    DB_MIGRATE_ON_STARTUP: bool = True
+    SPATIAL_INDEX_ENABLED: bool = True
+    AIRPORT_CACHE_SIZE: int = 10000
+    AIRPORT_CACHE_TTL: float = 3600.0
+    AIRPORT_IMPORT_CHUNK_SIZE: int = 1000
+    CACHE_INVALIDATION_ENABLED: bool = True
+    CACHE_INVALIDATION_CHANNEL: str = "airportapi_invalidation"
+    HTTP_CACHE_MAX_AGE: int = 300
+    METRICS_DIR: Optional[str] = None
+    METRICS_SNAPSHOT_INTERVAL: float = 5.0
+    METAR_ENABLED: bool = True
+    METAR_ENDPOINT: str = METAR_ENDPOINT
+    METAR_POLL_INTERVAL: float = 300.0
+    METAR_STOP_TIMEOUT: float = 5.0
+    METAR_LEADER_LOCK_KEY: Optional[int] = 7_277_001
+    METAR_CONCURRENCY: int = 16
+    METAR_RATE_LIMIT: float = 50.0
+    METAR_TIMEOUT: float = 10.0
+    METAR_DECODE_WORKERS: Optional[int] = None
+    METAR_DECODE_CHUNK_SIZE: int = 256
+    METAR_LATEST_WINDOW: float = 86400.0
+    WARNING_GUST_KT: Optional[float] = 35.0
+    WARNING_VISIBILITY_M: Optional[float] = 1500.0
+    WARNING_CEILING_FT: Optional[float] = 500.0
+    WARNING_FREEZING_ENABLED: bool = True
 
 
 config = AppConfig()
@@ -1,24 +1,192 @@
 """Module providing containers injecting dependencies."""
 
+import os
+
+import httpx
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Factory, Singleton
+from dependency_injector.providers import (
+    Callable,
+    Dict,
+    Factory,
+    List,
+    Object,
+    Singleton,
+)
 
+from airportapi.config import config
+from airportapi.db import database, replica
+from airportapi.infrastructure.ingestion.fetcher import MetarFetcher
+from airportapi.infrastructure.ingestion.leader import LeaderLock
+from airportapi.infrastructure.ingestion.pool import DecodePool
+from airportapi.infrastructure.ingestion.rules import RuleEngine, default_rules
+from airportapi.infrastructure.ingestion.scheduler import MetarScheduler
+from airportapi.infrastructure.repositories.airportcache import \
+    CachedAirportRepository
 from airportapi.infrastructure.repositories.airportdb import \
     AirportRepository
 from airportapi.infrastructure.repositories.continentdb import \
     ContinentRepository
 from airportapi.infrastructure.repositories.countrydb import \
     CountryMockRepository
+from airportapi.infrastructure.repositories.invalidation import (
+    InvalidationListener,
+    InvalidationPublisher,
+)
+from airportapi.infrastructure.repositories.observationcache import \
+    LatestObservations
+from airportapi.infrastructure.repositories.observationdb import \
+    ObservationRepository
+from airportapi.infrastructure.repositories.reference import ReferenceData
+from airportapi.infrastructure.repositories.versions import TableVersions
+from airportapi.infrastructure.repositories.warningdb import \
+    WarningRepository
 from airportapi.infrastructure.services.airport import AirportService
+from airportapi.infrastructure.services.airportimport import \
+    AirportImportService
 from airportapi.infrastructure.services.continent import ContinentService
 from airportapi.infrastructure.services.country import CountryService
+from airportapi.infrastructure.services.metrics import MetricsService
+from airportapi.infrastructure.services.observation import \
+    ObservationService
+from airportapi.infrastructure.services.warning import WarningService
+from airportapi.utils.cache import TTLCache
+from airportapi.utils.metrics import (
+    MetricsDirectory,
+    MetricsSnapshots,
+    RequestMetrics,
+)
+from airportapi.utils.spatial import SpatialIndex
 
 
 class Container(DeclarativeContainer):
     """Container class for dependency injecting purposes."""
-    continent_repository = Singleton(ContinentRepository)
-    country_repository = Singleton(CountryMockRepository)
-    airport_repository = Singleton(AirportRepository)
+    airport_cache = Singleton(
+        TTLCache,
+        max_size=config.AIRPORT_CACHE_SIZE,
+        ttl=config.AIRPORT_CACHE_TTL,
+    )
+    reference_data = Singleton(
+        ReferenceData,
+        listeners=List(airport_cache.provided.clear),
+    )
+    table_versions = Singleton(TableVersions)
+    latest_observations = Singleton(
+        LatestObservations,
+        window=config.METAR_LATEST_WINDOW,
+    )
+    invalidation_publisher = Singleton(
+        InvalidationPublisher,
+        channel=config.CACHE_INVALIDATION_CHANNEL,
+        enabled=config.CACHE_INVALIDATION_ENABLED,
+        listeners=List(table_versions.provided.load),
+    )
+    continent_repository = Singleton(
+        ContinentRepository,
+        reference=reference_data,
+        publisher=invalidation_publisher,
+    )
+    country_repository = Singleton(
+        CountryMockRepository,
+        reference=reference_data,
+        publisher=invalidation_publisher,
+    )
+    airport_index = Singleton(SpatialIndex)
+    airport_db_repository = Singleton(
+        AirportRepository,
+        index=airport_index,
+        reference=reference_data,
+        publisher=invalidation_publisher,
+    )
+    airport_repository = Singleton(
+        CachedAirportRepository,
+        repository=airport_db_repository,
+        cache=airport_cache,
+    )
+    invalidation_listener = Singleton(
+        InvalidationListener,
+        database=Object(database),
+        channel=config.CACHE_INVALIDATION_CHANNEL,
+        handlers=Dict(
+            airport=List(
+                airport_repository.provided.invalidate,
+                airport_db_repository.provided.refresh_index,
+                table_versions.provided.invalidate,
+            ),
+            continent=List(
+                reference_data.provided.invalidate,
+                table_versions.provided.invalidate,
+            ),
+            country=List(
+                reference_data.provided.invalidate,
+                table_versions.provided.invalidate,
+            ),
+            observation=List(latest_observations.provided.invalidate),
+        ),
+    )
+    observation_repository = Singleton(
+        ObservationRepository,
+        publisher=invalidation_publisher,
+    )
+    warning_repository = Singleton(WarningRepository)
+
+    warning_engine = Singleton(
+        RuleEngine,
+        rules=Callable(
+            default_rules,
+            gust=config.WARNING_GUST_KT,
+            visibility=config.WARNING_VISIBILITY_M,
+            ceiling=config.WARNING_CEILING_FT,
+            freezing=config.WARNING_FREEZING_ENABLED,
+        ),
+    )
+    warning_service = Factory(
+        WarningService,
+        repository=warning_repository,
+        engine=warning_engine,
+    )
+    metar_decoder = Singleton(
+        DecodePool,
+        workers=config.METAR_DECODE_WORKERS,
+        chunk_size=config.METAR_DECODE_CHUNK_SIZE,
+    )
+    observation_service = Factory(
+        ObservationService,
+        repository=observation_repository,
+        warning_service=warning_service,
+        decoder=metar_decoder,
+        latest=latest_observations,
+    )
+
+    metar_client = Singleton(
+        httpx.AsyncClient,
+        timeout=config.METAR_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=config.METAR_CONCURRENCY,
+            max_keepalive_connections=config.METAR_CONCURRENCY,
+        ),
+    )
+    metar_fetcher = Singleton(
+        MetarFetcher,
+        client=metar_client,
+        endpoint=config.METAR_ENDPOINT,
+        concurrency=config.METAR_CONCURRENCY,
+        rate_limit=config.METAR_RATE_LIMIT,
+    )
+    metar_leader_lock = Singleton(
+        LeaderLock,
+        database=Object(database),
+        key=config.METAR_LEADER_LOCK_KEY,
+    )
+    metar_scheduler = Singleton(
+        MetarScheduler,
+        repository=airport_repository,
+        fetcher=metar_fetcher,
+        interval=config.METAR_POLL_INTERVAL,
+        handler=observation_service.provided.ingest,
+        stop_timeout=config.METAR_STOP_TIMEOUT,
+        lock=metar_leader_lock
+        if config.METAR_LEADER_LOCK_KEY is not None else None,
+    )
 
     continent_service = Factory(
         ContinentService,
@@ -32,3 +200,37 @@ class Container(DeclarativeContainer):
         AirportService,
         repository=airport_repository,
     )
+    airport_import_service = Factory(
+        AirportImportService,
+        airport_repository=airport_repository,
+        country_repository=country_repository,
+        chunk_size=config.AIRPORT_IMPORT_CHUNK_SIZE,
+    )
+
+    request_metrics = Singleton(RequestMetrics)
+    metrics_worker = Callable(str, Callable(os.getpid))
+    metrics_directory = Singleton(
+        MetricsDirectory,
+        path=config.METRICS_DIR,
+        max_age=config.METRICS_SNAPSHOT_INTERVAL * 6,
+    )
+    metrics_service = Factory(
+        MetricsService,
+        requests=request_metrics,
+        databases=Object(
+            {"primary": database}
+            if replica is database
+            else {"primary": database, "replica": replica}
+        ),
+        caches=Dict(airport=airport_cache),
+        scheduler=metar_scheduler if config.METAR_ENABLED else None,
+        directory=metrics_directory if config.METRICS_DIR else None,
+        worker=metrics_worker,
+    )
+    metrics_snapshots = Singleton(
+        MetricsSnapshots,
+        directory=metrics_directory,
+        render=metrics_service.provided.render_worker,
+        worker=metrics_worker,
+        interval=config.METRICS_SNAPSHOT_INTERVAL,
+    )
@@ -1,8 +1,10 @@
 """Module containing airport-related domain models"""
 
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from airportapi.utils.geo import parse_coordinate
 
 
 class AirportIn(BaseModel):
@@ -11,17 +13,55 @@ class AirportIn(BaseModel):
     icao_code: str
     iata_code: str
     country_id: int
-    latitude: str
-    longitude: str
+    latitude: float = Field(ge=-90, le=90)
+    longitude: float = Field(ge=-180, le=180)
     elevation: int
     vor_freq: Optional[str] = None
     dme_freq: Optional[str] = None
     ils_loc_freq: Optional[str] = None
     ils_gs_freq: Optional[str] = None
 
+    @field_validator("latitude", "longitude", mode="before")
+    @classmethod
+    def parse_coordinate(cls, value: Any) -> Any:
+        """A validator accepting coordinates written in DMS notation.
+
+        Args:
+            value (Any): The raw coordinate value.
+
+        Returns:
+            Any: The coordinate in decimal degrees if parsable.
+        """
+
+        if isinstance(value, str) and \
+                (coordinate := parse_coordinate(value)) is not None:
+            return coordinate
+
+        return value
+
 
 class Airport(AirportIn):
     """Model representing airport's attributes in the database."""
     id: int
 
     model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class AirportCodesIn(BaseModel):
+    """Model representing codes of airports looked up at once."""
+    codes: list[str] = Field(min_length=1, max_length=500)
+
+
+class AirportImportError(BaseModel):
+    """Model representing a rejected row of the airport import."""
+    line: int
+    icao_code: Optional[str] = None
+    message: str
+
+
+class AirportImportReport(BaseModel):
+    """Model representing the outcome of the airport import."""
+    rows: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: list[AirportImportError] = []
@@ -0,0 +1,64 @@
+"""Module containing observation-related domain models."""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RawMetar(BaseModel):
+    """Model representing a METAR report fetched from the data source."""
+    icao_code: str
+    observation_time: datetime
+    raw: str
+
+
+class ObservationIn(BaseModel):
+    """Model representing a decoded METAR observation."""
+    icao_code: str
+    observation_time: datetime
+    raw: str
+    temperature: Optional[float] = None
+    dewpoint: Optional[float] = None
+    wind_direction: Optional[int] = None
+    wind_speed: Optional[float] = None
+    wind_gust: Optional[float] = None
+    visibility: Optional[float] = None
+    pressure: Optional[float] = None
+    ceiling: Optional[int] = None
+    weather: Optional[str] = None
+    flight_category: Optional[str] = None
+
+
+class Observation(ObservationIn):
+    """Model representing observation's attributes in the database."""
+    id: int
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class LatestObservation(ObservationIn):
+    """Model representing the latest observation of a station."""
+    age_seconds: float
+
+
+class MetricStats(BaseModel):
+    """Model representing statistics of a single metric in a period."""
+    count: int = 0
+    min: Optional[float] = None
+    max: Optional[float] = None
+    mean: Optional[float] = None
+
+
+class ObservationStats(BaseModel):
+    """Model representing weather statistics of a station in a period."""
+    icao_code: str
+    start: datetime
+    end: datetime
+    observations: int = 0
+    temperature: MetricStats = MetricStats()
+    dewpoint: MetricStats = MetricStats()
+    wind_speed: MetricStats = MetricStats()
+    wind_gust: MetricStats = MetricStats()
+    visibility: MetricStats = MetricStats()
+    pressure: MetricStats = MetricStats()
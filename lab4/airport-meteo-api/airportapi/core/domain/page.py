@@ -0,0 +1,21 @@
+"""Module containing pagination-related domain models."""
+
+from typing import Any, Generic, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class PageRequest(BaseModel):
+    """Model representing a request of a keyset page."""
+    sort: str = "name"
+    descending: bool = False
+    limit: int = Field(ge=1)
+    after: Optional[tuple[Any, int]] = None
+
+
+class Page(BaseModel, Generic[T]):
+    """Model representing a page of results with the cursor of the next."""
+    items: list[T]
+    next: Optional[str] = None
@@ -0,0 +1,23 @@
+"""Module containing weather warning domain models."""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class WeatherWarningIn(BaseModel):
+    """Model representing a weather warning triggered by an observation."""
+    icao_code: str
+    observation_time: datetime
+    rule: str
+    value: Optional[float] = None
+    threshold: Optional[float] = None
+    detail: Optional[str] = None
+
+
+class WeatherWarning(WeatherWarningIn):
+    """Model representing warning's attributes in the database."""
+    id: int
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
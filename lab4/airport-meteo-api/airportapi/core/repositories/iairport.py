@@ -1,39 +1,79 @@
 """Module containing airport repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 from airportapi.core.domain.airport import AirportIn
+from airportapi.core.domain.page import PageRequest
 
 
 class IAirportRepository(ABC):
     """An abstract class representing protocol of continent repository."""
 
     @abstractmethod
-    async def get_all_airports(self) -> Iterable[Any]:
+    async def get_all_airports(
+        self,
+        page: PageRequest | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting all airports from the data storage.
 
+        Args:
+            page (PageRequest | None, optional): The requested keyset
+                page. Defaults to None, which means all airports ordered
+                by name.
+
         Returns:
             Iterable[Any]: Airports in the data storage.
         """
 
     @abstractmethod
-    async def get_by_country(self, country_id: int) -> Iterable[Any]:
+    def iterate_all_airports(self) -> AsyncIterator[bytes]:
+        """The abstract iterating all airports encoded as JSON.
+
+        Returns:
+            AsyncIterator[bytes]: The JSON documents of the airports
+                ordered by name.
+        """
+
+    @abstractmethod
+    async def get_icao_codes(self) -> Iterable[str]:
+        """The abstract getting ICAO codes of all airports.
+
+        Returns:
+            Iterable[str]: The ICAO codes.
+        """
+
+    @abstractmethod
+    async def get_by_country(
+        self,
+        country_id: int,
+        page: PageRequest | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting airports assigned to particular country.
 
         Args:
             country_id (int): The id of the country.
+            page (PageRequest | None, optional): The requested keyset
+                page. Defaults to None, which means all airports ordered
+                by name.
 
         Returns:
             Iterable[Any]: Airports assigned to a country.
         """
 
     @abstractmethod
-    async def get_by_continent(self, continent_id: int) -> Iterable[Any]:
+    async def get_by_continent(
+        self,
+        continent_id: int,
+        page: PageRequest | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting airports assigned to particular continent.
 
         Args:
             continent_id (int): The id of the continent.
+            page (PageRequest | None, optional): The requested keyset
+                page. Defaults to None, which means all airports ordered
+                by name.
 
         Returns:
             Iterable[Any]: Airports assigned to a continent.
@@ -72,6 +112,34 @@ class IAirportRepository(ABC):
             Any | None: The airport details.
         """
 
+    @abstractmethod
+    async def get_by_icao_codes(
+        self,
+        icao_codes: Sequence[str],
+    ) -> dict[str, Any]:
+        """The abstract getting airports by provided ICAO codes.
+
+        Args:
+            icao_codes (Sequence[str]): The ICAO codes of the airports.
+
+        Returns:
+            dict[str, Any]: The airport details by the found codes.
+        """
+
+    @abstractmethod
+    async def get_by_iata_codes(
+        self,
+        iata_codes: Sequence[str],
+    ) -> dict[str, Any]:
+        """The abstract getting airports by provided IATA codes.
+
+        Args:
+            iata_codes (Sequence[str]): The IATA codes of the airports.
+
+        Returns:
+            dict[str, Any]: The airport details by the found codes.
+        """
+
     @abstractmethod
     async def get_by_user(self, user_id: int) -> Iterable[Any]:
         """The abstract getting airports by user who added them.
@@ -101,6 +169,44 @@ class IAirportRepository(ABC):
             Iterable[Any]: The result airport collection.
         """
 
+    @abstractmethod
+    async def get_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        count: int,
+    ) -> Iterable[Any]:
+        """The abstract getting airports closest to the provided location.
+
+        Args:
+            latitude (float): The geographical latitude.
+            longitude (float): The geographical longitude.
+            count (int): The number of airports to find.
+
+        Returns:
+            Iterable[Any]: The result airport collection.
+        """
+
+    @abstractmethod
+    async def get_along_route(
+        self,
+        start: tuple[float, float],
+        end: tuple[float, float],
+        width: float,
+    ) -> Iterable[Any]:
+        """The abstract getting airports close to the great-circle route.
+
+        Args:
+            start (tuple[float, float]): The latitude and longitude
+                of the start.
+            end (tuple[float, float]): The latitude and longitude
+                of the end.
+            width (float): The maximal distance from the route.
+
+        Returns:
+            Iterable[Any]: The airports with their distances.
+        """
+
     @abstractmethod
     async def add_airport(self, data: AirportIn) -> Any | None:
         """The abstract adding new airport to the data storage.
@@ -112,6 +218,22 @@ class IAirportRepository(ABC):
             Any | None: The newly added airport.
         """
 
+    @abstractmethod
+    async def upsert_airports(self, airports: Sequence[AirportIn]) -> int:
+        """The abstract adding or replacing airports by their ICAO codes.
+
+        Args:
+            airports (Sequence[AirportIn]): The airports with unique
+                ICAO codes.
+
+        Raises:
+            ValueError: If any of the airports is rejected by the data
+                storage.
+
+        Returns:
+            int: The number of added or updated airports.
+        """
+
     @abstractmethod
     async def update_airport(
         self,
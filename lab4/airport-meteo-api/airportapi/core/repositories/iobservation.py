@@ -0,0 +1,72 @@
+"""Module containing observation repository abstractions."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable
+
+from airportapi.core.domain.observation import ObservationIn
+
+
+class IObservationRepository(ABC):
+    """An abstract class representing protocol of observation repository."""
+
+    @abstractmethod
+    async def add_observations(
+        self,
+        observations: Iterable[ObservationIn],
+    ) -> int:
+        """The abstract adding a batch of observations to the data storage.
+
+        Observations already stored for the same station and time
+        are skipped.
+
+        Args:
+            observations (Iterable[ObservationIn]): The observations.
+
+        Returns:
+            int: The number of newly stored observations.
+        """
+
+    @abstractmethod
+    def iterate_by_icao(
+        self,
+        icao_code: str,
+        start: datetime,
+        end: datetime,
+        after: tuple[datetime, int] | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[Any]:
+        """The abstract iterating observations of the station in the period.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+            start (datetime): The beginning of the period (inclusive).
+            end (datetime): The end of the period (exclusive).
+            after (tuple[datetime, int] | None, optional): The observation
+                time and id of the last already received observation.
+                Defaults to None.
+            limit (int | None, optional): The maximal number
+                of observations. Defaults to None.
+
+        Returns:
+            AsyncIterator[Any]: The observations ordered by time.
+        """
+
+    @abstractmethod
+    async def get_stats(
+        self,
+        icao_code: str,
+        start: datetime,
+        end: datetime,
+    ) -> Any | None:
+        """The abstract aggregating observations of the station in the period.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+            start (datetime): The beginning of the period (inclusive).
+            end (datetime): The end of the period (exclusive).
+
+        Returns:
+            Any | None: The observation count, and count, sum, min and max
+                of every metric.
+        """
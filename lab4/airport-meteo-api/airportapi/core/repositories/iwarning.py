@@ -0,0 +1,43 @@
+"""Module containing warning repository abstractions."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Iterable
+
+from airportapi.core.domain.warning import WeatherWarningIn
+
+
+class IWarningRepository(ABC):
+    """An abstract class representing protocol of warning repository."""
+
+    @abstractmethod
+    async def add_warnings(self, warnings: Iterable[WeatherWarningIn]) -> int:
+        """The abstract adding a batch of warnings to the data storage.
+
+        Warnings already stored for the same observation and rule
+        are skipped.
+
+        Args:
+            warnings (Iterable[WeatherWarningIn]): The warnings.
+
+        Returns:
+            int: The number of newly stored warnings.
+        """
+
+    @abstractmethod
+    async def get_by_icao(
+        self,
+        icao_code: str,
+        start: datetime,
+        end: datetime,
+    ) -> Iterable[Any]:
+        """The abstract getting warnings of the station in the period.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+            start (datetime): The beginning of the period (inclusive).
+            end (datetime): The end of the period (exclusive).
+
+        Returns:
+            Iterable[Any]: The warnings ordered by time.
+        """
@@ -1,17 +1,22 @@
 """A module providing database access."""
 
 import asyncio
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Iterable
 
-import databases
 import sqlalchemy
 from sqlalchemy.exc import OperationalError, DatabaseError
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
 from asyncpg.exceptions import (    # type: ignore
     CannotConnectNowError,
     ConnectionDoesNotExistError,
 )
 
 from airportapi.config import config
+from airportapi.utils.geo import parse_coordinate
+from airportapi.utils.pool import PooledDatabase
+from airportapi.utils.querystats import QueryStats
 
 metadata = sqlalchemy.MetaData()
 
@@ -34,6 +39,7 @@ country_table = sqlalchemy.Table(
         sqlalchemy.ForeignKey("continents.id"),
         nullable=False,
     ),
+    sqlalchemy.Index("ix_countries_continent_id", "continent_id"),
 )
 
 airport_table = sqlalchemy.Table(
@@ -48,15 +54,173 @@ airport_table = sqlalchemy.Table(
         sqlalchemy.ForeignKey("countries.id"),
         nullable=False,
     ),
-    sqlalchemy.Column("latitude", sqlalchemy.String),
-    sqlalchemy.Column("longitude", sqlalchemy.String),
+    sqlalchemy.Column("latitude", sqlalchemy.Float),
+    sqlalchemy.Column("longitude", sqlalchemy.Float),
     sqlalchemy.Column("elevation", sqlalchemy.Integer),
     sqlalchemy.Column("vor_freq", sqlalchemy.String, nullable=True),
     sqlalchemy.Column("dme_freq", sqlalchemy.String, nullable=True),
     sqlalchemy.Column("ils_loc_freq", sqlalchemy.String, nullable=True),
     sqlalchemy.Column("ils_gs_freq", sqlalchemy.String, nullable=True),
+    sqlalchemy.Index(
+        "ix_airports_latitude_longitude",
+        "latitude",
+        "longitude",
+    ),
+    sqlalchemy.Index("ux_airports_icao_code", "icao_code", unique=True),
+    sqlalchemy.Index(
+        "ux_airports_iata_code",
+        "iata_code",
+        unique=True,
+        postgresql_where=sqlalchemy.text("iata_code <> ''"),
+    ),
+    sqlalchemy.Index("ix_airports_iata_code", "iata_code"),
+    sqlalchemy.Index("ix_airports_name_id", "name", "id"),
+    sqlalchemy.Index("ix_airports_icao_code_id", "icao_code", "id"),
+    sqlalchemy.Index(
+        "ix_airports_country_id_name_id",
+        "country_id",
+        "name",
+        "id",
+    ),
+    sqlalchemy.Index(
+        "ix_airports_country_id_icao_code_id",
+        "country_id",
+        "icao_code",
+        "id",
+    ),
+)
+
+observation_table = sqlalchemy.Table(
+    "observations",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.BigInteger, sqlalchemy.Identity()),
+    sqlalchemy.Column("icao_code", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column(
+        "observation_time",
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+    ),
+    sqlalchemy.Column("raw", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column("temperature", sqlalchemy.Float, nullable=True),
+    sqlalchemy.Column("dewpoint", sqlalchemy.Float, nullable=True),
+    sqlalchemy.Column("wind_direction", sqlalchemy.Integer, nullable=True),
+    sqlalchemy.Column("wind_speed", sqlalchemy.Float, nullable=True),
+    sqlalchemy.Column("wind_gust", sqlalchemy.Float, nullable=True),
+    sqlalchemy.Column("visibility", sqlalchemy.Float, nullable=True),
+    sqlalchemy.Column("pressure", sqlalchemy.Float, nullable=True),
+    sqlalchemy.Column("ceiling", sqlalchemy.Integer, nullable=True),
+    sqlalchemy.Column("weather", sqlalchemy.String, nullable=True),
+    sqlalchemy.Column("flight_category", sqlalchemy.String, nullable=True),
+    sqlalchemy.PrimaryKeyConstraint("id", "observation_time"),
+    sqlalchemy.UniqueConstraint(
+        "icao_code",
+        "observation_time",
+        name="uq_observations_icao_code_observation_time",
+    ),
+    postgresql_partition_by="RANGE (observation_time)",
+)
+
+ROLLUP_METRICS = (
+    "temperature",
+    "dewpoint",
+    "wind_speed",
+    "wind_gust",
+    "visibility",
+    "pressure",
+)
+
+
+def _rollup_table(name: str) -> sqlalchemy.Table:
+    """A private function defining the observation rollup table.
+
+    Every row aggregates observations of the station within one bucket,
+    keeping count, sum, min and max of every metric, so rows can be merged.
+
+    Args:
+        name (str): The name of the table.
+
+    Returns:
+        sqlalchemy.Table: The table definition.
+    """
+
+    return sqlalchemy.Table(
+        name,
+        metadata,
+        sqlalchemy.Column("icao_code", sqlalchemy.String, nullable=False),
+        sqlalchemy.Column(
+            "bucket",
+            sqlalchemy.DateTime(timezone=True),
+            nullable=False,
+        ),
+        sqlalchemy.Column("observations", sqlalchemy.Integer, nullable=False),
+        *(
+            column
+            for metric in ROLLUP_METRICS
+            for column in (
+                sqlalchemy.Column(
+                    f"{metric}_count",
+                    sqlalchemy.Integer,
+                    nullable=False,
+                ),
+                sqlalchemy.Column(
+                    f"{metric}_sum",
+                    sqlalchemy.Float,
+                    nullable=False,
+                ),
+                sqlalchemy.Column(f"{metric}_min", sqlalchemy.Float),
+                sqlalchemy.Column(f"{metric}_max", sqlalchemy.Float),
+            )
+        ),
+        sqlalchemy.PrimaryKeyConstraint("icao_code", "bucket"),
+    )
+
+
+hourly_rollup_table = _rollup_table("observation_rollups_hourly")
+daily_rollup_table = _rollup_table("observation_rollups_daily")
+
+warning_table = sqlalchemy.Table(
+    "warnings",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.BigInteger, primary_key=True),
+    sqlalchemy.Column("icao_code", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column(
+        "observation_time",
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+    ),
+    sqlalchemy.Column("rule", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column("value", sqlalchemy.Float, nullable=True),
+    sqlalchemy.Column("threshold", sqlalchemy.Float, nullable=True),
+    sqlalchemy.Column("detail", sqlalchemy.String, nullable=True),
+    sqlalchemy.UniqueConstraint(
+        "icao_code",
+        "observation_time",
+        "rule",
+        name="uq_warnings_icao_code_observation_time_rule",
+    ),
 )
 
+schema_migration_table = sqlalchemy.Table(
+    "schema_migrations",
+    metadata,
+    sqlalchemy.Column("version", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("name", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column(
+        "applied_at",
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+        server_default=sqlalchemy.func.now(),
+    ),
+)
+
+table_version_table = sqlalchemy.Table(
+    "table_versions",
+    metadata,
+    sqlalchemy.Column("table_name", sqlalchemy.String, primary_key=True),
+    sqlalchemy.Column("version", sqlalchemy.BigInteger, nullable=False),
+)
+VERSIONED_TABLES = (continent_table, country_table, airport_table)
+
 db_uri = (
     f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
     f"@{config.DB_HOST}/{config.DB_NAME}"
@@ -64,19 +228,148 @@ db_uri = (
 
 engine = create_async_engine(
     db_uri,
-    echo=True,
     future=True,
     pool_pre_ping=True,
 )
 
-database = databases.Database(
+pool_options: dict[str, Any] = {
+    "min_size": config.DB_POOL_MIN_SIZE,
+    "max_size": config.DB_POOL_MAX_SIZE,
+    "acquire_timeout": config.DB_POOL_ACQUIRE_TIMEOUT,
+    "statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+}
+
+
+def create_query_stats() -> QueryStats | None:
+    """Function creating the statement statistics if enabled.
+
+    Returns:
+        QueryStats | None: The statistics, None if disabled.
+    """
+
+    if not config.DB_QUERY_STATS_ENABLED:
+        return None
+
+    return QueryStats(slow_threshold=config.DB_SLOW_QUERY_THRESHOLD)
+
+
+database = PooledDatabase(
     db_uri,
-    force_rollback=True,
+    force_rollback=config.DB_FORCE_ROLLBACK,
+    query_stats=create_query_stats(),
+    **pool_options,
 )
 
+# Uncached reads go to the replica if configured. Replication lags, so
+# lookups that are cached or follow writes stay on the primary database.
+replica = database if not config.DB_REPLICA_HOST else PooledDatabase(
+    f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
+    f"@{config.DB_REPLICA_HOST}/{config.DB_NAME}",
+    query_stats=create_query_stats(),
+    **pool_options,
+)
+
+
+def observation_months(times: Iterable[datetime]) -> set[date]:
+    """Function listing monthly observation partitions covering the times.
+
+    Args:
+        times (Iterable[datetime]): The observation times, naive ones
+            are treated as UTC.
+
+    Returns:
+        set[date]: The first days of the months in UTC.
+    """
+
+    return {
+        (time.astimezone(timezone.utc) if time.tzinfo else time)
+        .date()
+        .replace(day=1)
+        for time in times
+    }
+
+
+def observation_partition_ddl(month: date) -> str:
+    """Function preparing DDL of the monthly observation partition.
+
+    Args:
+        month (date): The first day of the month.
+
+    Returns:
+        str: The idempotent `CREATE TABLE ... PARTITION OF` statement.
+    """
+
+    next_month = (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+    return (
+        f"CREATE TABLE IF NOT EXISTS "
+        f"{observation_table.name}_y{month.year}m{month.month:02d} "
+        f"PARTITION OF {observation_table.name} "
+        f"FOR VALUES FROM ('{month.isoformat()} 00:00+00') "
+        f"TO ('{next_month.isoformat()} 00:00+00')"
+    )
+
+
+def rollup_upsert_sql(
+    table: sqlalchemy.Table,
+    unit: str,
+    source: str,
+) -> str:
+    """Function preparing the statement merging observations into rollups.
+
+    Args:
+        table (sqlalchemy.Table): The hourly or daily rollup table.
+        unit (str): The `date_trunc` unit of the bucket, `hour` or `day`.
+        source (str): The table or CTE holding the new observations.
+
+    Returns:
+        str: The `INSERT ... ON CONFLICT DO UPDATE` statement.
+    """
+
+    columns = ["observations"]
+    aggregates = ["count(*)"]
+    merges = ["observations = rollup.observations + EXCLUDED.observations"]
+
+    for metric in ROLLUP_METRICS:
+        columns += [
+            f"{metric}_count",
+            f"{metric}_sum",
+            f"{metric}_min",
+            f"{metric}_max",
+        ]
+        aggregates += [
+            f"count({metric})",
+            f"coalesce(sum({metric}), 0)",
+            f"min({metric})",
+            f"max({metric})",
+        ]
+        merges += [
+            f"{metric}_count = "
+            f"rollup.{metric}_count + EXCLUDED.{metric}_count",
+            f"{metric}_sum = rollup.{metric}_sum + EXCLUDED.{metric}_sum",
+            f"{metric}_min = "
+            f"LEAST(rollup.{metric}_min, EXCLUDED.{metric}_min)",
+            f"{metric}_max = "
+            f"GREATEST(rollup.{metric}_max, EXCLUDED.{metric}_max)",
+        ]
+
+    return (
+        f"INSERT INTO {table.name} AS rollup "
+        f"(icao_code, bucket, {', '.join(columns)}) "
+        f"SELECT icao_code, date_trunc('{unit}', "
+        f"observation_time AT TIME ZONE 'UTC') AT TIME ZONE 'UTC', "
+        f"{', '.join(aggregates)} "
+        f"FROM {source} GROUP BY 1, 2 "
+        f"ON CONFLICT (icao_code, bucket) DO UPDATE SET {', '.join(merges)}"
+    )
+
+
+class MigrationError(Exception):
+    """An exception raised when a migration cannot be applied."""
+
 
 async def init_db(retries: int = 5, delay: int = 5) -> None:
-    """Function initializing the DB.
+    """Function initializing the DB and applying pending migrations.
 
     Args:
         retries (int, optional): Number of retries of connect to DB.
@@ -86,7 +379,7 @@ async def init_db(retries: int = 5, delay: int = 5) -> None:
     for attempt in range(retries):
         try:
             async with engine.begin() as conn:
-                await conn.run_sync(metadata.create_all)
+                await migrate(conn)
             return
         except (
             OperationalError,
@@ -98,3 +391,325 @@ async def init_db(retries: int = 5, delay: int = 5) -> None:
             await asyncio.sleep(delay)
 
     raise ConnectionError("Could not connect to DB after several retries.")
+
+
+async def migrate_coordinates(conn: AsyncConnection) -> None:
+    """Function converting textual airport coordinates to numeric columns.
+
+    The existing values are parsed with `parse_coordinate`, so both decimal
+    and DMS notations are backfilled.
+
+    Args:
+        conn (AsyncConnection): The connection with an open transaction.
+
+    Raises:
+        MigrationError: If the stored airports have unparsable or out
+            of range coordinates, which have to be corrected first.
+    """
+
+    data_type = await conn.scalar(sqlalchemy.text(
+        "SELECT data_type FROM information_schema.columns "
+        "WHERE table_name = 'airports' AND column_name = 'latitude'"
+    ))
+
+    if data_type not in ("character varying", "text"):
+        return
+
+    rows = [
+        (airport_id, parse_coordinate(latitude), parse_coordinate(longitude))
+        for airport_id, latitude, longitude in (await conn.execute(
+            sqlalchemy.text("SELECT id, latitude, longitude FROM airports")
+        )).all()
+    ]
+    invalid = [
+        airport_id
+        for airport_id, latitude, longitude in rows
+        if latitude is None or longitude is None
+        or not -90 <= latitude <= 90 or not -180 <= longitude <= 180
+    ]
+
+    if invalid:
+        raise MigrationError(
+            "Invalid coordinates of airports with ids: "
+            f"{', '.join(map(str, invalid))}"
+        )
+
+    await conn.execute(sqlalchemy.text(
+        "ALTER TABLE airports "
+        "ADD COLUMN latitude_deg double precision, "
+        "ADD COLUMN longitude_deg double precision"
+    ))
+
+    if rows:
+        await conn.execute(
+            sqlalchemy.text(
+                "UPDATE airports "
+                "SET latitude_deg = :latitude, longitude_deg = :longitude "
+                "WHERE id = :id"
+            ),
+            [
+                {
+                    "id": airport_id,
+                    "latitude": latitude,
+                    "longitude": longitude,
+                }
+                for airport_id, latitude, longitude in rows
+            ],
+        )
+
+    for statement in (
+        "ALTER TABLE airports DROP COLUMN latitude, DROP COLUMN longitude",
+        "ALTER TABLE airports RENAME COLUMN latitude_deg TO latitude",
+        "ALTER TABLE airports RENAME COLUMN longitude_deg TO longitude",
+        "CREATE INDEX IF NOT EXISTS ix_airports_latitude_longitude "
+        "ON airports (latitude, longitude)",
+    ):
+        await conn.execute(sqlalchemy.text(statement))
+
+
+async def migrate_airport_codes(conn: AsyncConnection) -> None:
+    """Function adding unique indexes of airport ICAO and IATA codes.
+
+    Empty IATA codes, used by airports without one, are not unique.
+    The plain index of IATA codes serves lookups whose plans cannot prove
+    the code is not empty, like `= ANY($1)` with a long list.
+
+    Args:
+        conn (AsyncConnection): The connection with an open transaction.
+
+    Raises:
+        MigrationError: If the stored airports have duplicated codes,
+            which have to be resolved first.
+    """
+
+    for column, condition in (
+        ("icao_code", "TRUE"),
+        ("iata_code", "iata_code <> ''"),
+    ):
+        duplicates = (await conn.execute(sqlalchemy.text(
+            f"SELECT {column} FROM airports WHERE {condition} "
+            f"GROUP BY {column} HAVING count(*) > 1"
+        ))).scalars().all()
+
+        if duplicates:
+            raise MigrationError(
+                f"Duplicated airport {column} values: "
+                f"{', '.join(map(str, duplicates))}"
+            )
+
+    await _create_indexes(conn, airport_table, (
+        "ux_airports_icao_code",
+        "ux_airports_iata_code",
+        "ix_airports_iata_code",
+    ))
+
+
+async def migrate_airport_indexes(conn: AsyncConnection) -> None:
+    """Function adding indexes of keyset pages of airports.
+
+    Args:
+        conn (AsyncConnection): The connection with an open transaction.
+    """
+
+    await _create_indexes(conn, airport_table, (
+        "ix_airports_name_id",
+        "ix_airports_icao_code_id",
+        "ix_airports_country_id_name_id",
+        "ix_airports_country_id_icao_code_id",
+    ))
+
+
+async def migrate_foreign_key_indexes(conn: AsyncConnection) -> None:
+    """Function adding indexes of foreign keys.
+
+    `airports.country_id` is the prefix of the keyset page indexes, so
+    only `countries.continent_id` needs its own one.
+
+    Args:
+        conn (AsyncConnection): The connection with an open transaction.
+    """
+
+    await _create_indexes(conn, country_table, ("ix_countries_continent_id",))
+
+
+async def migrate_observations(conn: AsyncConnection) -> None:
+    """Function moving plain observations table to monthly partitions.
+
+    Args:
+        conn (AsyncConnection): The connection with an open transaction.
+    """
+
+    kind = await conn.scalar(sqlalchemy.text(
+        "SELECT relkind::text FROM pg_class "
+        "WHERE oid = to_regclass('observations')"
+    ))
+
+    if kind != "r":
+        return
+
+    for statement in (
+        "ALTER TABLE observations RENAME TO observations_legacy",
+        "ALTER TABLE observations_legacy "
+        "RENAME CONSTRAINT observations_pkey TO observations_legacy_pkey",
+        "ALTER TABLE observations_legacy "
+        "RENAME CONSTRAINT uq_observations_icao_code_observation_time "
+        "TO uq_observations_legacy_icao_code_observation_time",
+    ):
+        await conn.execute(sqlalchemy.text(statement))
+
+    await conn.run_sync(observation_table.create)
+
+    times = (await conn.execute(sqlalchemy.text(
+        "SELECT DISTINCT "
+        "date_trunc('month', observation_time AT TIME ZONE 'UTC') "
+        "FROM observations_legacy"
+    ))).scalars()
+
+    for month in observation_months(times):
+        await conn.execute(sqlalchemy.text(observation_partition_ddl(month)))
+
+    columns = ", ".join(column.name for column in observation_table.columns)
+
+    for statement in (
+        f"INSERT INTO observations ({columns}) "
+        f"SELECT {columns} FROM observations_legacy",
+        "SELECT setval(pg_get_serial_sequence('observations', 'id'), "
+        "coalesce(max(id), 0) + 1, false) FROM observations",
+        "DROP TABLE observations_legacy",
+    ):
+        await conn.execute(sqlalchemy.text(statement))
+
+
+async def migrate_rollups(conn: AsyncConnection) -> None:
+    """Function backfilling empty rollup tables from stored observations.
+
+    Args:
+        conn (AsyncConnection): The connection with an open transaction.
+    """
+
+    for table, unit in (
+        (hourly_rollup_table, "hour"),
+        (daily_rollup_table, "day"),
+    ):
+        if await conn.scalar(sqlalchemy.select(
+            sqlalchemy.exists().select_from(table)
+        )):
+            continue
+
+        await conn.execute(sqlalchemy.text(
+            rollup_upsert_sql(table, unit, observation_table.name)
+        ))
+
+
+async def migrate_table_versions(conn: AsyncConnection) -> None:
+    """Function adding triggers counting writes of the reference tables.
+
+    The counter is bumped once per statement, so a bulk upsert makes
+    a single new version. Rows of the counters serialize concurrent
+    writes of the same table, which are rare.
+
+    Args:
+        conn (AsyncConnection): The connection with an open transaction.
+    """
+
+    await conn.execute(sqlalchemy.text(
+        "CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger "
+        "LANGUAGE plpgsql AS $$ BEGIN "
+        f"INSERT INTO {table_version_table.name} AS versions "
+        "(table_name, version) VALUES (TG_TABLE_NAME, 1) "
+        "ON CONFLICT (table_name) DO UPDATE "
+        "SET version = versions.version + 1; "
+        "RETURN NULL; END $$"
+    ))
+
+    for table in VERSIONED_TABLES:
+        await conn.execute(
+            sqlalchemy.text(
+                f"INSERT INTO {table_version_table.name} "
+                "(table_name, version) VALUES (:name, 1) "
+                "ON CONFLICT DO NOTHING"
+            ),
+            {"name": table.name},
+        )
+        await conn.execute(sqlalchemy.text(
+            f"CREATE OR REPLACE TRIGGER {table.name}_version "
+            "AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE "
+            f"ON {table.name} FOR EACH STATEMENT "
+            "EXECUTE FUNCTION bump_table_version()"
+        ))
+
+
+MIGRATIONS: tuple[
+    tuple[int, str, Callable[[AsyncConnection], Awaitable[None]]],
+    ...,
+] = (
+    (1, "numeric airport coordinates", migrate_coordinates),
+    (2, "unique airport codes", migrate_airport_codes),
+    (3, "airport keyset indexes", migrate_airport_indexes),
+    (4, "foreign key indexes", migrate_foreign_key_indexes),
+    (5, "partitioned observations", migrate_observations),
+    (6, "observation rollups", migrate_rollups),
+    (7, "table versions", migrate_table_versions),
+)
+MIGRATION_LOCK_KEY = 7_261_637_105
+
+
+async def migrate(conn: AsyncConnection) -> list[int]:
+    """Function creating missing tables and applying pending migrations.
+
+    The work is done under a transaction-level advisory lock, so workers
+    starting at once apply every migration only once and the others see
+    it recorded. A failed migration rolls back the whole transaction.
+
+    Args:
+        conn (AsyncConnection): The connection with an open transaction.
+
+    Returns:
+        list[int]: The versions of the applied migrations.
+    """
+
+    await conn.execute(
+        sqlalchemy.text("SELECT pg_advisory_xact_lock(:key)"),
+        {"key": MIGRATION_LOCK_KEY},
+    )
+    await conn.run_sync(metadata.create_all)
+
+    applied = set((await conn.execute(
+        sqlalchemy.select(schema_migration_table.c.version)
+    )).scalars())
+    versions = []
+
+    for version, name, apply in MIGRATIONS:
+        if version in applied:
+            continue
+
+        await apply(conn)
+        await conn.execute(
+            schema_migration_table.insert().values(version=version, name=name)
+        )
+        print(f"Applied migration {version}: {name}")
+        versions.append(version)
+
+    return versions
+
+
+async def _create_indexes(
+    conn: AsyncConnection,
+    table: sqlalchemy.Table,
+    names: Iterable[str],
+) -> None:
+    """A private function creating the named indexes of the table if missing.
+
+    `create_all` skips indexes of already existing tables, so indexes
+    added to the table definition later are created by migrations.
+
+    Args:
+        conn (AsyncConnection): The connection with an open transaction.
+        table (sqlalchemy.Table): The table.
+        names (Iterable[str]): The names of the indexes.
+    """
+
+    indexes = {str(index.name): index for index in table.indexes}
+
+    for name in names:
+        await conn.execute(CreateIndex(indexes[name], if_not_exists=True))
@@ -1,11 +1,12 @@
 """A module containing DTO models for output airports."""
 
 
-from typing import Optional
-from asyncpg import Record  # type: ignore
+from typing import Any, Callable, Optional, Sequence
+
+import orjson
 from pydantic import BaseModel, ConfigDict
 
-from airportapi.core.domain.location import Continent
+from airportapi.core.domain.airport import Airport
 from airportapi.infrastructure.dto.countrydto import CountryDTO
 
 
@@ -16,8 +17,8 @@ class AirportDTO(BaseModel):
     icao_code: str
     iata_code: str
     country: CountryDTO
-    latitude: str
-    longitude: str
+    latitude: float
+    longitude: float
     elevation: int
     vor_freq: Optional[str] = None
     dme_freq: Optional[str] = None
@@ -31,37 +32,139 @@ class AirportDTO(BaseModel):
     )
 
     @classmethod
-    def from_record(cls, record: Record) -> "AirportDTO":
-        """A method for preparing DTO instance based on DB record.
+    def converter(
+        cls,
+        columns: Sequence[str],
+        country: Callable[[int], Any],
+    ) -> Callable[[Sequence[Any]], "AirportDTO"]:
+        """A method preparing a fast converter of airport rows.
+
+        Positions of the fields are looked up once, so converting a row
+        is plain index access. The rows are trusted DB data, hence
+        the models are built with `model_construct`, without validation.
+        The country is not built per row, but taken by id from the lookup.
+
+        Args:
+            columns (Sequence[str]): The labels of the selected columns,
+                including `country_id`.
+            country (Callable[[int], Any]): The lookup of the country DTO
+                by its id.
+
+        Returns:
+            Callable[[Sequence[Any]], AirportDTO]: The converter
+                of a positional row.
+        """
+
+        return cls._row_builder(
+            columns,
+            lambda values: cls.model_construct(**values),
+            country,
+        )
+
+    @classmethod
+    def encoder(
+        cls,
+        columns: Sequence[str],
+        country: Callable[[int], Any],
+    ) -> Callable[[Sequence[Any]], bytes]:
+        """A method preparing a JSON encoder of airport rows.
+
+        The row is encoded straight into the JSON of the DTO, without
+        building any model.
+
+        Args:
+            columns (Sequence[str]): The labels of the selected columns,
+                including `country_id`.
+            country (Callable[[int], Any]): The lookup of the country
+                dictionary by its id.
+
+        Returns:
+            Callable[[Sequence[Any]], bytes]: The encoder
+                of a positional row.
+        """
+
+        build = cls._row_builder(columns, dict, country)
+
+        return lambda row: orjson.dumps(build(row))
+
+    @classmethod
+    def _row_builder(
+        cls,
+        columns: Sequence[str],
+        construct: Callable[[dict[str, Any]], Any],
+        country: Callable[[int], Any],
+    ) -> Callable[[Sequence[Any]], Any]:
+        """A private method preparing a builder of the DTO values.
 
         Args:
-            record (Record): The DB record.
+            columns (Sequence[str]): The labels of the selected columns.
+            construct (Callable[[dict[str, Any]], Any]): The constructor
+                of the airport from its field values.
+            country (Callable[[int], Any]): The lookup of the country
+                by its id.
 
         Returns:
-            AirportDTO: The final DTO instance.
+            Callable[[Sequence[Any]], Any]: The builder of a positional row.
         """
-        record_dict = dict(record)
-
-        return cls(
-            id=record_dict.get("id"),  # type: ignore
-            name=record_dict.get("name"),  # type: ignore
-            icao_code=record_dict.get("icao_code"),  # type: ignore
-            iata_code=record_dict.get("iata_code"),  # type: ignore
-            country=CountryDTO(
-                id=record_dict.get("id_1"),
-                name=record_dict.get("name_1"),
-                alias=record_dict.get("alias"),
-                continent=Continent(
-                    id=record_dict.get("id_2"),  # type: ignore
-                    name=record_dict.get("name_2"),  # type: ignore
-                    alias=record_dict.get("alias_1"),  # type: ignore
-                ),
-            ),
-            latitude=record_dict.get("latitude"),  # type: ignore
-            longitude=record_dict.get("longitude"),  # type: ignore
-            elevation=record_dict.get("elevation"),  # type: ignore
-            vor_freq=record_dict.get("vor_freq"),
-            dme_freq=record_dict.get("dme_freq"),
-            ils_loc_freq=record_dict.get("ils_loc_freq"),
-            ils_gs_freq=record_dict.get("ils_gs_freq"),
+
+        airport = _positions(cls, columns, {"country": None})
+        country_index = columns.index("country_id")
+
+        def build(row: Sequence[Any]) -> Any:
+            nested = country(row[country_index])
+
+            return construct({
+                field: nested if index is None else row[index]
+                for field, index in airport
+            })
+
+        return build
+
+
+class AirportLookupDTO(BaseModel):
+    """A model representing DTO for result of airport lookup by code."""
+    code: str
+    airport: Optional[AirportDTO] = None
+
+
+class AirportRouteDTO(BaseModel):
+    """A model representing DTO for airport found along the route."""
+    airport: Airport
+    cross_track: float
+    along_track: float
+
+
+class DistanceMatrixDTO(BaseModel):
+    """A model representing DTO for distances between airports."""
+    codes: list[str]
+    missing: list[str] = []
+    distances: list[list[float]]
+
+
+def _positions(
+    model: type[BaseModel],
+    columns: Sequence[str],
+    labels: dict[str, str | None],
+) -> list[tuple[str, int | None]]:
+    """A private function finding row positions of the model fields.
+
+    Args:
+        model (type[BaseModel]): The model class.
+        columns (Sequence[str]): The labels of the selected columns.
+        labels (dict[str, str | None]): The labels of fields named
+            differently than columns, None for the nested model.
+
+    Returns:
+        list[tuple[str, int | None]]: The fields in the model order with
+            their positions, None for the nested model.
+    """
+
+    positions = []
+
+    for field in model.model_fields:
+        label = labels.get(field, field)
+        positions.append(
+            (field, None if label is None else columns.index(label))
         )
+
+    return positions
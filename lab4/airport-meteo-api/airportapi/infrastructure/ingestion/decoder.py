@@ -0,0 +1,175 @@
+"""Module containing the METAR decoder."""
+
+import logging
+import warnings
+from datetime import datetime
+from typing import Iterable
+
+from metar.Metar import Metar, ParserError  # type: ignore
+
+from airportapi.core.domain.observation import ObservationIn, RawMetar
+
+logger = logging.getLogger(__name__)
+
+CEILING_COVERS = ("BKN", "OVC", "VV")
+FIELDS = tuple(ObservationIn.model_fields)
+
+RawRow = tuple[str, datetime, str]
+DecodedRow = tuple
+
+warnings.filterwarnings("ignore", category=RuntimeWarning, module="metar")
+
+
+def decode_report(report: RawMetar) -> ObservationIn | None:
+    """Function decoding the raw METAR report.
+
+    Args:
+        report (RawMetar): The raw report.
+
+    Returns:
+        ObservationIn | None: The decoded observation if parsable.
+    """
+
+    row = decode_row((report.icao_code, report.observation_time, report.raw))
+
+    return to_observation(row) if row else None
+
+
+def decode_batch(rows: Iterable[RawRow]) -> list[DecodedRow]:
+    """Function decoding a batch of raw reports in a worker process.
+
+    Both arguments and results are plain tuples, which are much cheaper
+    to pickle between processes than models.
+
+    Args:
+        rows (Iterable[RawRow]): The ICAO code, observation time and raw
+            report of every report.
+
+    Returns:
+        list[DecodedRow]: The values of `FIELDS` of parsable reports.
+    """
+
+    return [decoded for row in rows if (decoded := decode_row(row))]
+
+
+def decode_row(row: RawRow) -> DecodedRow | None:
+    """Function decoding a single raw report into the tuple of `FIELDS`.
+
+    Args:
+        row (RawRow): The ICAO code, observation time and raw report.
+
+    Returns:
+        DecodedRow | None: The decoded values if parsable.
+    """
+
+    icao_code, observation_time, raw = row
+
+    try:
+        metar = Metar(
+            raw,
+            month=observation_time.month,
+            year=observation_time.year,
+            strict=False,
+        )
+    except ParserError as e:
+        logger.debug("Decoding METAR of %s failed: %s", icao_code, e)
+        return None
+
+    visibility = metar.vis.value("M") if metar.vis else None
+    ceiling = _ceiling(metar)
+
+    return (
+        icao_code,
+        observation_time,
+        raw,
+        metar.temp.value("C") if metar.temp else None,
+        metar.dewpt.value("C") if metar.dewpt else None,
+        int(metar.wind_dir.value()) if metar.wind_dir else None,
+        metar.wind_speed.value("KT") if metar.wind_speed else None,
+        metar.wind_gust.value("KT") if metar.wind_gust else None,
+        visibility,
+        metar.press.value("HPA") if metar.press else None,
+        ceiling,
+        _weather(metar),
+        flight_category(visibility, ceiling),
+    )
+
+
+def to_observation(row: DecodedRow) -> ObservationIn:
+    """Function turning the decoded tuple into the observation model.
+
+    Args:
+        row (DecodedRow): The values of `FIELDS`.
+
+    Returns:
+        ObservationIn: The observation.
+    """
+
+    return ObservationIn.model_construct(**dict(zip(FIELDS, row)))
+
+
+def flight_category(
+    visibility: float | None,
+    ceiling: int | None,
+) -> str | None:
+    """Function classifying the observation by the FAA flight category.
+
+    Args:
+        visibility (float | None): The visibility in metres.
+        ceiling (int | None): The ceiling in feet, None if there is none.
+
+    Returns:
+        str | None: One of `LIFR`, `IFR`, `MVFR` or `VFR`.
+    """
+
+    if visibility is None:
+        return None
+
+    miles = visibility / 1609.344
+    height = ceiling if ceiling is not None else float("inf")
+
+    if height < 500 or miles < 1:
+        return "LIFR"
+    if height < 1000 or miles < 3:
+        return "IFR"
+    if height <= 3000 or miles <= 5:
+        return "MVFR"
+
+    return "VFR"
+
+
+def _ceiling(metar: Metar) -> int | None:
+    """A private function finding the lowest broken or overcast layer.
+
+    Args:
+        metar (Metar): The decoded report.
+
+    Returns:
+        int | None: The height of the ceiling in feet.
+    """
+
+    heights = [
+        height.value("FT")
+        for cover, height, _ in metar.sky
+        if cover in CEILING_COVERS and height is not None
+    ]
+
+    return int(min(heights)) if heights else None
+
+
+def _weather(metar: Metar) -> str | None:
+    """A private function rebuilding present weather codes of the report.
+
+    Args:
+        metar (Metar): The decoded report.
+
+    Returns:
+        str | None: The weather codes, e.g. `-FZRA BR`.
+    """
+
+    codes = [
+        "".join(part for part in group if part)
+        for group in metar.weather
+    ]
+
+    return " ".join(code for code in codes if code) or None
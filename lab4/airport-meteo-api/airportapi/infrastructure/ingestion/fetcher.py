@@ -0,0 +1,247 @@
+"""Module containing the METAR fetcher of the NOAA station files."""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Iterable
+from urllib.parse import urlsplit
+
+import httpx
+
+from airportapi.core.domain.observation import RawMetar
+from airportapi.utils.consts import METAR_ENDPOINT
+
+logger = logging.getLogger(__name__)
+
+
+class HostRateLimiter:
+    """A class spacing out requests sent to the same host."""
+
+    _interval: float
+    _next_slot: dict[str, float]
+
+    def __init__(self, rate: float) -> None:
+        """The initializer of the `host rate limiter`.
+
+        Args:
+            rate (float): The maximal number of requests per second per host.
+                Non-positive value disables the limit.
+        """
+
+        self._interval = 1 / rate if rate > 0 else 0.0
+        self._next_slot = {}
+
+    async def wait(self, host: str) -> None:
+        """The method waiting for the next free slot of the host.
+
+        Args:
+            host (str): The name of the host.
+        """
+
+        if not self._interval:
+            return
+
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self._interval
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class FetchResult:
+    """A class representing the outcome of fetching many stations."""
+
+    reports: list[RawMetar]
+    validators: dict[str, dict[str, str]]
+    not_modified: int
+    failed: int
+
+    def __init__(self) -> None:
+        """The initializer of the `fetch result`."""
+
+        self.reports = []
+        self.validators = {}
+        self.not_modified = 0
+        self.failed = 0
+
+
+class MetarFetcher:
+    """A class fetching current METAR reports of the stations.
+
+    The validators returned by the server are remembered per station and
+    sent back as `If-None-Match`/`If-Modified-Since`, so stations without
+    a new report cost a single `304 Not Modified` response. They are
+    remembered only once the reports are stored, so a report lost
+    on the way is fetched again by the next cycle.
+    """
+
+    _client: httpx.AsyncClient
+    _endpoint: str
+    _semaphore: asyncio.Semaphore
+    _limiter: HostRateLimiter
+    _validators: dict[str, dict[str, str]]
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str = METAR_ENDPOINT,
+        concurrency: int = 16,
+        rate_limit: float = 0.0,
+    ) -> None:
+        """The initializer of the `METAR fetcher`.
+
+        Args:
+            client (httpx.AsyncClient): The shared keep-alive HTTP client.
+            endpoint (str, optional): The URL template with `{icao}`
+                placeholder. Defaults to METAR_ENDPOINT.
+            concurrency (int, optional): The maximal number of requests
+                in flight. Defaults to 16.
+            rate_limit (float, optional): The maximal number of requests
+                per second per host. Defaults to 0.0 (unlimited).
+        """
+
+        self._client = client
+        self._endpoint = endpoint
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._limiter = HostRateLimiter(rate_limit)
+        self._validators = {}
+
+    async def fetch_many(self, icao_codes: Iterable[str]) -> FetchResult:
+        """The method fetching reports of many stations concurrently.
+
+        Args:
+            icao_codes (Iterable[str]): The ICAO codes of the stations.
+
+        Returns:
+            FetchResult: The new reports with their validators and
+                the request counters.
+        """
+
+        result = FetchResult()
+        await asyncio.gather(
+            *(self._fetch_into(icao_code, result) for icao_code in icao_codes)
+        )
+
+        return result
+
+    def remember(self, result: FetchResult) -> None:
+        """The method storing the validators of the fetched reports.
+
+        Args:
+            result (FetchResult): The result whose reports were stored.
+        """
+
+        self._validators.update(result.validators)
+
+    async def fetch(
+        self,
+        icao_code: str,
+    ) -> tuple[RawMetar, dict[str, str]] | None:
+        """The method fetching the current report of the station.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+
+        Raises:
+            httpx.HTTPError: If the request failed.
+            ValueError: If the station file has unexpected format.
+
+        Returns:
+            tuple[RawMetar, dict[str, str]] | None: The report with
+                the validators of the response unless it has not changed.
+        """
+
+        url = self._endpoint.format(icao=icao_code)
+        headers = self._validators.get(icao_code, {})
+
+        async with self._semaphore:
+            await self._limiter.wait(urlsplit(url).netloc)
+            response = await self._client.get(url, headers=headers)
+
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return None
+
+        response.raise_for_status()
+
+        return (
+            parse_station_file(icao_code, response.text),
+            _validators(response),
+        )
+
+    async def _fetch_into(self, icao_code: str, result: FetchResult) -> None:
+        """A private method fetching a report and recording the outcome.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+            result (FetchResult): The result of the whole batch.
+        """
+
+        try:
+            fetched = await self.fetch(icao_code)
+        except (httpx.HTTPError, ValueError) as e:
+            logger.debug("Fetching METAR of %s failed: %s", icao_code, e)
+            result.failed += 1
+            return
+
+        if fetched:
+            result.reports.append(fetched[0])
+            result.validators[icao_code] = fetched[1]
+        else:
+            result.not_modified += 1
+
+
+def _validators(response: httpx.Response) -> dict[str, str]:
+    """A private function reading cache validators of the response.
+
+    Args:
+        response (httpx.Response): The response of the server.
+
+    Returns:
+        dict[str, str]: The conditional request headers to send next.
+    """
+
+    validators = {}
+
+    if etag := response.headers.get("ETag"):
+        validators["If-None-Match"] = etag
+    if last_modified := response.headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = last_modified
+
+    return validators
+
+
+def parse_station_file(icao_code: str, content: str) -> RawMetar:
+    """Function parsing the NOAA station file.
+
+    The file consists of the observation time in `YYYY/MM/DD HH:MM` format
+    followed by the raw report, e.g.::
+
+        2024/11/05 12:30
+        EPWA 051230Z 24008KT 9999 FEW030 08/04 Q1021 NOSIG
+
+    Args:
+        icao_code (str): The ICAO code of the station.
+        content (str): The content of the file.
+
+    Raises:
+        ValueError: If the file has unexpected format.
+
+    Returns:
+        RawMetar: The parsed report.
+    """
+
+    lines = [line.strip() for line in content.splitlines() if line.strip()]
+
+    if len(lines) < 2:
+        raise ValueError(f"Unexpected station file of {icao_code}")
+
+    observation_time = datetime \
+        .strptime(lines[0], "%Y/%m/%d %H:%M") \
+        .replace(tzinfo=timezone.utc)
+
+    return RawMetar(
+        icao_code=icao_code,
+        observation_time=observation_time,
+        raw=" ".join(lines[1:]),
+    )
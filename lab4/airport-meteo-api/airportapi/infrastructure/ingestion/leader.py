@@ -0,0 +1,137 @@
+"""Module containing the election of the single polling process."""
+
+import contextlib
+import logging
+from typing import Any
+
+import asyncpg  # type: ignore
+
+from airportapi.utils.pool import PooledDatabase
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderLock:
+    """A class holding a session-level advisory lock of the database.
+
+    The lock is taken with `pg_try_advisory_lock` on a dedicated
+    connection outside of the pool, so it is held as long as the
+    connection lives. If the holding process dies, the server drops the
+    connection with the lock and another process takes it over on its
+    next attempt.
+    """
+
+    _database: PooledDatabase
+    _key: int
+    _timeout: float
+    _connection: Any | None
+
+    def __init__(
+        self,
+        database: PooledDatabase,
+        key: int,
+        timeout: float = 5.0,
+    ) -> None:
+        """The initializer of the `leader lock`.
+
+        Args:
+            database (PooledDatabase): The database holding the lock.
+            key (int): The 64-bit key of the advisory lock.
+            timeout (float, optional): The time in seconds the checks
+                of the connection may take. Defaults to 5.0.
+        """
+
+        self._database = database
+        self._key = key
+        self._timeout = timeout
+        self._connection = None
+
+    @property
+    def held(self) -> bool:
+        """The property telling if the lock was taken by this process.
+
+        Returns:
+            bool: True if the lock is held.
+        """
+
+        return self._connection is not None
+
+    async def acquire(self) -> bool:
+        """The method taking the lock or checking it is still held.
+
+        Connection errors are logged and reported as not holding
+        the lock, so the caller retries later.
+
+        Returns:
+            bool: True if this process holds the lock.
+        """
+
+        try:
+            if self._connection is not None:
+                await self._connection.execute(
+                    "SELECT 1",
+                    timeout=self._timeout,
+                )
+
+                return True
+
+            connection = await self._connect()
+
+            try:
+                locked = await connection.fetchval(
+                    "SELECT pg_try_advisory_lock($1)",
+                    self._key,
+                    timeout=self._timeout,
+                )
+            except BaseException:
+                await self._close(connection)
+                raise
+
+            if not locked:
+                await self._close(connection)
+                return False
+
+            self._connection = connection
+
+            return True
+        except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) \
+                as error:
+            logger.warning("Leader lock failed: %s", error)
+            await self.release()
+
+            return False
+
+    async def release(self) -> None:
+        """The method releasing the lock by closing its connection."""
+
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await self._close(connection)
+
+    async def _close(self, connection: Any) -> None:
+        """A private method closing the connection and its session locks.
+
+        Args:
+            connection (Any): The asyncpg connection.
+        """
+
+        with contextlib.suppress(Exception):
+            await connection.close(timeout=self._timeout)
+
+    async def _connect(self) -> Any:
+        """A private method opening the connection holding the lock.
+
+        Returns:
+            Any: The asyncpg connection.
+        """
+
+        url = self._database.url
+
+        return await asyncpg.connect(
+            host=url.hostname,
+            port=url.port,
+            user=url.username,
+            password=url.password,
+            database=url.database,
+            timeout=self._timeout,
+        )
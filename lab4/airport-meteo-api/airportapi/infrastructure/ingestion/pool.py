@@ -0,0 +1,131 @@
+"""Module containing the process pool decoding METAR reports."""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable
+
+from airportapi.core.domain.observation import ObservationIn, RawMetar
+from airportapi.infrastructure.ingestion.decoder import (
+    RawRow,
+    decode_batch,
+    to_observation,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class DecodePool:
+    """A class decoding batches of METAR reports in worker processes.
+
+    Decoding is CPU-bound pure Python, so running it on the event loop
+    would stall every request of the worker. Reports are split into chunks
+    sent to the pool as plain tuples and the decoded tuples of every chunk
+    are turned into models as soon as the chunk comes back.
+    """
+
+    _workers: int
+    _chunk_size: int
+    _executor: ProcessPoolExecutor | None
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        chunk_size: int = 256,
+    ) -> None:
+        """The initializer of the `decode pool`.
+
+        Args:
+            workers (int | None, optional): The number of worker processes.
+                Defaults to None, which means the number of CPUs.
+            chunk_size (int, optional): The number of reports sent
+                to a worker at once. Defaults to 256.
+        """
+
+        self._workers = workers or os.cpu_count() or 1
+        self._chunk_size = max(chunk_size, 1)
+        self._executor = None
+
+    @property
+    def workers(self) -> int:
+        """The property returning the number of worker processes.
+
+        Returns:
+            int: The number of workers.
+        """
+
+        return self._workers
+
+    async def decode(self, reports: Iterable[RawMetar]) -> list[ObservationIn]:
+        """The method decoding the reports in the worker processes.
+
+        The workers are started on the first call. If any of them dies,
+        the pool is restarted and the batch is decoded again, and if the
+        new pool breaks too, the batch is decoded in this process.
+
+        Args:
+            reports (Iterable[RawMetar]): The raw reports.
+
+        Returns:
+            list[ObservationIn]: The parsable observations in input order.
+        """
+
+        rows = [
+            (report.icao_code, report.observation_time, report.raw)
+            for report in reports
+        ]
+
+        if not rows:
+            return []
+
+        for _ in range(2):
+            if not self._executor:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+
+            try:
+                batches = await asyncio.gather(*(
+                    self._decode_chunk(rows[start:start + self._chunk_size])
+                    for start in range(0, len(rows), self._chunk_size)
+                ))
+            except BrokenProcessPool:
+                logger.warning("METAR decode pool broke, restarting it")
+                self.shutdown()
+            else:
+                return [
+                    observation for batch in batches for observation in batch
+                ]
+
+        logger.warning("Decoding %d METAR reports inline", len(rows))
+
+        return [to_observation(row) for row in decode_batch(rows)]
+
+    async def _decode_chunk(self, rows: list[RawRow]) -> list[ObservationIn]:
+        """A private method decoding a single chunk in a worker process.
+
+        Args:
+            rows (list[RawRow]): The raw rows of the chunk.
+
+        Returns:
+            list[ObservationIn]: The parsable observations of the chunk.
+        """
+
+        decoded = await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            decode_batch,
+            rows,
+        )
+
+        return [to_observation(row) for row in decoded]
+
+    def shutdown(self) -> None:
+        """The method stopping the worker processes."""
+
+        if self._executor:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
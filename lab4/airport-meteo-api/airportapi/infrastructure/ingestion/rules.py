@@ -0,0 +1,220 @@
+"""Module containing the vectorized weather warning rule engine."""
+
+from typing import Sequence
+
+import numpy as np
+
+from airportapi.core.domain.observation import ObservationIn
+from airportapi.core.domain.warning import WeatherWarningIn
+
+ABOVE = "above"
+BELOW = "below"
+CONTAINS = "contains"
+FREEZING_PRECIPITATION = "FZRA|FZDZ|FZUP"
+
+
+class Rule:
+    """A class representing a single warning rule of the observation column.
+
+    Numeric rules trigger when the value reaches the threshold (`above`) or
+    falls under it (`below`). Textual rules (`contains`) trigger when the
+    column contains any of the patterns separated by `|`.
+    """
+
+    name: str
+    column: str
+    comparison: str
+    threshold: float | str
+
+    def __init__(
+        self,
+        name: str,
+        column: str,
+        comparison: str,
+        threshold: float | str,
+    ) -> None:
+        """The initializer of the `rule`.
+
+        Args:
+            name (str): The name of the triggered warning.
+            column (str): The name of the observation attribute.
+            comparison (str): One of `above`, `below` or `contains`.
+            threshold (float | str): The threshold or the patterns.
+
+        Raises:
+            ValueError: If the comparison is unknown.
+        """
+
+        if comparison not in (ABOVE, BELOW, CONTAINS):
+            raise ValueError(f"Unknown comparison: {comparison}")
+
+        self.name = name
+        self.column = column
+        self.comparison = comparison
+        self.threshold = threshold
+
+    def evaluate(self, values: np.ndarray) -> np.ndarray:
+        """The method evaluating the rule against the whole column.
+
+        Args:
+            values (np.ndarray): The float column with NaN for missing
+                values, or the string column for textual rules.
+
+        Returns:
+            np.ndarray: The boolean mask of triggering observations.
+        """
+
+        if self.comparison == CONTAINS:
+            return np.logical_or.reduce([
+                np.char.find(values, pattern) >= 0
+                for pattern in str(self.threshold).split("|")
+            ])
+        if self.comparison == ABOVE:
+            return values >= self.threshold
+
+        return values < self.threshold
+
+
+class RuleEngine:
+    """A class evaluating warning rules against batches of observations."""
+
+    _rules: list[Rule]
+
+    def __init__(self, rules: Sequence[Rule]) -> None:
+        """The initializer of the `rule engine`.
+
+        Args:
+            rules (Sequence[Rule]): The rules to evaluate.
+        """
+
+        self._rules = list(rules)
+
+    @property
+    def rules(self) -> list[Rule]:
+        """The property returning the evaluated rules.
+
+        Returns:
+            list[Rule]: The rules.
+        """
+
+        return self._rules
+
+    def evaluate(
+        self,
+        observations: Sequence[ObservationIn],
+    ) -> list[WeatherWarningIn]:
+        """The method finding warnings triggered by the observations.
+
+        Every used attribute is turned into a single column array, so each
+        rule costs one comparison over the whole batch.
+
+        Args:
+            observations (Sequence[ObservationIn]): The observations.
+
+        Returns:
+            list[WeatherWarningIn]: The triggered warnings.
+        """
+
+        if not observations or not self._rules:
+            return []
+
+        columns: dict[str, np.ndarray] = {}
+        warnings = []
+
+        for rule in self._rules:
+            textual = rule.comparison == CONTAINS
+
+            if rule.column not in columns:
+                columns[rule.column] = _column(
+                    observations,
+                    rule.column,
+                    textual=textual,
+                )
+
+            values = columns[rule.column]
+
+            for index in np.flatnonzero(rule.evaluate(values)).tolist():
+                observation = observations[index]
+
+                warnings.append(WeatherWarningIn.model_construct(
+                    icao_code=observation.icao_code,
+                    observation_time=observation.observation_time,
+                    rule=rule.name,
+                    value=None if textual else float(values[index]),
+                    threshold=None if textual else float(rule.threshold),
+                    detail=str(values[index]) if textual else None,
+                ))
+
+        return warnings
+
+
+def default_rules(
+    gust: float | None = None,
+    visibility: float | None = None,
+    ceiling: float | None = None,
+    freezing: bool = False,
+) -> list[Rule]:
+    """Function preparing the standard set of warning rules.
+
+    Args:
+        gust (float | None, optional): The minimal gust in knots.
+            Defaults to None, which disables the rule.
+        visibility (float | None, optional): The visibility in metres
+            below which the rule triggers. Defaults to None.
+        ceiling (float | None, optional): The ceiling in feet below which
+            the rule triggers. Defaults to None.
+        freezing (bool, optional): If freezing precipitation triggers
+            a warning. Defaults to False.
+
+    Returns:
+        list[Rule]: The enabled rules.
+    """
+
+    rules = []
+
+    if gust is not None:
+        rules.append(Rule("gust", "wind_gust", ABOVE, gust))
+    if visibility is not None:
+        rules.append(Rule("low_visibility", "visibility", BELOW, visibility))
+    if ceiling is not None:
+        rules.append(Rule("low_ceiling", "ceiling", BELOW, ceiling))
+    if freezing:
+        rules.append(
+            Rule(
+                "freezing_precipitation",
+                "weather",
+                CONTAINS,
+                FREEZING_PRECIPITATION,
+            )
+        )
+
+    return rules
+
+
+def _column(
+    observations: Sequence[ObservationIn],
+    name: str,
+    textual: bool,
+) -> np.ndarray:
+    """A private function extracting the attribute of all observations.
+
+    Args:
+        observations (Sequence[ObservationIn]): The observations.
+        name (str): The name of the attribute.
+        textual (bool): If the column holds strings.
+
+    Returns:
+        np.ndarray: The string column with empty strings for missing
+            values, or the float column with NaN for missing values.
+    """
+
+    if textual:
+        return np.array(
+            [getattr(observation, name) or "" for observation in observations],
+            dtype=str,
+        )
+
+    return np.array(
+        [getattr(observation, name) for observation in observations],
+        dtype=float,
+    )
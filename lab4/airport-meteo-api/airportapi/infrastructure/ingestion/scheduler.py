@@ -0,0 +1,226 @@
+"""Module containing the periodic METAR ingestion scheduler."""
+
+import asyncio
+import contextlib
+import logging
+import time
+from typing import Awaitable, Callable, Iterable
+
+from airportapi.core.domain.observation import RawMetar
+from airportapi.core.repositories.iairport import IAirportRepository
+from airportapi.infrastructure.ingestion.fetcher import MetarFetcher
+from airportapi.infrastructure.ingestion.leader import LeaderLock
+
+logger = logging.getLogger(__name__)
+
+ReportHandler = Callable[[Iterable[RawMetar]], Awaitable[None]]
+
+
+class CycleStats:
+    """A class representing the outcome of a single polling cycle."""
+
+    started_at: float
+    duration: float
+    stations: int
+    fetched: int
+    not_modified: int
+    failed: int
+
+    def __init__(self, started_at: float) -> None:
+        """The initializer of the `cycle stats`.
+
+        Args:
+            started_at (float): The UNIX timestamp of the cycle start.
+        """
+
+        self.started_at = started_at
+        self.duration = 0.0
+        self.stations = 0
+        self.fetched = 0
+        self.not_modified = 0
+        self.failed = 0
+
+
+class MetarScheduler:
+    """A class polling METAR reports of all airports in the background.
+
+    With the leader lock only the process holding it polls, so running
+    several workers neither multiplies the requests nor bypasses the
+    per-host rate limit. The others try to take the lock every interval.
+    """
+
+    _repository: IAirportRepository
+    _fetcher: MetarFetcher
+    _interval: float
+    _stop_timeout: float
+    _handler: ReportHandler | None
+    _lock: LeaderLock | None
+    _stopping: asyncio.Event
+    _task: asyncio.Task | None
+    leading: bool
+    last_cycle: CycleStats | None
+    totals: CycleStats
+    succeeded_cycles: int
+    failed_cycles: int
+
+    def __init__(
+        self,
+        repository: IAirportRepository,
+        fetcher: MetarFetcher,
+        interval: float,
+        handler: ReportHandler | None = None,
+        stop_timeout: float = 5.0,
+        lock: LeaderLock | None = None,
+    ) -> None:
+        """The initializer of the `METAR scheduler`.
+
+        Args:
+            repository (IAirportRepository): The repository of the airports.
+            fetcher (MetarFetcher): The fetcher of the reports.
+            interval (float): The time between cycle starts in seconds.
+            handler (ReportHandler | None, optional): The coroutine
+                consuming new reports of a cycle. Defaults to None.
+            stop_timeout (float, optional): The time in seconds a started
+                cycle may take to finish on stop. Defaults to 5.0.
+            lock (LeaderLock | None, optional): The lock of the polling
+                process. Defaults to None, which means this process
+                always polls.
+        """
+
+        self._repository = repository
+        self._fetcher = fetcher
+        self._interval = interval
+        self._stop_timeout = stop_timeout
+        self._handler = handler
+        self._lock = lock
+        self._stopping = asyncio.Event()
+        self._task = None
+        self.leading = False
+        self.last_cycle = None
+        self.totals = CycleStats(started_at=time.time())
+        self.succeeded_cycles = 0
+        self.failed_cycles = 0
+
+    @property
+    def running(self) -> bool:
+        """The property telling if the polling loop is active.
+
+        Returns:
+            bool: True if the loop is running.
+        """
+
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """The method starting the polling loop in the background."""
+
+        if self.running:
+            return
+
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run(), name="metar-scheduler")
+
+    async def stop(self) -> None:
+        """The method stopping the polling loop.
+
+        The loop is signalled first, so a cycle which has already started
+        can finish. If the loop does not stop within the stop timeout,
+        it is cancelled. The leader lock is released afterwards.
+        """
+
+        if not self._task:
+            return
+
+        self._stopping.set()
+
+        try:
+            await asyncio.wait_for(self._task, timeout=self._stop_timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+            if self._lock:
+                await self._lock.release()
+                self.leading = False
+
+    async def run_cycle(self) -> CycleStats:
+        """The method polling all stations once.
+
+        Returns:
+            CycleStats: The outcome of the cycle.
+        """
+
+        stats = CycleStats(started_at=time.time())
+        icao_codes = list(await self._repository.get_icao_codes())
+        result = await self._fetcher.fetch_many(icao_codes)
+
+        if result.reports and self._handler:
+            await self._handler(result.reports)
+
+        self._fetcher.remember(result)
+
+        stats.duration = time.time() - stats.started_at
+        stats.stations = len(icao_codes)
+        stats.fetched = len(result.reports)
+        stats.not_modified = result.not_modified
+        stats.failed = result.failed
+        self.last_cycle = stats
+        self.totals.duration += stats.duration
+        self.totals.stations += stats.stations
+        self.totals.fetched += stats.fetched
+        self.totals.not_modified += stats.not_modified
+        self.totals.failed += stats.failed
+
+        return stats
+
+    async def _run(self) -> None:
+        """A private method running cycles until the loop is stopped."""
+
+        while not self._stopping.is_set():
+            started = time.monotonic()
+
+            if await self._lead():
+                try:
+                    stats = await self.run_cycle()
+                    self.succeeded_cycles += 1
+                    logger.info(
+                        "METAR cycle: %d stations, %d new, "
+                        "%d not modified, %d failed in %.1fs",
+                        stats.stations,
+                        stats.fetched,
+                        stats.not_modified,
+                        stats.failed,
+                        stats.duration,
+                    )
+                except Exception:
+                    self.failed_cycles += 1
+                    logger.exception("METAR cycle failed")
+
+            delay = max(self._interval - (time.monotonic() - started), 0.0)
+
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+
+    async def _lead(self) -> bool:
+        """A private method checking if this process should poll.
+
+        Returns:
+            bool: True if there is no lock or this process holds it.
+        """
+
+        leading = self._lock is None or await self._lock.acquire()
+
+        if self._lock and leading != self.leading:
+            logger.info(
+                "METAR polling %s",
+                "taken over by this process" if leading
+                else "left to another process",
+            )
+
+        self.leading = leading
+
+        return leading
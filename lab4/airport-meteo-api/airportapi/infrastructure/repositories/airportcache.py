@@ -0,0 +1,431 @@
+"""Module containing the caching decorator of the airport repository."""
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Optional,
+    Sequence,
+)
+
+from airportapi.core.domain.airport import AirportIn
+from airportapi.core.domain.page import PageRequest
+from airportapi.core.repositories.iairport import IAirportRepository
+from airportapi.utils.cache import TTLCache
+
+
+class CachedAirportRepository(IAirportRepository):
+    """A class caching single airport lookups of another repository.
+
+    Lookups by id, ICAO and IATA code are served from the cache. Entries
+    are tagged with the airport id, so updating or deleting the airport
+    invalidates all of its lookups. Missing airports are not cached.
+    """
+
+    _repository: IAirportRepository
+    _cache: TTLCache
+
+    def __init__(
+        self,
+        repository: IAirportRepository,
+        cache: TTLCache,
+    ) -> None:
+        """The initializer of the `cached airport repository`.
+
+        Args:
+            repository (IAirportRepository): The wrapped repository.
+            cache (TTLCache): The cache of the airport lookups.
+        """
+
+        self._repository = repository
+        self._cache = cache
+
+    @property
+    def cache(self) -> TTLCache:
+        """The property returning the cache of the airport lookups.
+
+        Returns:
+            TTLCache: The cache.
+        """
+
+        return self._cache
+
+    def invalidate(self, airport_id: Optional[int]) -> None:
+        """The method evicting lookups of the airport changed elsewhere.
+
+        Args:
+            airport_id (Optional[int]): The id of the changed airport,
+                None to clear the whole cache.
+        """
+
+        if airport_id is None:
+            self._cache.clear()
+        else:
+            self._cache.invalidate_tag(airport_id)
+
+    async def get_all_airports(
+        self,
+        page: PageRequest | None = None,
+    ) -> Iterable[Any]:
+        """The method getting all airports from the data storage.
+
+        Args:
+            page (PageRequest | None, optional): The requested keyset
+                page. Defaults to None, which means all airports ordered
+                by name.
+
+        Returns:
+            Iterable[Any]: Airports in the data storage.
+        """
+
+        return await self._repository.get_all_airports(page)
+
+    def iterate_all_airports(self) -> AsyncIterator[bytes]:
+        """The method iterating all airports encoded as JSON.
+
+        Returns:
+            AsyncIterator[bytes]: The JSON documents of the airports
+                ordered by name.
+        """
+
+        return self._repository.iterate_all_airports()
+
+    async def get_icao_codes(self) -> Iterable[str]:
+        """The method getting ICAO codes of all airports.
+
+        Returns:
+            Iterable[str]: The ICAO codes.
+        """
+
+        return await self._repository.get_icao_codes()
+
+    async def get_by_country(
+        self,
+        country_id: int,
+        page: PageRequest | None = None,
+    ) -> Iterable[Any]:
+        """The method getting airports assigned to particular country.
+
+        Args:
+            country_id (int): The id of the country.
+            page (PageRequest | None, optional): The requested keyset
+                page. Defaults to None, which means all airports ordered
+                by name.
+
+        Returns:
+            Iterable[Any]: Airports assigned to a country.
+        """
+
+        return await self._repository.get_by_country(country_id, page)
+
+    async def get_by_continent(
+        self,
+        continent_id: int,
+        page: PageRequest | None = None,
+    ) -> Iterable[Any]:
+        """The method getting airports assigned to particular continent.
+
+        Args:
+            continent_id (int): The id of the continent.
+            page (PageRequest | None, optional): The requested keyset
+                page. Defaults to None, which means all airports ordered
+                by name.
+
+        Returns:
+            Iterable[Any]: Airports assigned to a continent.
+        """
+
+        return await self._repository.get_by_continent(continent_id, page)
+
+    async def get_by_id(self, airport_id: int) -> Any | None:
+        """The method getting airport by provided id.
+
+        Args:
+            airport_id (int): The id of the airport.
+
+        Returns:
+            Any | None: The airport details.
+        """
+
+        key = ("id", airport_id)
+
+        if (airport := self._cache.get(key)) is None:
+            airport = await self._repository.get_by_id(airport_id)
+            self._store(key, airport)
+
+        return airport
+
+    async def get_by_icao(self, icao_code: str) -> Any | None:
+        """The method getting airport by provided ICAO code.
+
+        Args:
+            icao_code (str): The ICAO code of the airport.
+
+        Returns:
+            Any | None: The airport details.
+        """
+
+        key = ("icao", icao_code)
+
+        if (airport := self._cache.get(key)) is None:
+            airport = await self._repository.get_by_icao(icao_code)
+            self._store(key, airport)
+
+        return airport
+
+    async def get_by_iata(self, iata_code: str) -> Any | None:
+        """The method getting airport by provided IATA code.
+
+        Args:
+            iata_code (str): The IATA code of the airport.
+
+        Returns:
+            Any | None: The airport details.
+        """
+
+        key = ("iata", iata_code)
+
+        if (airport := self._cache.get(key)) is None:
+            airport = await self._repository.get_by_iata(iata_code)
+            self._store(key, airport)
+
+        return airport
+
+    async def get_by_icao_codes(
+        self,
+        icao_codes: Sequence[str],
+    ) -> dict[str, Any]:
+        """The method getting airports by provided ICAO codes.
+
+        Args:
+            icao_codes (Sequence[str]): The ICAO codes of the airports.
+
+        Returns:
+            dict[str, Any]: The airport details by the found codes.
+        """
+
+        return await self._get_many(
+            "icao",
+            icao_codes,
+            self._repository.get_by_icao_codes,
+        )
+
+    async def get_by_iata_codes(
+        self,
+        iata_codes: Sequence[str],
+    ) -> dict[str, Any]:
+        """The method getting airports by provided IATA codes.
+
+        Args:
+            iata_codes (Sequence[str]): The IATA codes of the airports.
+
+        Returns:
+            dict[str, Any]: The airport details by the found codes.
+        """
+
+        return await self._get_many(
+            "iata",
+            iata_codes,
+            self._repository.get_by_iata_codes,
+        )
+
+    async def get_by_user(self, user_id: int) -> Iterable[Any]:
+        """The method getting airports by user who added them.
+
+        Args:
+            user_id (int): The id of the user.
+
+        Returns:
+            Iterable[Any]: The airport collection.
+        """
+
+        return await self._repository.get_by_user(user_id)
+
+    async def get_by_location(
+        self,
+        latitude: float,
+        longitude: float,
+        radius: float,
+    ) -> Iterable[Any]:
+        """The method getting airports by raduis of the provided location.
+
+        Args:
+            latitude (float): The geographical latitude.
+            longitude (float): The geographical longitude.
+            radius (float): The radius airports to search in kilometres.
+
+        Returns:
+            Iterable[Any]: The result airport collection ordered by distance.
+        """
+
+        return await self._repository.get_by_location(
+            latitude=latitude,
+            longitude=longitude,
+            radius=radius,
+        )
+
+    async def get_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        count: int,
+    ) -> Iterable[Any]:
+        """The method getting airports closest to the provided location.
+
+        Args:
+            latitude (float): The geographical latitude.
+            longitude (float): The geographical longitude.
+            count (int): The number of airports to find.
+
+        Returns:
+            Iterable[Any]: The result airport collection ordered by distance.
+        """
+
+        return await self._repository.get_nearest(
+            latitude=latitude,
+            longitude=longitude,
+            count=count,
+        )
+
+    async def get_along_route(
+        self,
+        start: tuple[float, float],
+        end: tuple[float, float],
+        width: float,
+    ) -> Iterable[Any]:
+        """The method getting airports close to the great-circle route.
+
+        Args:
+            start (tuple[float, float]): The latitude and longitude
+                of the start.
+            end (tuple[float, float]): The latitude and longitude
+                of the end.
+            width (float): The maximal distance from the route
+                in kilometres.
+
+        Returns:
+            Iterable[Any]: The airports with their distances, ordered
+                along the route.
+        """
+
+        return await self._repository.get_along_route(
+            start=start,
+            end=end,
+            width=width,
+        )
+
+    async def add_airport(self, data: AirportIn) -> Any | None:
+        """The method adding new airport to the data storage.
+
+        Args:
+            data (AirportIn): The details of the new airport.
+
+        Returns:
+            Any | None: The newly added airport.
+        """
+
+        return await self._repository.add_airport(data)
+
+    async def upsert_airports(self, airports: Sequence[AirportIn]) -> int:
+        """The method adding or replacing airports and clearing the cache.
+
+        The whole cache is cleared, since the ids of the replaced airports
+        are not known upfront.
+
+        Args:
+            airports (Sequence[AirportIn]): The airports with unique
+                ICAO codes.
+
+        Returns:
+            int: The number of added or updated airports.
+        """
+
+        upserted = await self._repository.upsert_airports(airports)
+        self._cache.clear()
+
+        return upserted
+
+    async def update_airport(
+        self,
+        airport_id: int,
+        data: AirportIn,
+    ) -> Any | None:
+        """The method updating airport data and invalidating its lookups.
+
+        Args:
+            airport_id (int): The id of the airport.
+            data (AirportIn): The details of the updated airport.
+
+        Returns:
+            Any | None: The updated airport details.
+        """
+
+        airport = await self._repository.update_airport(airport_id, data)
+        self._cache.invalidate_tag(airport_id)
+
+        return airport
+
+    async def delete_airport(self, airport_id: int) -> bool:
+        """The method removing airport and invalidating its lookups.
+
+        Args:
+            airport_id (int): The id of the airport.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+        deleted = await self._repository.delete_airport(airport_id)
+        self._cache.invalidate_tag(airport_id)
+
+        return deleted
+
+    async def _get_many(
+        self,
+        kind: str,
+        codes: Sequence[str],
+        fetch: Callable[[Sequence[str]], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """A private method getting airports by codes, cached ones first.
+
+        Only the codes missing in the cache are fetched, all at once.
+
+        Args:
+            kind (str): The kind of the codes, used in the cache keys.
+            codes (Sequence[str]): The codes of the airports.
+            fetch (Callable[[Sequence[str]], Awaitable[dict[str, Any]]]):
+                The lookup of the wrapped repository.
+
+        Returns:
+            dict[str, Any]: The airport details by the found codes.
+        """
+
+        found = {}
+        missing = []
+
+        for code in codes:
+            if (airport := self._cache.get((kind, code))) is None:
+                missing.append(code)
+            else:
+                found[code] = airport
+
+        if missing:
+            for code, airport in (await fetch(missing)).items():
+                self._store((kind, code), airport)
+                found[code] = airport
+
+        return found
+
+    def _store(self, key: Hashable, airport: Any | None) -> None:
+        """A private method caching the found airport under its id tag.
+
+        Args:
+            key (Hashable): The key of the lookup.
+            airport (Any | None): The airport details.
+        """
+
+        if airport is not None:
+            self._cache.set(key, airport, tags=(airport.id,))
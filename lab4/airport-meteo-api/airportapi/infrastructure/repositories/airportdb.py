@@ -1,73 +1,256 @@
 """Module containing airport repository implementation."""
 
-from typing import Any, Iterable
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Optional,
+    Sequence,
+)
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select, join
+from asyncpg.exceptions import (  # type: ignore
+    DataError,
+    IntegrityConstraintViolationError,
+)
+from sqlalchemy import (
+    ARRAY,
+    Column,
+    ColumnElement,
+    Select,
+    String,
+    any_,
+    bindparam,
+    func,
+    join,
+    literal,
+    or_,
+    select,
+    tuple_,
+)
 
 from airportapi.core.repositories.iairport import IAirportRepository
 from airportapi.core.domain.airport import Airport, AirportIn
+from airportapi.core.domain.page import PageRequest
 from airportapi.db import (
     airport_table,
-    continent_table,
     country_table,
     database,
+    replica,
+)
+from airportapi.infrastructure.dto.airportdto import (
+    AirportDTO,
+    AirportRouteDTO,
+)
+from airportapi.infrastructure.repositories.invalidation import \
+    InvalidationPublisher
+from airportapi.infrastructure.repositories.reference import ReferenceData
+from airportapi.utils.geo import EARTH_RADIUS_KM, bounding_box
+from airportapi.utils.geoarray import points_along_route, to_unit_vectors
+from airportapi.utils.spatial import SpatialIndex
+from airportapi.utils.statements import Statement, register
+
+AIRPORT_DETAILS = select(airport_table)
+DETAIL_COLUMNS = [column.name for column in AIRPORT_DETAILS.selected_columns]
+COLUMNS = tuple(
+    column.name
+    for column in airport_table.columns
+    if column.name != "id"
+)
+STAGING_TABLE = "airports_staging"
+
+AIRPORT_BY_ID = register(
+    "airport_by_id",
+    AIRPORT_DETAILS.where(airport_table.c.id == bindparam("airport_id")),
+)
+AIRPORT_BY_ICAO = register(
+    "airport_by_icao",
+    AIRPORT_DETAILS.where(airport_table.c.icao_code == bindparam("code")),
+)
+AIRPORT_BY_IATA = register(
+    "airport_by_iata",
+    AIRPORT_DETAILS.where(airport_table.c.iata_code == bindparam("code")),
+)
+AIRPORTS_BY_ICAO_CODES, AIRPORTS_BY_IATA_CODES = (
+    register(
+        f"airports_by_{column.name}s",
+        AIRPORT_DETAILS
+        .where(column == any_(bindparam("codes", type_=ARRAY(String))))
+        .order_by(airport_table.c.id.desc()),
+    )
+    for column in (airport_table.c.icao_code, airport_table.c.iata_code)
 )
-from airportapi.infrastructure.dto.airportdto import AirportDTO
 
 
 class AirportRepository(IAirportRepository):
     """A class representing continent DB repository."""
 
-    async def get_all_airports(self) -> Iterable[Any]:
+    _index: SpatialIndex
+    _index_loaded: bool
+    _reference: ReferenceData
+    _publisher: InvalidationPublisher
+    _to_dto: Callable[[Sequence[Any]], AirportDTO]
+    _encode: Callable[[Sequence[Any]], bytes]
+
+    def __init__(
+        self,
+        index: SpatialIndex,
+        reference: ReferenceData,
+        publisher: InvalidationPublisher,
+    ) -> None:
+        """The initializer of the `airport repository`.
+
+        Args:
+            index (SpatialIndex): The spatial index of airport locations.
+            reference (ReferenceData): The in-memory map of countries
+                attached to the airport details.
+            publisher (InvalidationPublisher): The announcer of changes
+                to the other processes.
+        """
+
+        self._index = index
+        self._index_loaded = False
+        self._reference = reference
+        self._publisher = publisher
+        self._to_dto = AirportDTO.converter(DETAIL_COLUMNS, reference.country)
+        self._encode = AirportDTO.encoder(
+            DETAIL_COLUMNS,
+            reference.country_document,
+        )
+
+    async def load_index(self) -> None:
+        """The method building the spatial index from the data storage."""
+
+        query = select(
+            airport_table.c.id,
+            airport_table.c.latitude,
+            airport_table.c.longitude,
+        )
+        airports = await database.fetch_all(query)
+
+        self._index.rebuild(
+            (airport["id"], airport["latitude"], airport["longitude"])
+            for airport in airports
+            if airport["latitude"] is not None
+            and airport["longitude"] is not None
+        )
+        self._index_loaded = True
+
+    async def refresh_index(self, airport_id: Optional[int]) -> None:
+        """The method updating the index after a change by another process.
+
+        Args:
+            airport_id (Optional[int]): The id of the changed airport,
+                None to rebuild the whole index.
+        """
+
+        if not self._index_loaded:
+            return
+
+        if airport_id is None:
+            await self.load_index()
+        elif airport := await database.fetch_one(
+            AIRPORT_BY_ID.bind(airport_id=airport_id)
+        ):
+            self._index_airport(airport)
+        else:
+            self._index.remove(airport_id)
+
+    async def get_all_airports(
+        self,
+        page: PageRequest | None = None,
+    ) -> Iterable[Any]:
         """The method getting all airports from the data storage.
 
+        Args:
+            page (PageRequest | None, optional): The requested keyset
+                page. Defaults to None, which means all airports ordered
+                by name.
+
         Returns:
             Iterable[Any]: Airports in the data storage.
         """
 
+        query = self._paginate(AIRPORT_DETAILS, page)
+        airports = await replica.fetch_all(query)
+
+        return await self._to_dtos(airports)
+
+    async def iterate_all_airports(self) -> AsyncIterator[bytes]:
+        """The method iterating all airports encoded as JSON.
+
+        Rows are read through a server-side cursor and encoded straight
+        from the record with the country from the reference map, so no
+        DTO is built and memory does not grow with the table. The map
+        is completed before the cursor is opened, since the connection
+        of the cursor cannot run other queries until it is closed.
+
+        Yields:
+            bytes: The JSON document of the airport, in order of names.
+        """
+
+        query = AIRPORT_DETAILS.order_by(airport_table.c.name.asc())
+        countries = await replica.fetch_all(select(country_table.c.id))
+        await self._reference.ensure(country["id"] for country in countries)
+
+        async for airport in replica.iterate(query):
+            yield self._encode(airport._mapping)  # type: ignore[attr-defined]
+
+    async def get_icao_codes(self) -> Iterable[str]:
+        """The method getting ICAO codes of all airports.
+
+        Returns:
+            Iterable[str]: The ICAO codes.
+        """
+
         query = (
-            select(airport_table, country_table, continent_table)
-            .select_from(
-                join(
-                    airport_table,
-                    join(
-                        country_table,
-                        continent_table,
-                        country_table.c.continent_id == continent_table.c.id
-                    ),
-                    airport_table.c.country_id == country_table.c.id
-                )
-            )
-            .order_by(airport_table.c.name.asc())
+            select(airport_table.c.icao_code)
+            .where(airport_table.c.icao_code.is_not(None))
+            .order_by(airport_table.c.icao_code.asc())
         )
-        airports = await database.fetch_all(query)
+        airports = await replica.fetch_all(query)
 
-        return [AirportDTO.from_record(airport) for airport in airports]
+        return [airport["icao_code"] for airport in airports]
 
-    async def get_by_country(self, country_id: int) -> Iterable[Any]:
+    async def get_by_country(
+        self,
+        country_id: int,
+        page: PageRequest | None = None,
+    ) -> Iterable[Any]:
         """The method getting airports assigned to particular country.
 
         Args:
             country_id (int): The id of the country.
+            page (PageRequest | None, optional): The requested keyset
+                page. Defaults to None, which means all airports ordered
+                by name.
 
         Returns:
             Iterable[Any]: Airports assigned to a country.
         """
 
-        query = airport_table \
-            .select() \
-            .where(airport_table.c.country_id == country_id) \
-            .order_by(airport_table.c.name.asc())
-        airports = await database.fetch_all(query)
+        query = self._paginate(
+            airport_table.select()
+            .where(airport_table.c.country_id == country_id),
+            page,
+        )
+        airports = await replica.fetch_all(query)
 
         return [Airport(**dict(airport)) for airport in airports]
 
-    async def get_by_continent(self, continent_id: int) -> Iterable[Any]:
+    async def get_by_continent(
+        self,
+        continent_id: int,
+        page: PageRequest | None = None,
+    ) -> Iterable[Any]:
         """The method getting airports assigned to particular continent.
 
         Args:
             continent_id (int): The id of the continent.
+            page (PageRequest | None, optional): The requested keyset
+                page. Defaults to None, which means all airports ordered
+                by name.
 
         Returns:
             Iterable[Any]: Airports assigned to a continent.
@@ -83,10 +266,10 @@ class AirportRepository(IAirportRepository):
                 )
             )
             .where(country_table.c.continent_id == continent_id)
-            .order_by(airport_table.c.name.asc())
         )
+        query = self._paginate(query, page)
 
-        airports = await database.fetch_all(query)
+        airports = await replica.fetch_all(query)
 
         return [Airport(**dict(airport)) for airport in airports]
 
@@ -100,25 +283,10 @@ class AirportRepository(IAirportRepository):
             Any | None: The airport details.
         """
 
-        query = (
-            select(airport_table, country_table, continent_table)
-            .select_from(
-                join(
-                    airport_table,
-                    join(
-                        country_table,
-                        continent_table,
-                        country_table.c.continent_id == continent_table.c.id
-                    ),
-                    airport_table.c.country_id == country_table.c.id
-                )
-            )
-            .where(airport_table.c.id == airport_id)
-            .order_by(airport_table.c.name.asc())
-        )
+        query = AIRPORT_BY_ID.bind(airport_id=airport_id)
         airport = await database.fetch_one(query)
 
-        return AirportDTO.from_record(airport) if airport else None
+        return (await self._to_dtos([airport]))[0] if airport else None
 
     async def get_by_icao(self, icao_code: str) -> Any | None:
         """The method getting airport by provided ICAO code.
@@ -130,25 +298,10 @@ class AirportRepository(IAirportRepository):
             Any | None: The airport details.
         """
 
-        query = (
-            select(airport_table, country_table, continent_table)
-            .select_from(
-                join(
-                    airport_table,
-                    join(
-                        country_table,
-                        continent_table,
-                        country_table.c.continent_id == continent_table.c.id
-                    ),
-                    airport_table.c.country_id == country_table.c.id
-                )
-            )
-            .where(airport_table.c.icao_code == icao_code)
-            .order_by(airport_table.c.name.asc())
-        )
+        query = AIRPORT_BY_ICAO.bind(code=icao_code)
         airport = await database.fetch_one(query)
 
-        return AirportDTO.from_record(airport) if airport else None
+        return (await self._to_dtos([airport]))[0] if airport else None
 
     async def get_by_iata(self, iata_code: str) -> Any | None:
         """The method getting airport by provided IATA code.
@@ -160,25 +313,48 @@ class AirportRepository(IAirportRepository):
             Any | None: The airport details.
         """
 
-        query = (
-            select(airport_table, country_table, continent_table)
-            .select_from(
-                join(
-                    airport_table,
-                    join(
-                        country_table,
-                        continent_table,
-                        country_table.c.continent_id == continent_table.c.id
-                    ),
-                    airport_table.c.country_id == country_table.c.id
-                )
-            )
-            .where(airport_table.c.iata_code == iata_code)
-            .order_by(airport_table.c.name.asc())
-        )
+        query = AIRPORT_BY_IATA.bind(code=iata_code)
         airport = await database.fetch_one(query)
 
-        return AirportDTO.from_record(airport) if airport else None
+        return (await self._to_dtos([airport]))[0] if airport else None
+
+    async def get_by_icao_codes(
+        self,
+        icao_codes: Sequence[str],
+    ) -> dict[str, Any]:
+        """The method getting airports by provided ICAO codes.
+
+        Args:
+            icao_codes (Sequence[str]): The ICAO codes of the airports.
+
+        Returns:
+            dict[str, Any]: The airport details by the found codes.
+        """
+
+        return await self._get_by_codes(
+            AIRPORTS_BY_ICAO_CODES,
+            airport_table.c.icao_code,
+            icao_codes,
+        )
+
+    async def get_by_iata_codes(
+        self,
+        iata_codes: Sequence[str],
+    ) -> dict[str, Any]:
+        """The method getting airports by provided IATA codes.
+
+        Args:
+            iata_codes (Sequence[str]): The IATA codes of the airports.
+
+        Returns:
+            dict[str, Any]: The airport details by the found codes.
+        """
+
+        return await self._get_by_codes(
+            AIRPORTS_BY_IATA_CODES,
+            airport_table.c.iata_code,
+            iata_codes,
+        )
 
     async def get_by_user(self, user_id: int) -> Iterable[Any]:
         """The method getting airports by user who added them.
@@ -203,13 +379,100 @@ class AirportRepository(IAirportRepository):
         Args:
             latitude (float): The geographical latitude.
             longitude (float): The geographical longitude.
-            radius (float): The radius airports to search.
+            radius (float): The radius airports to search in kilometres.
 
         Returns:
-            Iterable[Any]: The result airport collection.
+            Iterable[Any]: The result airport collection ordered by distance.
         """
 
-        return []
+        if not self._index_loaded:
+            return await self._get_by_location_from_db(
+                latitude=latitude,
+                longitude=longitude,
+                radius=radius,
+            )
+
+        found = self._index.within(latitude, longitude, radius)
+
+        return await self._get_many_by_id([key for key, _ in found])
+
+    async def get_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        count: int,
+    ) -> Iterable[Any]:
+        """The method getting airports closest to the provided location.
+
+        Args:
+            latitude (float): The geographical latitude.
+            longitude (float): The geographical longitude.
+            count (int): The number of airports to find.
+
+        Returns:
+            Iterable[Any]: The result airport collection ordered by distance.
+        """
+
+        if not self._index_loaded:
+            query = (
+                airport_table.select()
+                .where(airport_table.c.latitude.is_not(None))
+                .order_by(_distance(latitude, longitude).asc())
+                .limit(count)
+            )
+            airports = await replica.fetch_all(query)
+
+            return [Airport(**dict(airport)) for airport in airports]
+
+        found = self._index.nearest(latitude, longitude, count)
+
+        return await self._get_many_by_id([key for key, _ in found])
+
+    async def get_along_route(
+        self,
+        start: tuple[float, float],
+        end: tuple[float, float],
+        width: float,
+    ) -> Iterable[Any]:
+        """The method getting airports close to the great-circle route.
+
+        Args:
+            start (tuple[float, float]): The latitude and longitude
+                of the start.
+            end (tuple[float, float]): The latitude and longitude
+                of the end.
+            width (float): The maximal distance from the route
+                in kilometres.
+
+        Raises:
+            ValueError: If the ends are the same or antipodal points.
+
+        Returns:
+            Iterable[Any]: The airports with distances from and along
+                the route in kilometres, ordered along it.
+        """
+
+        if self._index_loaded:
+            found = self._index.along_route(start, end, width)
+        else:
+            found = await self._get_along_route_from_db(start, end, width)
+
+        airports = {
+            airport.id: airport
+            for airport in await self._get_many_by_id(
+                [key for key, _, _ in found]
+            )
+        }
+
+        return [
+            AirportRouteDTO(
+                airport=airports[key],
+                cross_track=round(cross_track, 3),
+                along_track=round(along_track, 3),
+            )
+            for key, cross_track, along_track in found
+            if key in airports
+        ]
 
     async def add_airport(self, data: AirportIn) -> Any | None:
         """The method adding new airport to the data storage.
@@ -218,17 +481,92 @@ class AirportRepository(IAirportRepository):
             data (AirportIn): The details of the new airport.
 
         Returns:
-            Airport: Full details of the newly added airport.
+            Any | None: The newly added airport.
+        """
+
+        query = (
+            airport_table.insert()
+            .values(**data.model_dump())
+            .returning(airport_table)
+        )
+        new_airport = await database.fetch_one(query)
+
+        if not new_airport:
+            return None
+
+        self._index_airport(new_airport)
+        await self._publisher.publish("airport", new_airport["id"])
+
+        return Airport(**dict(new_airport))
+
+    async def upsert_airports(self, airports: Sequence[AirportIn]) -> int:
+        """The method adding or replacing airports by their ICAO codes.
+
+        The airports are streamed with `COPY` into a per-connection
+        temporary staging table and merged into the airports table with
+        a single upsert on the ICAO code. The spatial index is updated
+        with the returned locations.
+
+        Args:
+            airports (Sequence[AirportIn]): The airports with unique
+                ICAO codes.
+
+        Raises:
+            ValueError: If an airport is rejected by the DB, e.g. for
+                a unique column other than the ICAO code, an unknown
+                country or a too long value.
 
         Returns:
-            Any | None: The newly added airport.
+            int: The number of added or updated airports.
         """
 
-        query = airport_table.insert().values(**data.model_dump())
-        new_airport_id = await database.execute(query)
-        new_airport = await self._get_by_id(new_airport_id)
+        records = [
+            tuple(getattr(airport, column) for column in COLUMNS)
+            for airport in airports
+        ]
+
+        if not records:
+            return 0
 
-        return Airport(**dict(new_airport)) if new_airport else None
+        columns = ", ".join(COLUMNS)
+        updates = ", ".join(
+            f"{column} = EXCLUDED.{column}"
+            for column in COLUMNS
+            if column != "icao_code"
+        )
+
+        try:
+            async with database.connection() as connection:
+                async with connection.transaction():
+                    raw_connection = connection.raw_connection
+
+                    await raw_connection.execute(
+                        "CREATE TEMPORARY TABLE IF NOT EXISTS "
+                        f"{STAGING_TABLE} ON COMMIT DELETE ROWS AS "
+                        f"SELECT {columns} FROM {airport_table.name} "
+                        "WITH NO DATA"
+                    )
+                    await raw_connection.execute(f"TRUNCATE {STAGING_TABLE}")
+                    await raw_connection.copy_records_to_table(
+                        STAGING_TABLE,
+                        records=records,
+                        columns=COLUMNS,
+                    )
+                    upserted = await raw_connection.fetch(
+                        f"INSERT INTO {airport_table.name} ({columns}) "
+                        f"SELECT {columns} FROM {STAGING_TABLE} "
+                        f"ON CONFLICT (icao_code) DO UPDATE SET {updates} "
+                        "RETURNING id, latitude, longitude"
+                    )
+        except (IntegrityConstraintViolationError, DataError) as error:
+            raise ValueError(error.detail or str(error)) from error
+
+        for airport in upserted:
+            self._index_airport(airport)
+
+        await self._publisher.publish("airport", None)
+
+        return len(upserted)
 
     async def update_airport(
         self,
@@ -237,27 +575,32 @@ class AirportRepository(IAirportRepository):
     ) -> Any | None:
         """The method updating airport data in the data storage.
 
+        The row is updated and returned by a single statement.
+
         Args:
             airport_id (int): The id of the airport.
             data (AirportIn): The details of the updated airport.
 
         Returns:
-            Any | None: The updated airport details.
+            Any | None: The updated airport details, None if the airport
+                does not exist.
         """
 
-        if self._get_by_id(airport_id):
-            query = (
-                airport_table.update()
-                .where(airport_table.c.id == airport_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
+        query = (
+            airport_table.update()
+            .where(airport_table.c.id == airport_id)
+            .values(**data.model_dump())
+            .returning(airport_table)
+        )
+        airport = await database.fetch_one(query)
 
-            airport = await self._get_by_id(airport_id)
+        if not airport:
+            return None
 
-            return Airport(**dict(airport)) if airport else None
+        self._index_airport(airport)
+        await self._publisher.publish("airport", airport_id)
 
-        return None
+        return Airport(**dict(airport))
 
     async def delete_airport(self, airport_id: int) -> bool:
         """The method updating removing airport from the data storage.
@@ -266,33 +609,276 @@ class AirportRepository(IAirportRepository):
             airport_id (int): The id of the airport.
 
         Returns:
-            bool: Success of the operation.
+            bool: Success of the operation, False if the airport
+                does not exist.
         """
 
-        if self._get_by_id(airport_id):
-            query = airport_table \
-                .delete() \
-                .where(airport_table.c.id == airport_id)
-            await database.execute(query)
+        query = (
+            airport_table.delete()
+            .where(airport_table.c.id == airport_id)
+            .returning(airport_table.c.id)
+        )
+
+        if await database.fetch_val(query) is None:
+            return False
+
+        self._index.remove(airport_id)
+        await self._publisher.publish("airport", airport_id)
 
-            return True
+        return True
 
-        return False
+    @staticmethod
+    def _paginate(query: Select, page: PageRequest | None) -> Select:
+        """A private method ordering the query and cutting the keyset page.
 
-    async def _get_by_id(self, airport_id: int) -> Record | None:
-        """A private method getting airport from the DB based on its ID.
+        The page continues after the (sort key, id) pair of the last
+        airport instead of using OFFSET, so with an index on the pair,
+        optionally prefixed with the country, every page is a range scan.
 
         Args:
-            airport_id (int): The ID of the airport.
+            query (Select): The query of airports.
+            page (PageRequest | None): The requested keyset page.
 
         Returns:
-            Any | None: Airport record if exists.
+            Select: The query of the page, of all airports ordered
+                by name if no page is requested.
         """
 
+        if page is None:
+            return query.order_by(airport_table.c.name.asc())
+
+        key = (airport_table.c[page.sort], airport_table.c.id)
+
+        if page.after is not None:
+            after = tuple(map(literal, page.after))
+            query = query.where(
+                tuple_(*key) < tuple_(*after) if page.descending
+                else tuple_(*key) > tuple_(*after)
+            )
+
+        return (
+            query
+            .order_by(*(
+                column.desc() if page.descending else column.asc()
+                for column in key
+            ))
+            .limit(page.limit)
+        )
+
+    async def _get_by_codes(
+        self,
+        statement: Statement,
+        column: Column,
+        codes: Sequence[str],
+    ) -> dict[str, AirportDTO]:
+        """A private method getting airports matching any of the codes.
+
+        All codes are bound as a single array parameter, so the airports
+        are found with one `= ANY($1)` query regardless of their number.
+        If the code is shared, the first airport in order of ids is kept.
+
+        Args:
+            statement (Statement): The precompiled query of the codes.
+            column (Column): The column of the codes.
+            codes (Sequence[str]): The codes of the airports.
+
+        Returns:
+            dict[str, AirportDTO]: The airport details by the found codes.
+        """
+
+        if not codes:
+            return {}
+
+        airports = await database.fetch_all(statement.bind(codes=list(codes)))
+
+        return {
+            airport[column.name]: dto
+            for airport, dto in zip(airports, await self._to_dtos(airports))
+        }
+
+    async def _to_dtos(self, airports: Sequence[Record]) -> list[AirportDTO]:
+        """A private method converting airport records to DTOs.
+
+        Args:
+            airports (Sequence[Record]): The airport records.
+
+        Returns:
+            list[AirportDTO]: The airport details with their countries.
+        """
+
+        await self._reference.ensure(
+            {airport["country_id"] for airport in airports}
+        )
+
+        return [
+            self._to_dto(airport._mapping)  # type: ignore[attr-defined]
+            for airport in airports
+        ]
+
+    async def _get_many_by_id(self, airport_ids: list[int]) -> list[Airport]:
+        """A private method getting airports keeping the order of their IDs.
+
+        Args:
+            airport_ids (list[int]): The IDs of the airports.
+
+        Returns:
+            list[Airport]: The airports found in the DB.
+        """
+
+        if not airport_ids:
+            return []
+
+        query = airport_table \
+            .select() \
+            .where(airport_table.c.id.in_(airport_ids))
+        airports = {
+            airport["id"]: airport
+            for airport in await replica.fetch_all(query)
+        }
+
+        return [
+            Airport(**dict(airports[airport_id]))
+            for airport_id in airport_ids
+            if airport_id in airports
+        ]
+
+    async def _get_by_location_from_db(
+        self,
+        latitude: float,
+        longitude: float,
+        radius: float,
+    ) -> list[Airport]:
+        """A private method searching airports by location in the DB.
+
+        The lat/lon bounding box of the circle is matched against the
+        coordinates index first, so the exact haversine distance is
+        calculated only for airports inside the box.
+
+        Args:
+            latitude (float): The geographical latitude.
+            longitude (float): The geographical longitude.
+            radius (float): The radius airports to search in kilometres.
+
+        Returns:
+            list[Airport]: The airports ordered by distance.
+        """
+
+        min_lat, max_lat, min_lon, max_lon = \
+            bounding_box(latitude, longitude, radius)
+
+        longitude_filter: ColumnElement[bool]
+
+        if min_lon <= max_lon:
+            longitude_filter = airport_table.c.longitude.between(
+                min_lon,
+                max_lon,
+            )
+        else:
+            longitude_filter = or_(
+                airport_table.c.longitude >= min_lon,
+                airport_table.c.longitude <= max_lon,
+            )
+
+        distance = _distance(latitude, longitude)
         query = (
             airport_table.select()
-            .where(airport_table.c.id == airport_id)
-            .order_by(airport_table.c.name.asc())
+            .where(airport_table.c.latitude.between(min_lat, max_lat))
+            .where(longitude_filter)
+            .where(distance <= radius)
+            .order_by(distance.asc())
         )
+        airports = await replica.fetch_all(query)
+
+        return [Airport(**dict(airport)) for airport in airports]
+
+    async def _get_along_route_from_db(
+        self,
+        start: tuple[float, float],
+        end: tuple[float, float],
+        width: float,
+    ) -> list[tuple[int, float, float]]:
+        """A private method searching airports along the route in the DB.
+
+        The coordinates of all airports are read and their distances
+        from the route are calculated at once.
+
+        Args:
+            start (tuple[float, float]): The latitude and longitude
+                of the start.
+            end (tuple[float, float]): The latitude and longitude
+                of the end.
+            width (float): The maximal distance from the route
+                in kilometres.
+
+        Raises:
+            ValueError: If the ends are the same or antipodal points.
+
+        Returns:
+            list[tuple[int, float, float]]: The airport ids with distances
+                from and along the route in kilometres, ordered along it.
+        """
+
+        query = (
+            select(
+                airport_table.c.id,
+                airport_table.c.latitude,
+                airport_table.c.longitude,
+            )
+            .where(airport_table.c.latitude.is_not(None))
+            .where(airport_table.c.longitude.is_not(None))
+        )
+        airports = await replica.fetch_all(query)
+        start_vector, end_vector = to_unit_vectors(
+            (start[0], end[0]),
+            (start[1], end[1]),
+        )
+
+        return points_along_route(
+            [airport["id"] for airport in airports],
+            to_unit_vectors(
+                [airport["latitude"] for airport in airports],
+                [airport["longitude"] for airport in airports],
+            ),
+            start_vector,
+            end_vector,
+            width,
+        )
+
+    def _index_airport(self, airport: Record) -> None:
+        """A private method putting the airport location into the index.
+
+        Args:
+            airport (Record): The airport record.
+        """
+
+        if airport["latitude"] is None or airport["longitude"] is None:
+            self._index.remove(airport["id"])
+        else:
+            self._index.insert(
+                airport["id"],
+                airport["latitude"],
+                airport["longitude"],
+            )
+
+
+def _distance(latitude: float, longitude: float) -> ColumnElement[float]:
+    """A private function building the haversine distance from the point.
+
+    Args:
+        latitude (float): The geographical latitude.
+        longitude (float): The geographical longitude.
+
+    Returns:
+        ColumnElement[float]: The SQL expression of the distance
+            of the airport in kilometres.
+    """
+
+    half_dlat = func.radians(airport_table.c.latitude - latitude) * 0.5
+    half_dlon = func.radians(airport_table.c.longitude - longitude) * 0.5
 
-        return await database.fetch_one(query)
+    return 2 * EARTH_RADIUS_KM * func.asin(func.least(1.0, func.sqrt(
+        func.power(func.sin(half_dlat), 2)
+        + func.cos(func.radians(latitude))
+        * func.cos(func.radians(airport_table.c.latitude))
+        * func.power(func.sin(half_dlon), 2)
+    )))
@@ -1,47 +1,93 @@
 """Module containing airport repository implementation."""
 
-from typing import Iterable
+from typing import AsyncIterator, Iterable, Sequence
 
 from airportapi.core.repositories.iairport import IAirportRepository
 from airportapi.core.domain.airport import Airport, AirportIn
+from airportapi.core.domain.page import PageRequest
+from airportapi.infrastructure.repositories import db as storage
 from airportapi.infrastructure.repositories.db import airports
 
 
 class AirportMockRepository(IAirportRepository):
     """A class representing continent repository."""
 
-    async def get_all_airports(self) -> Iterable[Airport]:
+    async def get_all_airports(
+        self,
+        page: PageRequest | None = None,
+    ) -> Iterable[Airport]:
         """The method getting all airports from the data storage.
 
+        Args:
+            page (PageRequest | None, optional): The requested keyset
+                page. Defaults to None, which means all airports ordered
+                by name.
+
         Returns:
             Iterable[Airport]: Airports in the data storage.
         """
 
-        return airports
+        return self._paginate(airports, page)
+
+    async def iterate_all_airports(self) -> AsyncIterator[bytes]:
+        """The method iterating all airports encoded as JSON.
+
+        Yields:
+            bytes: The JSON document of the airport.
+        """
+
+        for airport in airports:
+            yield airport.model_dump_json().encode()
+
+    async def get_icao_codes(self) -> Iterable[str]:
+        """The method getting ICAO codes of all airports.
 
-    async def get_by_country(self, country_id: int) -> Iterable[Airport]:
+        Returns:
+            Iterable[str]: The ICAO codes.
+        """
+
+        return [airport.icao_code for airport in airports]
+
+    async def get_by_country(
+        self,
+        country_id: int,
+        page: PageRequest | None = None,
+    ) -> Iterable[Airport]:
         """The method getting airports assigned to particular country.
 
         Args:
             country_id (int): The id of the country.
+            page (PageRequest | None, optional): The requested keyset
+                page. Defaults to None, which means all airports ordered
+                by name.
 
         Returns:
             Iterable[Airport]: Airports assigned to a country.
         """
 
-        return list(filter(lambda x: x.country_id == country_id, airports))
+        return self._paginate(
+            [obj for obj in airports if obj.country_id == country_id],
+            page,
+        )
 
-    async def get_by_continent(self, continent_id: int) -> Iterable[Airport]:
+    async def get_by_continent(
+        self,
+        continent_id: int,
+        page: PageRequest | None = None,
+    ) -> Iterable[Airport]:
         """The method getting airports assigned to particular continent.
 
         Args:
             continent_id (int): The id of the continent.
+            page (PageRequest | None, optional): The requested keyset
+                page. Defaults to None, which means all airports ordered
+                by name.
 
         Returns:
             Iterable[Airport]: Airports assigned to a continent.
         """
 
-        return airports
+        return self._paginate(airports, page)
 
     async def get_by_id(self, airport_id: int) -> Airport | None:
         """The method getting airport by provided id.
@@ -85,6 +131,48 @@ class AirportMockRepository(IAirportRepository):
             None,
         )
 
+    async def get_by_icao_codes(
+        self,
+        icao_codes: Sequence[str],
+    ) -> dict[str, Airport]:
+        """The method getting airports by provided ICAO codes.
+
+        Args:
+            icao_codes (Sequence[str]): The ICAO codes of the airports.
+
+        Returns:
+            dict[str, Airport]: The airport details by the found codes.
+        """
+
+        codes = set(icao_codes)
+
+        return {
+            obj.icao_code: obj
+            for obj in reversed(airports)
+            if obj.icao_code in codes
+        }
+
+    async def get_by_iata_codes(
+        self,
+        iata_codes: Sequence[str],
+    ) -> dict[str, Airport]:
+        """The method getting airports by provided IATA codes.
+
+        Args:
+            iata_codes (Sequence[str]): The IATA codes of the airports.
+
+        Returns:
+            dict[str, Airport]: The airport details by the found codes.
+        """
+
+        codes = set(iata_codes)
+
+        return {
+            obj.iata_code: obj
+            for obj in reversed(airports)
+            if obj.iata_code in codes
+        }
+
     async def get_by_user(self, user_id: int) -> Iterable[Airport]:
         """The method getting airports by user who added them.
 
@@ -116,6 +204,46 @@ class AirportMockRepository(IAirportRepository):
 
         return airports
 
+    async def get_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        count: int,
+    ) -> Iterable[Airport]:
+        """The method getting airports closest to the provided location.
+
+        Args:
+            latitude (float): The geographical latitude.
+            longitude (float): The geographical longitude.
+            count (int): The number of airports to find.
+
+        Returns:
+            Iterable[Airport]: The result airport collection.
+        """
+
+        return airports[:count]
+
+    async def get_along_route(
+        self,
+        start: tuple[float, float],
+        end: tuple[float, float],
+        width: float,
+    ) -> Iterable[Airport]:
+        """The method getting airports close to the great-circle route.
+
+        Args:
+            start (tuple[float, float]): The latitude and longitude
+                of the start.
+            end (tuple[float, float]): The latitude and longitude
+                of the end.
+            width (float): The maximal distance from the route.
+
+        Returns:
+            Iterable[Airport]: The result airport collection.
+        """
+
+        return []
+
     async def add_airport(self, data: AirportIn) -> None:
         """The method adding new airport to the data storage.
 
@@ -128,6 +256,29 @@ class AirportMockRepository(IAirportRepository):
 
         airports.append(data)
 
+    async def upsert_airports(self, airports: Sequence[AirportIn]) -> int:
+        """The method adding or replacing airports by their ICAO codes.
+
+        Args:
+            airports (Sequence[AirportIn]): The airports with unique
+                ICAO codes.
+
+        Returns:
+            int: The number of added or updated airports.
+        """
+
+        stored = storage.airports
+
+        for data in airports:
+            for index, airport in enumerate(stored):
+                if airport.icao_code == data.icao_code:
+                    stored[index] = data
+                    break
+            else:
+                stored.append(data)
+
+        return len(airports)
+
     async def update_airport(
         self,
         airport_id: int,
@@ -167,3 +318,32 @@ class AirportMockRepository(IAirportRepository):
             return True
 
         return False
+
+    @staticmethod
+    def _paginate(
+        data: list[Airport],
+        page: PageRequest | None,
+    ) -> list[Airport]:
+        """A private method cutting the requested keyset page.
+
+        Args:
+            data (list[Airport]): The airports.
+            page (PageRequest | None): The requested keyset page.
+
+        Returns:
+            list[Airport]: The airports of the page.
+        """
+
+        if page is None:
+            return data
+
+        def key(airport: Airport) -> tuple:
+            return getattr(airport, page.sort), getattr(airport, "id", 0)
+
+        return [
+            airport
+            for airport in sorted(data, key=key, reverse=page.descending)
+            if page.after is None
+            or (key(airport) < page.after if page.descending
+                else key(airport) > page.after)
+        ][:page.limit]
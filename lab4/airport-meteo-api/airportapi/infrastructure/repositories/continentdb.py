@@ -3,15 +3,46 @@
 from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
+from sqlalchemy import bindparam
 
 from airportapi.core.domain.location import Continent, ContinentIn
 from airportapi.core.repositories.icontinent import IContinentRepository
-from airportapi.db import continent_table, database
+from airportapi.db import continent_table, database, replica
+from airportapi.infrastructure.repositories.invalidation import \
+    InvalidationPublisher
+from airportapi.infrastructure.repositories.reference import ReferenceData
+from airportapi.utils.statements import register
+
+CONTINENT_BY_ID = register(
+    "continent_by_id",
+    continent_table.select()
+    .where(continent_table.c.id == bindparam("continent_id")),
+)
 
 
 class ContinentRepository(IContinentRepository):
     """A class implementing the continent repository."""
 
+    _reference: ReferenceData
+    _publisher: InvalidationPublisher
+
+    def __init__(
+        self,
+        reference: ReferenceData,
+        publisher: InvalidationPublisher,
+    ) -> None:
+        """The initializer of the `continent repository`.
+
+        Args:
+            reference (ReferenceData): The in-memory map of countries,
+                refreshed after every change.
+            publisher (InvalidationPublisher): The announcer of changes
+                to the other processes.
+        """
+
+        self._reference = reference
+        self._publisher = publisher
+
     async def get_continent_by_id(self, continent_id: int) -> Any | None:
         """The method getting a continent from the data storage.
 
@@ -34,7 +65,7 @@ class ContinentRepository(IContinentRepository):
         """
 
         query = continent_table.select().order_by(continent_table.c.name.asc())
-        continents = await database.fetch_all(query)
+        continents = await replica.fetch_all(query)
 
         return [Continent(**dict(continent)) for continent in continents]
 
@@ -48,11 +79,20 @@ class ContinentRepository(IContinentRepository):
             Any | None: The newly created continent.
         """
 
-        query = continent_table.insert().values(**data.model_dump())
-        new_continent_id = await database.execute(query)
-        new_continent = await self._get_by_id(new_continent_id)
+        query = (
+            continent_table.insert()
+            .values(**data.model_dump())
+            .returning(continent_table)
+        )
+        new_continent = await database.fetch_one(query)
+
+        if not new_continent:
+            return None
 
-        return Continent(**dict(new_continent)) if new_continent else None
+        await self._reference.load()
+        await self._publisher.publish("continent", new_continent["id"])
+
+        return Continent(**dict(new_continent))
 
     async def update_continent(
         self,
@@ -69,19 +109,21 @@ class ContinentRepository(IContinentRepository):
             Any | None: The updated continent.
         """
 
-        if self._get_by_id(continent_id):
-            query = (
-                continent_table.update()
-                .where(continent_table.c.id == continent_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
+        query = (
+            continent_table.update()
+            .where(continent_table.c.id == continent_id)
+            .values(**data.model_dump())
+            .returning(continent_table)
+        )
+        continent = await database.fetch_one(query)
 
-            continent = await self._get_by_id(continent_id)
+        if not continent:
+            return None
 
-            return Continent(**dict(continent)) if continent else None
+        await self._reference.load()
+        await self._publisher.publish("continent", continent_id)
 
-        return None
+        return Continent(**dict(continent))
 
     async def delete_continent(self, continent_id: int) -> bool:
         """The method updating removing continent from the data storage.
@@ -93,15 +135,19 @@ class ContinentRepository(IContinentRepository):
             bool: Success of the operation.
         """
 
-        if self._get_by_id(continent_id):
-            query = continent_table \
-                .delete() \
-                .where(continent_table.c.id == continent_id)
-            await database.execute(query)
+        query = (
+            continent_table.delete()
+            .where(continent_table.c.id == continent_id)
+            .returning(continent_table.c.id)
+        )
+
+        if await database.fetch_val(query) is None:
+            return False
 
-            return True
+        await self._reference.load()
+        await self._publisher.publish("continent", continent_id)
 
-        return False
+        return True
 
     async def _get_by_id(self, continent_id: int) -> Record | None:
         """A private method getting continent from the DB based on its ID.
@@ -113,10 +159,6 @@ class ContinentRepository(IContinentRepository):
             Any | None: Continent record if exists.
         """
 
-        query = (
-            continent_table.select()
-            .where(continent_table.c.id == continent_id)
-            .order_by(continent_table.c.name.asc())
-        )
+        query = CONTINENT_BY_ID.bind(continent_id=continent_id)
 
         return await database.fetch_one(query)
@@ -3,15 +3,46 @@
 from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
+from sqlalchemy import bindparam
 
 from airportapi.core.domain.location import Country, CountryIn
 from airportapi.core.repositories.icountry import ICountryRepository
-from airportapi.db import country_table, database
+from airportapi.db import country_table, database, replica
+from airportapi.infrastructure.repositories.invalidation import \
+    InvalidationPublisher
+from airportapi.infrastructure.repositories.reference import ReferenceData
+from airportapi.utils.statements import register
+
+COUNTRY_BY_ID = register(
+    "country_by_id",
+    country_table.select()
+    .where(country_table.c.id == bindparam("country_id")),
+)
 
 
 class CountryMockRepository(ICountryRepository):
     """A class implementing the database country repository."""
 
+    _reference: ReferenceData
+    _publisher: InvalidationPublisher
+
+    def __init__(
+        self,
+        reference: ReferenceData,
+        publisher: InvalidationPublisher,
+    ) -> None:
+        """The initializer of the `country repository`.
+
+        Args:
+            reference (ReferenceData): The in-memory map of countries,
+                refreshed after every change.
+            publisher (InvalidationPublisher): The announcer of changes
+                to the other processes.
+        """
+
+        self._reference = reference
+        self._publisher = publisher
+
     async def get_country_by_id(self, country_id: int) -> Any | None:
         """The method getting a country from the temporary data storage.
 
@@ -34,7 +65,7 @@ class CountryMockRepository(ICountryRepository):
         """
 
         query = country_table.select().order_by(country_table.c.name.asc())
-        countries = await database.fetch_all(query)
+        countries = await replica.fetch_all(query)
 
         return [Country(**dict(country)) for country in countries]
 
@@ -56,7 +87,7 @@ class CountryMockRepository(ICountryRepository):
             .select() \
             .where(country_table.c.continent_id == continent_id) \
             .order_by(country_table.c.name.asc())
-        countries = await database.fetch_all(query)
+        countries = await replica.fetch_all(query)
 
         return [Country(**dict(country)) for country in countries]
 
@@ -70,11 +101,20 @@ class CountryMockRepository(ICountryRepository):
             Any | None: The newly created country.
         """
 
-        query = country_table.insert().values(**data.model_dump())
-        new_country_id = await database.execute(query)
-        new_country = await self._get_by_id(new_country_id)
+        query = (
+            country_table.insert()
+            .values(**data.model_dump())
+            .returning(country_table)
+        )
+        new_country = await database.fetch_one(query)
+
+        if not new_country:
+            return None
+
+        await self._reference.load()
+        await self._publisher.publish("country", new_country["id"])
 
-        return Country(**dict(new_country)) if new_country else None
+        return Country(**dict(new_country))
 
     async def update_country(
             self,
@@ -91,19 +131,21 @@ class CountryMockRepository(ICountryRepository):
             Any | None: The updated country.
         """
 
-        if self._get_by_id(country_id):
-            query = (
-                country_table.update()
-                .where(country_table.c.id == country_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
+        query = (
+            country_table.update()
+            .where(country_table.c.id == country_id)
+            .values(**data.model_dump())
+            .returning(country_table)
+        )
+        country = await database.fetch_one(query)
 
-            country = await self._get_by_id(country_id)
+        if not country:
+            return None
 
-            return Country(**dict(country)) if country else None
+        await self._reference.load()
+        await self._publisher.publish("country", country_id)
 
-        return None
+        return Country(**dict(country))
 
     async def delete_country(self, country_id: int) -> bool:
         """The abstract updating removing country from the data storage.
@@ -112,15 +154,19 @@ class CountryMockRepository(ICountryRepository):
             country_id (int): The country id.
         """
 
-        if self._get_by_id(country_id):
-            query = country_table \
-                .delete() \
-                .where(country_table.c.id == country_id)
-            await database.execute(query)
+        query = (
+            country_table.delete()
+            .where(country_table.c.id == country_id)
+            .returning(country_table.c.id)
+        )
 
-            return True
+        if await database.fetch_val(query) is None:
+            return False
 
-        return False
+        await self._reference.load()
+        await self._publisher.publish("country", country_id)
+
+        return True
 
     async def _get_by_id(self, country_id: int) -> Record | None:
         """A private method getting country from the DB based on its ID.
@@ -132,10 +178,6 @@ class CountryMockRepository(ICountryRepository):
             Any | None: Country record if exists.
         """
 
-        query = (
-            country_table.select()
-            .where(country_table.c.id == country_id)
-            .order_by(country_table.c.name.asc())
-        )
+        query = COUNTRY_BY_ID.bind(country_id=country_id)
 
         return await database.fetch_one(query)
@@ -0,0 +1,319 @@
+"""Module containing the cross-process invalidation of cached data."""
+
+import asyncio
+import contextlib
+import inspect
+import logging
+import uuid
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+import asyncpg  # type: ignore
+import orjson
+from sqlalchemy import bindparam, func, select
+
+from airportapi.db import database
+from airportapi.utils.pool import PooledDatabase
+from airportapi.utils.statements import register
+
+logger = logging.getLogger(__name__)
+
+EntityId = int | Sequence[str]
+Handler = Callable[[Optional[EntityId]], Awaitable[None] | None]
+
+ORIGIN = uuid.uuid4().hex
+# Keeps the payload well below the 8000 bytes limit of `pg_notify`.
+MAX_PAYLOAD_KEYS = 500
+NOTIFY = register(
+    "notify",
+    select(func.pg_notify(bindparam("channel"), bindparam("payload"))),
+)
+
+
+class InvalidationPublisher:
+    """A class announcing changed entities to the other processes.
+
+    The notification is sent with `pg_notify`, so it is delivered only
+    when the change is committed. The listeners of this process are
+    called first, even if the notifications are disabled.
+    """
+
+    _channel: str
+    _enabled: bool
+    _listeners: tuple[Callable[[], Awaitable[None]], ...]
+
+    def __init__(
+        self,
+        channel: str,
+        enabled: bool = True,
+        listeners: Iterable[Callable[[], Awaitable[None]]] = (),
+    ) -> None:
+        """The initializer of the `invalidation publisher`.
+
+        Args:
+            channel (str): The name of the notification channel.
+            enabled (bool, optional): Whether the notifications are sent.
+                Defaults to True.
+            listeners (Iterable[Callable[[], Awaitable[None]]], optional):
+                The callbacks awaited after every change, e.g. reloading
+                the table versions. Defaults to ().
+        """
+
+        self._channel = channel
+        self._enabled = enabled
+        self._listeners = tuple(listeners)
+
+    async def publish(
+        self,
+        entity: str,
+        entity_id: Optional[EntityId],
+    ) -> None:
+        """The method announcing the change of the entity.
+
+        Long sequences of keys are split into several notifications.
+
+        Args:
+            entity (str): The type of the entity, e.g. `airport`.
+            entity_id (Optional[EntityId]): The id of the entity,
+                the keys of the changed entities, e.g. ICAO codes of
+                stations, or None if many entities of the type changed.
+        """
+
+        for listener in self._listeners:
+            await listener()
+
+        if not self._enabled:
+            return
+
+        if isinstance(entity_id, int) or entity_id is None:
+            chunks: list[Optional[EntityId]] = [entity_id]
+        else:
+            keys = list(entity_id)
+            chunks = [
+                keys[start:start + MAX_PAYLOAD_KEYS]
+                for start in range(0, len(keys), MAX_PAYLOAD_KEYS)
+            ]
+
+        for chunk in chunks:
+            payload = orjson.dumps({
+                "origin": ORIGIN,
+                "entity": entity,
+                "id": chunk,
+            }).decode()
+
+            await database.execute(
+                NOTIFY.bind(channel=self._channel, payload=payload)
+            )
+
+
+class InvalidationListener:
+    """A class evicting cached data changed by the other processes.
+
+    The listener holds one dedicated connection outside of the pool.
+    Notifications of this process are skipped, since its caches were
+    already updated by the write itself. Notifications sent while the
+    connection was lost are gone, so after reconnecting all handlers
+    are called as if every entity changed.
+    """
+
+    _database: PooledDatabase
+    _channel: str
+    _handlers: Mapping[str, tuple[Handler, ...]]
+    _retry_interval: float
+    _heartbeat_interval: float
+    _task: asyncio.Task | None
+    _pending: set[asyncio.Future]
+
+    def __init__(
+        self,
+        database: PooledDatabase,
+        channel: str,
+        handlers: Mapping[str, Iterable[Handler]],
+        retry_interval: float = 5.0,
+        heartbeat_interval: float = 30.0,
+    ) -> None:
+        """The initializer of the `invalidation listener`.
+
+        Args:
+            database (PooledDatabase): The database to listen on.
+            channel (str): The name of the notification channel.
+            handlers (Mapping[str, Iterable[Handler]]): The handlers
+                by the entity types, called with the id or the keys
+                of the changed entities, or None if all entities
+                of the type may have changed.
+            retry_interval (float, optional): The delay of reconnecting
+                in seconds. Defaults to 5.0.
+            heartbeat_interval (float, optional): The time between checks
+                of the connection in seconds. Defaults to 30.0.
+        """
+
+        self._database = database
+        self._channel = channel
+        self._handlers = {
+            entity: tuple(entity_handlers)
+            for entity, entity_handlers in handlers.items()
+        }
+        self._retry_interval = retry_interval
+        self._heartbeat_interval = heartbeat_interval
+        self._task = None
+        self._pending = set()
+
+    def start(self) -> None:
+        """The method starting the listener in the background."""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(
+                self._run(),
+                name="invalidation-listener",
+            )
+
+    async def stop(self) -> None:
+        """The method stopping the listener and its handlers."""
+
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def dispatch(self, entity: str, entity_id: Optional[EntityId]) -> None:
+        """The method calling the handlers of the changed entity.
+
+        Args:
+            entity (str): The type of the entity.
+            entity_id (Optional[EntityId]): The id or the keys of the
+                changed entities, None if all entities of the type may
+                have changed.
+        """
+
+        for handler in self._handlers.get(entity, ()):
+            result = handler(entity_id)
+
+            if inspect.isawaitable(result):
+                future = asyncio.ensure_future(result)
+                self._pending.add(future)
+                future.add_done_callback(self._finish)
+
+    async def _run(self) -> None:
+        """A private method keeping the listening connection open."""
+
+        reconnect = False
+
+        while True:
+            try:
+                await self._listen(reconnect)
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) \
+                    as error:
+                logger.warning("Invalidation listener failed: %s", error)
+            else:
+                logger.warning("Invalidation listener lost the connection")
+
+            reconnect = True
+            await asyncio.sleep(self._retry_interval)
+
+    async def _listen(self, reconnect: bool) -> None:
+        """A private method listening until the connection is lost.
+
+        The connection is checked periodically, so a silently dropped
+        one is noticed as well.
+
+        Args:
+            reconnect (bool): Whether notifications might have been
+                missed since the previous connection.
+        """
+
+        connection = await self._connect()
+        closed = asyncio.Event()
+        connection.add_termination_listener(lambda _: closed.set())
+
+        try:
+            await connection.add_listener(self._channel, self._notify)
+
+            if reconnect:
+                for entity in self._handlers:
+                    self.dispatch(entity, None)
+
+            while not closed.is_set():
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        closed.wait(),
+                        timeout=self._heartbeat_interval,
+                    )
+
+                if not closed.is_set():
+                    await connection.execute(
+                        "SELECT 1",
+                        timeout=self._heartbeat_interval,
+                    )
+        finally:
+            with contextlib.suppress(Exception):
+                await connection.close(timeout=self._retry_interval)
+
+    async def _connect(self) -> Any:
+        """A private method opening the listening connection.
+
+        Returns:
+            Any: The asyncpg connection.
+        """
+
+        url = self._database.url
+
+        return await asyncpg.connect(
+            host=url.hostname,
+            port=url.port,
+            user=url.username,
+            password=url.password,
+            database=url.database,
+        )
+
+    def _notify(
+        self,
+        connection: Any,
+        pid: int,
+        channel: str,
+        payload: str,
+    ) -> None:
+        """A private method handling the notification.
+
+        Args:
+            connection (Any): The listening connection.
+            pid (int): The id of the notifying server process.
+            channel (str): The name of the channel.
+            payload (str): The JSON document of the changed entity.
+        """
+
+        try:
+            message = orjson.loads(payload)
+            origin, entity = message["origin"], message["entity"]
+            entity_id = message["id"]
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            logger.warning("Invalid invalidation message: %s", payload)
+            return
+
+        if origin != ORIGIN:
+            self.dispatch(entity, entity_id)
+
+    def _finish(self, future: asyncio.Future) -> None:
+        """A private method forgetting the finished handler.
+
+        Args:
+            future (asyncio.Future): The finished handler.
+        """
+
+        self._pending.discard(future)
+
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(
+                "Invalidation handler failed: %s",
+                future.exception(),
+            )
@@ -0,0 +1,128 @@
+"""Module containing the in-memory map of the latest observations."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional, Sequence
+
+from sqlalchemy import ARRAY, DateTime, String, any_, bindparam, select, true
+
+from airportapi.core.domain.observation import Observation, ObservationIn
+from airportapi.db import airport_table, database, observation_table
+from airportapi.utils.statements import register
+
+_recent = (
+    select(observation_table)
+    .where(observation_table.c.icao_code == airport_table.c.icao_code)
+    .where(
+        observation_table.c.observation_time
+        >= bindparam("since", type_=DateTime(timezone=True))
+    )
+    .order_by(observation_table.c.observation_time.desc())
+    .limit(1)
+    .lateral()
+)
+_latest = select(_recent).select_from(airport_table.join(_recent, true()))
+LATEST_OBSERVATIONS = register("latest_observations", _latest)
+LATEST_OBSERVATIONS_OF_STATIONS = register(
+    "latest_observations_of_stations",
+    _latest.where(
+        airport_table.c.icao_code
+        == any_(bindparam("codes", type_=ARRAY(String)))
+    ),
+)
+
+
+class LatestObservations:
+    """A class holding the latest observation of every station in memory.
+
+    The map is warmed from the observations of the recent window, read
+    with one index lookup per airport, and updated with every ingested
+    batch. Observations stored by other processes are reloaded only
+    for the announced stations. Reloads are merged into the map, so an
+    observation ingested meanwhile is never replaced by an older one.
+    """
+
+    _window: float
+    _observations: dict[str, ObservationIn]
+
+    def __init__(self, window: float = 86400.0) -> None:
+        """The initializer of the `latest observations`.
+
+        Args:
+            window (float, optional): The age in seconds of the oldest
+                observation loaded from the DB. Defaults to 86400.0.
+        """
+
+        self._window = window
+        self._observations = {}
+
+    def __len__(self) -> int:
+        """The method returning number of stations with an observation.
+
+        Returns:
+            int: The number of stations.
+        """
+
+        return len(self._observations)
+
+    def get(self, icao_code: str) -> ObservationIn | None:
+        """The method getting the latest observation of the station.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+
+        Returns:
+            ObservationIn | None: The observation if known.
+        """
+
+        return self._observations.get(icao_code)
+
+    def update(self, observations: Iterable[ObservationIn]) -> None:
+        """The method keeping the observations newer than the known ones.
+
+        Args:
+            observations (Iterable[ObservationIn]): The observations.
+        """
+
+        for observation in observations:
+            known = self._observations.get(observation.icao_code)
+
+            if known is None \
+                    or known.observation_time < observation.observation_time:
+                self._observations[observation.icao_code] = observation
+
+    async def load(self, icao_codes: Optional[Sequence[str]] = None) -> None:
+        """The method reading the latest observations from the DB.
+
+        Args:
+            icao_codes (Optional[Sequence[str]], optional): The ICAO codes
+                of the stations to read. Defaults to None, which means
+                all stations.
+        """
+
+        since = datetime.now(timezone.utc) - timedelta(seconds=self._window)
+        records = await database.fetch_all(
+            LATEST_OBSERVATIONS.bind(since=since)
+            if icao_codes is None else
+            LATEST_OBSERVATIONS_OF_STATIONS.bind(
+                since=since,
+                codes=list(icao_codes),
+            )
+        )
+        self.update(
+            Observation.model_construct(**record._mapping)
+            for record in records
+        )
+
+    async def invalidate(
+        self,
+        entity_id: Optional[Sequence[str]] = None,
+    ) -> None:
+        """The method reloading observations stored by another process.
+
+        Args:
+            entity_id (Optional[Sequence[str]], optional): The ICAO codes
+                of the stations with new observations. Defaults to None,
+                which means all stations are reloaded.
+        """
+
+        await self.load(entity_id)
@@ -0,0 +1,389 @@
+"""Module containing observation repository implementation."""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Iterable
+
+from sqlalchemy import (
+    Select,
+    Table,
+    func,
+    literal,
+    select,
+    tuple_,
+    union_all,
+)
+
+from airportapi.core.domain.observation import Observation, ObservationIn
+from airportapi.core.repositories.iobservation import IObservationRepository
+from airportapi.db import (
+    ROLLUP_METRICS,
+    daily_rollup_table,
+    database,
+    hourly_rollup_table,
+    observation_months,
+    observation_partition_ddl,
+    observation_table,
+    replica,
+    rollup_upsert_sql,
+)
+from airportapi.infrastructure.repositories.invalidation import \
+    InvalidationPublisher
+
+COLUMNS = tuple(
+    column.name
+    for column in observation_table.columns
+    if column.name != "id"
+)
+STAGING_TABLE = "observations_staging"
+HOUR = timedelta(hours=1)
+DAY = timedelta(days=1)
+HOURLY_ROLLUP_SQL = rollup_upsert_sql(hourly_rollup_table, "hour", "inserted")
+DAILY_ROLLUP_SQL = rollup_upsert_sql(daily_rollup_table, "day", "inserted")
+
+
+class ObservationRepository(IObservationRepository):
+    """A class implementing the observation DB repository."""
+
+    _partitions: set[date]
+    _publisher: InvalidationPublisher
+
+    def __init__(self, publisher: InvalidationPublisher) -> None:
+        """The initializer of the `observation repository`.
+
+        Args:
+            publisher (InvalidationPublisher): The announcer of stored
+                observations to the other processes.
+        """
+
+        self._partitions = set()
+        self._publisher = publisher
+
+    async def add_observations(
+        self,
+        observations: Iterable[ObservationIn],
+    ) -> int:
+        """The method adding a batch of observations to the data storage.
+
+        Missing monthly partitions are created first. The batch is
+        streamed with `COPY` into a per-connection temporary
+        staging table and moved to the observations table with a single
+        statement, skipping reports already stored for the same station
+        and time. The same statement merges the new observations into
+        the hourly and daily rollups.
+
+        Args:
+            observations (Iterable[ObservationIn]): The observations.
+
+        Returns:
+            int: The number of newly stored observations.
+        """
+
+        observations = list(observations)
+        records = [
+            tuple(getattr(observation, column) for column in COLUMNS)
+            for observation in observations
+        ]
+
+        if not records:
+            return 0
+
+        columns = ", ".join(COLUMNS)
+
+        async with database.connection() as connection:
+            async with connection.transaction():
+                raw_connection = connection.raw_connection
+
+                for month in observation_months(
+                    observation.observation_time
+                    for observation in observations
+                ) - self._partitions:
+                    await raw_connection.execute(
+                        observation_partition_ddl(month)
+                    )
+                    self._partitions.add(month)
+
+                await raw_connection.execute(
+                    f"CREATE TEMPORARY TABLE IF NOT EXISTS {STAGING_TABLE} "
+                    f"ON COMMIT DELETE ROWS AS SELECT {columns} "
+                    f"FROM {observation_table.name} WITH NO DATA"
+                )
+                await raw_connection.execute(f"TRUNCATE {STAGING_TABLE}")
+                await raw_connection.copy_records_to_table(
+                    STAGING_TABLE,
+                    records=records,
+                    columns=COLUMNS,
+                )
+                stored, stations = await raw_connection.fetchrow(
+                    f"WITH inserted AS ("
+                    f"INSERT INTO {observation_table.name} ({columns}) "
+                    f"SELECT {columns} FROM {STAGING_TABLE} "
+                    "ON CONFLICT (icao_code, observation_time) DO NOTHING "
+                    f"RETURNING {columns}), "
+                    f"hourly AS ({HOURLY_ROLLUP_SQL}), "
+                    f"daily AS ({DAILY_ROLLUP_SQL}) "
+                    "SELECT count(*), array_agg(DISTINCT icao_code) "
+                    "FROM inserted"
+                )
+
+        if stored:
+            await self._publisher.publish("observation", stations)
+
+        return stored
+
+    async def iterate_by_icao(
+        self,
+        icao_code: str,
+        start: datetime,
+        end: datetime,
+        after: tuple[datetime, int] | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[Observation]:
+        """The method iterating observations of the station in the period.
+
+        Rows are read through a server-side cursor, so the period is never
+        loaded into memory at once. The period bounds prune the partitions
+        and `after` continues on (observation_time, id) instead of OFFSET.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+            start (datetime): The beginning of the period (inclusive).
+            end (datetime): The end of the period (exclusive).
+            after (tuple[datetime, int] | None, optional): The observation
+                time and id of the last already received observation.
+                Defaults to None.
+            limit (int | None, optional): The maximal number
+                of observations. Defaults to None.
+
+        Yields:
+            Observation: The observations ordered by time.
+        """
+
+        query = (
+            observation_table.select()
+            .where(observation_table.c.icao_code == icao_code)
+            .where(observation_table.c.observation_time >= start)
+            .where(observation_table.c.observation_time < end)
+            .order_by(
+                observation_table.c.observation_time.asc(),
+                observation_table.c.id.asc(),
+            )
+            .limit(limit)
+        )
+
+        if after:
+            query = query.where(
+                tuple_(
+                    observation_table.c.observation_time,
+                    observation_table.c.id,
+                ) > tuple_(*map(literal, after))
+            )
+
+        async for observation in replica.iterate(query):
+            yield Observation.model_construct(
+                **observation._mapping  # type: ignore[attr-defined]
+            )
+
+    async def get_stats(
+        self,
+        icao_code: str,
+        start: datetime,
+        end: datetime,
+    ) -> Any | None:
+        """The method aggregating observations of the station in the period.
+
+        Whole days of the period are read from the daily rollups, whole
+        hours around them from the hourly rollups and only the remaining
+        edges from the raw observations.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+            start (datetime): The beginning of the period (inclusive).
+            end (datetime): The end of the period (exclusive).
+
+        Returns:
+            Any | None: The observation count, and count, sum, min and max
+                of every metric.
+        """
+
+        parts = [
+            _aggregate_rollup(table, icao_code, lower, upper)
+            if table is not None
+            else _aggregate_raw(icao_code, lower, upper)
+            for table, lower, upper in _split_period(start, end)
+        ]
+
+        if not parts:
+            return None
+
+        part = union_all(*parts).subquery()
+
+        return await replica.fetch_one(select(*_merge(part.c)))
+
+
+def _split_period(
+    start: datetime,
+    end: datetime,
+) -> list[tuple[Table | None, datetime, datetime]]:
+    """A private function splitting the period by the source of aggregates.
+
+    Args:
+        start (datetime): The beginning of the period, naive times
+            are treated as UTC.
+        end (datetime): The end of the period.
+
+    Returns:
+        list[tuple[Table | None, datetime, datetime]]: The rollup table
+            (None for raw observations) with the bounds of its part.
+    """
+
+    start, end = (
+        time.astimezone(timezone.utc)
+        if time.tzinfo
+        else time.replace(tzinfo=timezone.utc)
+        for time in (start, end)
+    )
+    hour_start = _ceil(start, HOUR)
+    hour_end = _floor(end, HOUR)
+
+    parts: list[tuple[Table | None, datetime, datetime]]
+
+    if hour_start >= hour_end:
+        parts = [(None, start, end)]
+    else:
+        day_start = _ceil(hour_start, DAY)
+        day_end = _floor(hour_end, DAY)
+        parts = [(None, start, hour_start)]
+
+        if day_start < day_end:
+            parts += [
+                (hourly_rollup_table, hour_start, day_start),
+                (daily_rollup_table, day_start, day_end),
+                (hourly_rollup_table, day_end, hour_end),
+            ]
+        else:
+            parts.append((hourly_rollup_table, hour_start, hour_end))
+
+        parts.append((None, hour_end, end))
+
+    return [
+        (table, lower, upper)
+        for table, lower, upper in parts
+        if lower < upper
+    ]
+
+
+def _floor(time: datetime, unit: timedelta) -> datetime:
+    """A private function rounding the UTC time down to the unit.
+
+    Args:
+        time (datetime): The aware UTC time.
+        unit (timedelta): The hour or the day.
+
+    Returns:
+        datetime: The rounded time.
+    """
+
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+    return epoch + (time - epoch) // unit * unit
+
+
+def _ceil(time: datetime, unit: timedelta) -> datetime:
+    """A private function rounding the UTC time up to the unit.
+
+    Args:
+        time (datetime): The aware UTC time.
+        unit (timedelta): The hour or the day.
+
+    Returns:
+        datetime: The rounded time.
+    """
+
+    floor = _floor(time, unit)
+
+    return floor if floor == time else floor + unit
+
+
+def _aggregate_rollup(
+    table: Table,
+    icao_code: str,
+    lower: datetime,
+    upper: datetime,
+) -> Select:
+    """A private function merging rollup buckets of the part of the period.
+
+    Args:
+        table (Table): The hourly or daily rollup table.
+        icao_code (str): The ICAO code of the station.
+        lower (datetime): The first bucket (inclusive).
+        upper (datetime): The end of the last bucket (exclusive).
+
+    Returns:
+        Select: The query with the same columns as the rollup.
+    """
+
+    return (
+        select(*_merge(table.c))
+        .where(table.c.icao_code == icao_code)
+        .where(table.c.bucket >= lower)
+        .where(table.c.bucket < upper)
+    )
+
+
+def _merge(columns: Any) -> list[Any]:
+    """A private function merging rollup columns into one row.
+
+    Args:
+        columns (Any): The columns of the rollup table or subquery.
+
+    Returns:
+        list[Any]: The labelled aggregates.
+    """
+
+    return [
+        func.sum(columns.observations).label("observations"),
+        *(
+            aggregate(columns[f"{metric}_{name}"]).label(f"{metric}_{name}")
+            for metric in ROLLUP_METRICS
+            for name, aggregate in (
+                ("count", func.sum),
+                ("sum", func.sum),
+                ("min", func.min),
+                ("max", func.max),
+            )
+        ),
+    ]
+
+
+def _aggregate_raw(icao_code: str, lower: datetime, upper: datetime) -> Select:
+    """A private function aggregating raw observations of the period edge.
+
+    Args:
+        icao_code (str): The ICAO code of the station.
+        lower (datetime): The beginning of the edge (inclusive).
+        upper (datetime): The end of the edge (exclusive).
+
+    Returns:
+        Select: The query with the same columns as the rollup.
+    """
+
+    return (
+        select(
+            func.count().label("observations"),
+            *(
+                aggregate(observation_table.c[metric]).label(
+                    f"{metric}_{name}"
+                )
+                for metric in ROLLUP_METRICS
+                for name, aggregate in (
+                    ("count", func.count),
+                    ("sum", func.sum),
+                    ("min", func.min),
+                    ("max", func.max),
+                )
+            ),
+        )
+        .where(observation_table.c.icao_code == icao_code)
+        .where(observation_table.c.observation_time >= lower)
+        .where(observation_table.c.observation_time < upper)
+    )
@@ -0,0 +1,126 @@
+"""Module containing the in-memory continent and country reference map."""
+
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+from airportapi.core.domain.location import Continent
+from airportapi.db import continent_table, country_table, database
+from airportapi.infrastructure.dto.countrydto import CountryDTO
+
+
+class ReferenceData:
+    """A class holding continents and countries in memory.
+
+    The tables are tiny and rarely change, so airports are read without
+    joining them and get the shared country objects attached by id.
+    Every load builds a new read-only snapshot, which is swapped in
+    at once, so readers never see a partially refreshed map. The shared
+    objects must not be mutated.
+    """
+
+    _countries: Mapping[int, CountryDTO]
+    _documents: Mapping[int, dict[str, Any]]
+    _loaded: bool
+    _listeners: tuple[Callable[[], None], ...]
+
+    def __init__(self, listeners: Iterable[Callable[[], None]] = ()) -> None:
+        """The initializer of the `reference data`.
+
+        Args:
+            listeners (Iterable[Callable[[], None]], optional): The callbacks
+                called when a load changes the map, e.g. clearing caches
+                of objects holding the replaced countries. Defaults to ().
+        """
+
+        self._countries = MappingProxyType({})
+        self._documents = MappingProxyType({})
+        self._loaded = False
+        self._listeners = tuple(listeners)
+
+    @property
+    def countries(self) -> Mapping[int, CountryDTO]:
+        """The property returning the countries by their ids.
+
+        Returns:
+            Mapping[int, CountryDTO]: The read-only map of the countries.
+        """
+
+        return self._countries
+
+    def country(self, country_id: int) -> CountryDTO | None:
+        """The method getting the country with its continent.
+
+        Args:
+            country_id (int): The id of the country.
+
+        Returns:
+            CountryDTO | None: The shared country object if known.
+        """
+
+        return self._countries.get(country_id)
+
+    def country_document(self, country_id: int) -> dict[str, Any] | None:
+        """The method getting the country as a JSON-ready dictionary.
+
+        Args:
+            country_id (int): The id of the country.
+
+        Returns:
+            dict[str, Any] | None: The shared country document if known.
+        """
+
+        return self._documents.get(country_id)
+
+    async def load(self) -> None:
+        """The method reading continents and countries from the DB."""
+
+        continents = {
+            record["id"]: Continent(**dict(record))
+            for record in await database.fetch_all(continent_table.select())
+        }
+        countries = {
+            record["id"]: CountryDTO(
+                id=record["id"],
+                name=record["name"],
+                alias=record["alias"],
+                continent=continents[record["continent_id"]],
+            )
+            for record in await database.fetch_all(country_table.select())
+        }
+
+        changed = self._loaded and countries != self._countries
+        self._documents = MappingProxyType({
+            country_id: country.model_dump()
+            for country_id, country in countries.items()
+        })
+        self._countries = MappingProxyType(countries)
+        self._loaded = True
+
+        if changed:
+            for listener in self._listeners:
+                listener()
+
+    async def invalidate(self, entity_id: Optional[int] = None) -> None:
+        """The method reloading the map changed by another process.
+
+        Args:
+            entity_id (Optional[int], optional): The id of the changed
+                continent or country, unused since the map is reloaded
+                as a whole. Defaults to None.
+        """
+
+        await self.load()
+
+    async def ensure(self, country_ids: Iterable[int]) -> None:
+        """The method loading the map if it misses any of the countries.
+
+        Countries added by other processes are picked up this way.
+
+        Args:
+            country_ids (Iterable[int]): The ids of the needed countries.
+        """
+
+        if not self._loaded or any(
+            country_id not in self._countries for country_id in country_ids
+        ):
+            await self.load()
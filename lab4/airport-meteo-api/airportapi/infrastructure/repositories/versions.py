@@ -0,0 +1,73 @@
+"""Module containing the in-memory versions of the reference tables."""
+
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from sqlalchemy import select
+
+from airportapi.db import database, table_version_table
+from airportapi.utils.statements import register
+
+TABLE_VERSIONS = register("table_versions", select(table_version_table))
+
+
+class TableVersions:
+    """A class holding the write counters of the reference tables.
+
+    The counters are bumped by triggers on every write statement, so
+    a conditional request is answered from memory without querying
+    the tables. They are reloaded after writes of this process and on
+    changes announced by the other ones. The primary database is read,
+    since a lagging replica could report an older version.
+    """
+
+    _versions: Mapping[str, int]
+
+    def __init__(self) -> None:
+        """The initializer of the `table versions`."""
+
+        self._versions = MappingProxyType({})
+
+    @property
+    def versions(self) -> Mapping[str, int]:
+        """The property returning the versions by the table names.
+
+        Returns:
+            Mapping[str, int]: The read-only map of the versions.
+        """
+
+        return self._versions
+
+    async def load(self) -> None:
+        """The method reading the versions from the DB."""
+
+        records = await database.fetch_all(TABLE_VERSIONS.bind())
+        self._versions = MappingProxyType({
+            record["table_name"]: record["version"] for record in records
+        })
+
+    async def invalidate(self, entity_id: Optional[int] = None) -> None:
+        """The method reloading the versions changed by another process.
+
+        Args:
+            entity_id (Optional[int], optional): The id of the changed
+                entity, unused since all versions are reloaded.
+                Defaults to None.
+        """
+
+        await self.load()
+
+    def etag(self, *tables: str) -> str:
+        """The method building the strong entity tag of the tables.
+
+        Args:
+            *tables (str): The names of the tables the response is read
+                from.
+
+        Returns:
+            str: The quoted tag changing with any of the tables.
+        """
+
+        return '"' + "-".join(
+            f"{table}.{self._versions.get(table, 0)}" for table in tables
+        ) + '"'
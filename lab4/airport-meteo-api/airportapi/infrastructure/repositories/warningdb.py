@@ -0,0 +1,88 @@
+"""Module containing warning repository implementation."""
+
+from datetime import datetime
+from typing import Any, Iterable
+
+from airportapi.core.domain.warning import WeatherWarning, WeatherWarningIn
+from airportapi.core.repositories.iwarning import IWarningRepository
+from airportapi.db import database, replica, warning_table
+
+COLUMN_TYPES = {
+    "icao_code": "text",
+    "observation_time": "timestamptz",
+    "rule": "text",
+    "value": "float8",
+    "threshold": "float8",
+    "detail": "text",
+}
+
+
+class WarningRepository(IWarningRepository):
+    """A class implementing the warning DB repository."""
+
+    async def add_warnings(self, warnings: Iterable[WeatherWarningIn]) -> int:
+        """The method adding a batch of warnings to the data storage.
+
+        The whole batch is sent as column arrays of a single statement.
+
+        Args:
+            warnings (Iterable[WeatherWarningIn]): The warnings.
+
+        Returns:
+            int: The number of newly stored warnings.
+        """
+
+        warnings = list(warnings)
+
+        if not warnings:
+            return 0
+
+        columns = ", ".join(COLUMN_TYPES)
+        arrays = ", ".join(
+            f"${number}::{column_type}[]"
+            for number, column_type in enumerate(COLUMN_TYPES.values(), 1)
+        )
+
+        async with database.connection() as connection:
+            status = await connection.raw_connection.execute(
+                f"INSERT INTO {warning_table.name} ({columns}) "
+                f"SELECT * FROM unnest({arrays}) "
+                "ON CONFLICT (icao_code, observation_time, rule) DO NOTHING",
+                *(
+                    [getattr(warning, column) for warning in warnings]
+                    for column in COLUMN_TYPES
+                ),
+            )
+
+        return int(status.split()[-1])
+
+    async def get_by_icao(
+        self,
+        icao_code: str,
+        start: datetime,
+        end: datetime,
+    ) -> Iterable[Any]:
+        """The method getting warnings of the station in the period.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+            start (datetime): The beginning of the period (inclusive).
+            end (datetime): The end of the period (exclusive).
+
+        Returns:
+            Iterable[Any]: The warnings ordered by time.
+        """
+
+        query = (
+            warning_table.select()
+            .where(warning_table.c.icao_code == icao_code)
+            .where(warning_table.c.observation_time >= start)
+            .where(warning_table.c.observation_time < end)
+            .order_by(
+                warning_table.c.observation_time.asc(),
+                warning_table.c.rule.asc(),
+            )
+        )
+        warnings = await replica.fetch_all(query)
+
+        return [WeatherWarning(**dict(warning)) for warning in warnings]
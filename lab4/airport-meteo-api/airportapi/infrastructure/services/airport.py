@@ -1,11 +1,21 @@
 """Module containing continent service implementation."""
 
-from typing import Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
+
+import numpy as np
 
 from airportapi.core.domain.airport import Airport, AirportIn
+from airportapi.core.domain.page import Page, PageRequest
 from airportapi.core.repositories.iairport import IAirportRepository
-from airportapi.infrastructure.dto.airportdto import AirportDTO
+from airportapi.infrastructure.dto.airportdto import (
+    AirportDTO,
+    AirportLookupDTO,
+    AirportRouteDTO,
+    DistanceMatrixDTO,
+)
 from airportapi.infrastructure.services.iairport import IAirportService
+from airportapi.utils.cursor import encode_cursor
+from airportapi.utils.geoarray import distance_matrix, to_unit_vectors
 
 
 class AirportService(IAirportService):
@@ -31,6 +41,15 @@ class AirportService(IAirportService):
 
         return await self._repository.get_all_airports()
 
+    def stream_all(self) -> AsyncIterator[bytes]:
+        """The method iterating all airports encoded as JSON.
+
+        Returns:
+            AsyncIterator[bytes]: The JSON documents of the airports.
+        """
+
+        return self._repository.iterate_all_airports()
+
     async def get_by_country(self, country_id: int) -> Iterable[Airport]:
         """The method getting airports assigned to particular country.
 
@@ -55,6 +74,67 @@ class AirportService(IAirportService):
 
         return await self._repository.get_by_continent(continent_id)
 
+    async def get_all_page(self, page: PageRequest) -> Page[AirportDTO]:
+        """The method getting a keyset page of all airports.
+
+        Args:
+            page (PageRequest): The requested page.
+
+        Returns:
+            Page[AirportDTO]: The airports with the cursor of the next
+                page.
+        """
+
+        items = await self._repository.get_all_airports(
+            self._fetch_one_more(page),
+        )
+
+        return self._page(list(items), page)
+
+    async def get_by_country_page(
+        self,
+        country_id: int,
+        page: PageRequest,
+    ) -> Page[Airport]:
+        """The method getting a keyset page of airports of the country.
+
+        Args:
+            country_id (int): The id of the country.
+            page (PageRequest): The requested page.
+
+        Returns:
+            Page[Airport]: The airports with the cursor of the next page.
+        """
+
+        items = await self._repository.get_by_country(
+            country_id,
+            self._fetch_one_more(page),
+        )
+
+        return self._page(list(items), page)
+
+    async def get_by_continent_page(
+        self,
+        continent_id: int,
+        page: PageRequest,
+    ) -> Page[Airport]:
+        """The method getting a keyset page of airports of the continent.
+
+        Args:
+            continent_id (int): The id of the continent.
+            page (PageRequest): The requested page.
+
+        Returns:
+            Page[Airport]: The airports with the cursor of the next page.
+        """
+
+        items = await self._repository.get_by_continent(
+            continent_id,
+            self._fetch_one_more(page),
+        )
+
+        return self._page(list(items), page)
+
     async def get_by_id(self, airport_id: int) -> AirportDTO | None:
         """The method getting airport by provided id.
 
@@ -91,6 +171,115 @@ class AirportService(IAirportService):
 
         return await self._repository.get_by_iata(iata_code)
 
+    async def get_by_icao_codes(
+        self,
+        icao_codes: Sequence[str],
+    ) -> list[AirportLookupDTO]:
+        """The method getting airports by provided ICAO codes.
+
+        Args:
+            icao_codes (Sequence[str]): The ICAO codes of the airports.
+
+        Returns:
+            list[AirportLookupDTO]: The lookups in order of the codes.
+        """
+
+        airports = await self._repository.get_by_icao_codes(
+            list(dict.fromkeys(icao_codes))
+        )
+
+        return self._lookups(icao_codes, airports)
+
+    async def get_by_iata_codes(
+        self,
+        iata_codes: Sequence[str],
+    ) -> list[AirportLookupDTO]:
+        """The method getting airports by provided IATA codes.
+
+        Args:
+            iata_codes (Sequence[str]): The IATA codes of the airports.
+
+        Returns:
+            list[AirportLookupDTO]: The lookups in order of the codes.
+        """
+
+        airports = await self._repository.get_by_iata_codes(
+            list(dict.fromkeys(iata_codes))
+        )
+
+        return self._lookups(iata_codes, airports)
+
+    async def get_distance_matrix(
+        self,
+        icao_codes: Sequence[str],
+    ) -> DistanceMatrixDTO:
+        """The method calculating distances between the airports.
+
+        All distances are calculated at once from the unit-sphere vectors
+        of the airports.
+
+        Args:
+            icao_codes (Sequence[str]): The ICAO codes of the airports.
+
+        Returns:
+            DistanceMatrixDTO: The distances in kilometres between
+                the found airports in order of the codes, with codes
+                of the missing ones.
+        """
+
+        codes = list(dict.fromkeys(icao_codes))
+        airports = await self._repository.get_by_icao_codes(codes)
+        found = [code for code in codes if code in airports]
+        distances = distance_matrix(to_unit_vectors(
+            [airports[code].latitude for code in found],
+            [airports[code].longitude for code in found],
+        ))
+
+        return DistanceMatrixDTO(
+            codes=found,
+            missing=[code for code in codes if code not in airports],
+            distances=np.round(distances, 3).tolist(),
+        )
+
+    async def get_along_route(
+        self,
+        origin_icao: str,
+        destination_icao: str,
+        width: float,
+    ) -> list[AirportRouteDTO] | None:
+        """The method getting airports close to the route between airports.
+
+        Args:
+            origin_icao (str): The ICAO code of the origin airport.
+            destination_icao (str): The ICAO code of the destination
+                airport.
+            width (float): The maximal distance from the route
+                in kilometres.
+
+        Raises:
+            ValueError: If the airports are at the same place.
+
+        Returns:
+            list[AirportRouteDTO] | None: The airports ordered along
+                the route, None if any of its airports does not exist.
+        """
+
+        airports = await self._repository.get_by_icao_codes(
+            list(dict.fromkeys((origin_icao, destination_icao)))
+        )
+
+        if origin_icao not in airports or destination_icao not in airports:
+            return None
+
+        origin = airports[origin_icao]
+        destination = airports[destination_icao]
+
+        return list(await self._repository.get_along_route(
+            start=(origin.latitude, origin.longitude),
+            end=(destination.latitude, destination.longitude),
+            width=width,
+        ))
+
     async def get_by_user(self, user_id: int) -> Iterable[Airport]:
         """The method getting airports by user who added them.
 
@@ -126,6 +315,29 @@ class AirportService(IAirportService):
             radius=radius,
         )
 
+    async def get_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        count: int,
+    ) -> Iterable[Airport]:
+        """The method getting airports closest to the provided location.
+
+        Args:
+            latitude (float): The geographical latitude.
+            longitude (float): The geographical longitude.
+            count (int): The number of airports to find.
+
+        Returns:
+            Iterable[Airport]: The result airport collection.
+        """
+
+        return await self._repository.get_nearest(
+            latitude=latitude,
+            longitude=longitude,
+            count=count,
+        )
+
     async def add_airport(self, data: AirportIn) -> Airport | None:
         """The method adding new airport to the data storage.
 
@@ -169,3 +381,62 @@ class AirportService(IAirportService):
         """
 
         return await self._repository.delete_airport(airport_id)
+
+    @staticmethod
+    def _lookups(
+        codes: Sequence[str],
+        airports: dict[str, Any],
+    ) -> list[AirportLookupDTO]:
+        """A private method pairing the codes with the found airports.
+
+        Args:
+            codes (Sequence[str]): The requested codes.
+            airports (dict[str, Any]): The airport details by the found
+                codes.
+
+        Returns:
+            list[AirportLookupDTO]: The lookups in order of the codes,
+                without the airport if not found.
+        """
+
+        return [
+            AirportLookupDTO(code=code, airport=airports.get(code))
+            for code in codes
+        ]
+
+    @staticmethod
+    def _fetch_one_more(page: PageRequest) -> PageRequest:
+        """A private method extending the page by the first next item.
+
+        Args:
+            page (PageRequest): The requested page.
+
+        Returns:
+            PageRequest: The page telling if there is a next one.
+        """
+
+        return page.model_copy(update={"limit": page.limit + 1})
+
+    @staticmethod
+    def _page(items: list[Any], page: PageRequest) -> Page:
+        """A private method building the page from the items.
+
+        Args:
+            items (list[Any]): The items of the page and, if there is
+                a next page, its first item.
+            page (PageRequest): The requested page.
+
+        Returns:
+            Page: The page with the cursor continuing after its last item
+                if there is a next one.
+        """
+
+        if len(items) <= page.limit:
+            return Page(items=items)
+
+        last = items[page.limit - 1]
+
+        return Page(
+            items=items[:page.limit],
+            next=encode_cursor(page, (getattr(last, page.sort), last.id)),
+        )
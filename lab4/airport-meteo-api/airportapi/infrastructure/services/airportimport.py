@@ -0,0 +1,307 @@
+"""Module containing airport import service implementation."""
+
+from typing import AsyncIterator
+
+from pydantic import ValidationError
+
+from airportapi.core.domain.airport import (
+    AirportImportError,
+    AirportImportReport,
+    AirportIn,
+)
+from airportapi.core.repositories.iairport import IAirportRepository
+from airportapi.core.repositories.icountry import ICountryRepository
+from airportapi.infrastructure.services.iairportimport import \
+    IAirportImportService
+from airportapi.utils.csvstream import iter_csv_rows
+
+HEADERS = {
+    "name": ("name",),
+    "icao_code": ("icao_code", "gps_code", "ident"),
+    "iata_code": ("iata_code",),
+    "latitude": ("latitude", "latitude_deg"),
+    "longitude": ("longitude", "longitude_deg"),
+    "elevation": ("elevation", "elevation_ft"),
+    "vor_freq": ("vor_freq",),
+    "dme_freq": ("dme_freq",),
+    "ils_loc_freq": ("ils_loc_freq",),
+    "ils_gs_freq": ("ils_gs_freq",),
+}
+COUNTRY_HEADERS = ("country_id", "country", "country_alias", "iso_country")
+REQUIRED_FIELDS = (
+    "name",
+    "icao_code",
+    "latitude",
+    "longitude",
+    "elevation",
+    "country",
+)
+MAX_ERRORS = 1000
+
+
+class AirportImportService(IAirportImportService):
+    """A class implementing the airport import service.
+
+    Rows are validated in chunks and every valid chunk is upserted at once,
+    so a rejected row is reported without aborting the import.
+    """
+
+    _airport_repository: IAirportRepository
+    _country_repository: ICountryRepository
+    _chunk_size: int
+
+    def __init__(
+        self,
+        airport_repository: IAirportRepository,
+        country_repository: ICountryRepository,
+        chunk_size: int = 1000,
+    ) -> None:
+        """The initializer of the `airport import service`.
+
+        Args:
+            airport_repository (IAirportRepository): The reference to the
+                airport repository.
+            country_repository (ICountryRepository): The reference to the
+                country repository.
+            chunk_size (int, optional): The number of rows upserted at once.
+                Defaults to 1000.
+        """
+
+        self._airport_repository = airport_repository
+        self._country_repository = country_repository
+        self._chunk_size = chunk_size
+
+    async def import_csv(
+        self,
+        chunks: AsyncIterator[bytes],
+    ) -> AirportImportReport:
+        """The method importing airports from a CSV document.
+
+        The columns are matched by the header, which may use the names
+        of the airport attributes or of the OurAirports dataset. Countries
+        are given by id, name or alias. Airports are upserted on their
+        ICAO codes, so a repeated import updates the stored ones.
+
+        Args:
+            chunks (AsyncIterator[bytes]): The chunks of the CSV document.
+
+        Raises:
+            ValueError: If the header lacks a required column.
+
+        Returns:
+            AirportImportReport: The outcome of the import.
+        """
+
+        report = AirportImportReport()
+        countries = await self._get_country_ids()
+        columns: dict[str, list[int]] | None = None
+        batch: dict[str, tuple[int, AirportIn]] = {}
+        line = 1
+
+        async for row in iter_csv_rows(chunks):
+            if columns is None:
+                columns = self._map_header(row)
+                continue
+
+            line += 1
+
+            if not any(field.strip() for field in row):
+                continue
+
+            report.rows += 1
+            values = {
+                field: self._value(row, positions)
+                for field, positions in columns.items()
+            }
+
+            try:
+                airport = self._parse(values, countries)
+            except ValueError as error:
+                self._reject(report, line, values.get("icao_code"), error)
+                continue
+
+            batch[airport.icao_code] = (line, airport)
+
+            if len(batch) >= self._chunk_size:
+                await self._upsert(report, batch)
+
+        if columns is None:
+            raise ValueError("The CSV document has no header.")
+
+        await self._upsert(report, batch)
+
+        return report
+
+    async def _get_country_ids(self) -> dict[str, int]:
+        """A private method mapping country ids, names and aliases to ids.
+
+        Returns:
+            dict[str, int]: The ids by their text, lowercase names
+                and aliases.
+        """
+
+        countries = {}
+
+        for country in await self._country_repository.get_all_countries():
+            countries[str(country.id)] = country.id
+            countries[country.name.lower()] = country.id
+            countries[country.alias.lower()] = country.id
+
+        return countries
+
+    async def _upsert(
+        self,
+        report: AirportImportReport,
+        batch: dict[str, tuple[int, AirportIn]],
+    ) -> None:
+        """A private method upserting the batch and emptying it.
+
+        If the batch is rejected, e.g. for an IATA code used by another
+        airport or a country removed meanwhile, its airports are upserted
+        one by one to find the offending rows.
+
+        Args:
+            report (AirportImportReport): The report of the import.
+            batch (dict[str, tuple[int, AirportIn]]): The lines
+                and airports by ICAO codes.
+        """
+
+        if not batch:
+            return
+
+        upsert = self._airport_repository.upsert_airports
+
+        try:
+            report.imported += await upsert(
+                [airport for _, airport in batch.values()]
+            )
+        except ValueError:
+            for line, airport in batch.values():
+                try:
+                    report.imported += await upsert([airport])
+                except ValueError as error:
+                    self._reject(report, line, airport.icao_code, error)
+
+        batch.clear()
+
+    @staticmethod
+    def _map_header(header: list[str]) -> dict[str, list[int]]:
+        """A private method finding positions of the fields in the header.
+
+        Args:
+            header (list[str]): The header row.
+
+        Raises:
+            ValueError: If the header lacks a required column.
+
+        Returns:
+            dict[str, list[int]]: The positions of the candidate columns
+                of every field, in order of preference.
+        """
+
+        names = [name.strip().lower() for name in header]
+        columns = {
+            field: [names.index(alias) for alias in aliases if alias in names]
+            for field, aliases in (
+                *HEADERS.items(),
+                ("country", COUNTRY_HEADERS),
+            )
+        }
+        missing = [
+            field for field in REQUIRED_FIELDS if not columns[field]
+        ]
+
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)}.")
+
+        return columns
+
+    @staticmethod
+    def _value(row: list[str], positions: list[int]) -> str | None:
+        """A private method getting the first non-empty candidate value.
+
+        Args:
+            row (list[str]): The fields of the row.
+            positions (list[int]): The positions of the candidate columns.
+
+        Returns:
+            str | None: The value, None if all candidates are empty.
+        """
+
+        for position in positions:
+            if position < len(row) and (value := row[position].strip()):
+                return value
+
+        return None
+
+    @staticmethod
+    def _parse(
+        values: dict[str, str | None],
+        countries: dict[str, int],
+    ) -> AirportIn:
+        """A private method validating the airport of the row.
+
+        Args:
+            values (dict[str, str | None]): The values of the fields.
+            countries (dict[str, int]): The country ids by their text,
+                lowercase names and aliases.
+
+        Raises:
+            ValueError: If the row is not a valid airport.
+
+        Returns:
+            AirportIn: The airport.
+        """
+
+        country = values.pop("country")
+
+        if country is None:
+            raise ValueError("country: Field required")
+
+        country_id = countries.get(
+            str(int(country)) if country.isdigit() else country.lower()
+        )
+
+        if country_id is None:
+            raise ValueError(f"country: Unknown country '{country}'")
+
+        try:
+            return AirportIn.model_validate({
+                **{
+                    field: value
+                    for field, value in values.items()
+                    if value is not None
+                },
+                "iata_code": values.get("iata_code") or "",
+                "country_id": country_id,
+            })
+        except ValidationError as error:
+            raise ValueError("; ".join(
+                f"{'.'.join(map(str, detail['loc']))}: {detail['msg']}"
+                for detail in error.errors()
+            )) from error
+
+    @staticmethod
+    def _reject(
+        report: AirportImportReport,
+        line: int,
+        icao_code: str | None,
+        error: ValueError,
+    ) -> None:
+        """A private method recording the rejected row in the report.
+
+        Args:
+            report (AirportImportReport): The report of the import.
+            line (int): The number of the row, the header being the first.
+            icao_code (str | None): The ICAO code of the row.
+            error (ValueError): The reason of the rejection.
+        """
+
+        report.failed += 1
+
+        if len(report.errors) < MAX_ERRORS:
+            report.errors.append(AirportImportError(
+                line=line,
+                icao_code=icao_code,
+                message=str(error),
+            ))
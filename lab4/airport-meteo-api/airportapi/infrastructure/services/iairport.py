@@ -1,10 +1,16 @@
 """Module containing airport service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import AsyncIterator, Iterable, Sequence
 
 from airportapi.core.domain.airport import Airport, AirportIn
-from airportapi.infrastructure.dto.airportdto import AirportDTO
+from airportapi.core.domain.page import Page, PageRequest
+from airportapi.infrastructure.dto.airportdto import (
+    AirportDTO,
+    AirportLookupDTO,
+    AirportRouteDTO,
+    DistanceMatrixDTO,
+)
 
 
 class IAirportService(ABC):
@@ -18,6 +24,14 @@ class IAirportService(ABC):
             Iterable[AirportDTO]: All airports.
         """
 
+    @abstractmethod
+    def stream_all(self) -> AsyncIterator[bytes]:
+        """The method iterating all airports encoded as JSON.
+
+        Returns:
+            AsyncIterator[bytes]: The JSON documents of the airports.
+        """
+
     @abstractmethod
     async def get_by_country(self, country_id: int) -> Iterable[Airport]:
         """The method getting airports assigned to particular country.
@@ -40,6 +54,50 @@ class IAirportService(ABC):
             Iterable[Airport]: Airports assigned to a continent.
         """
 
+    @abstractmethod
+    async def get_all_page(self, page: PageRequest) -> Page[AirportDTO]:
+        """The method getting a keyset page of all airports.
+
+        Args:
+            page (PageRequest): The requested page.
+
+        Returns:
+            Page[AirportDTO]: The airports with the cursor of the next
+                page.
+        """
+
+    @abstractmethod
+    async def get_by_country_page(
+        self,
+        country_id: int,
+        page: PageRequest,
+    ) -> Page[Airport]:
+        """The method getting a keyset page of airports of the country.
+
+        Args:
+            country_id (int): The id of the country.
+            page (PageRequest): The requested page.
+
+        Returns:
+            Page[Airport]: The airports with the cursor of the next page.
+        """
+
+    @abstractmethod
+    async def get_by_continent_page(
+        self,
+        continent_id: int,
+        page: PageRequest,
+    ) -> Page[Airport]:
+        """The method getting a keyset page of airports of the continent.
+
+        Args:
+            continent_id (int): The id of the continent.
+            page (PageRequest): The requested page.
+
+        Returns:
+            Page[Airport]: The airports with the cursor of the next page.
+        """
+
     @abstractmethod
     async def get_by_id(self, airport_id: int) -> AirportDTO | None:
         """The method getting airport by provided id.
@@ -73,6 +131,68 @@ class IAirportService(ABC):
             AirportDTO | None: The airport details.
         """
 
+    @abstractmethod
+    async def get_by_icao_codes(
+        self,
+        icao_codes: Sequence[str],
+    ) -> list[AirportLookupDTO]:
+        """The method getting airports by provided ICAO codes.
+
+        Args:
+            icao_codes (Sequence[str]): The ICAO codes of the airports.
+
+        Returns:
+            list[AirportLookupDTO]: The lookups in order of the codes.
+        """
+
+    @abstractmethod
+    async def get_by_iata_codes(
+        self,
+        iata_codes: Sequence[str],
+    ) -> list[AirportLookupDTO]:
+        """The method getting airports by provided IATA codes.
+
+        Args:
+            iata_codes (Sequence[str]): The IATA codes of the airports.
+
+        Returns:
+            list[AirportLookupDTO]: The lookups in order of the codes.
+        """
+
+    @abstractmethod
+    async def get_distance_matrix(
+        self,
+        icao_codes: Sequence[str],
+    ) -> DistanceMatrixDTO:
+        """The method calculating distances between the airports.
+
+        Args:
+            icao_codes (Sequence[str]): The ICAO codes of the airports.
+
+        Returns:
+            DistanceMatrixDTO: The distances between the found airports.
+        """
+
+    @abstractmethod
+    async def get_along_route(
+        self,
+        origin_icao: str,
+        destination_icao: str,
+        width: float,
+    ) -> list[AirportRouteDTO] | None:
+        """The method getting airports close to the route between airports.
+
+        Args:
+            origin_icao (str): The ICAO code of the origin airport.
+            destination_icao (str): The ICAO code of the destination
+                airport.
+            width (float): The maximal distance from the route.
+
+        Returns:
+            list[AirportRouteDTO] | None: The airports along the route,
+                None if any of its airports does not exist.
+        """
+
     @abstractmethod
     async def get_by_user(self, user_id: int) -> Iterable[Airport]:
         """The method getting airports by user who added them.
@@ -102,6 +222,24 @@ class IAirportService(ABC):
             Iterable[Airport]: The result airport collection.
         """
 
+    @abstractmethod
+    async def get_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        count: int,
+    ) -> Iterable[Airport]:
+        """The method getting airports closest to the provided location.
+
+        Args:
+            latitude (float): The geographical latitude.
+            longitude (float): The geographical longitude.
+            count (int): The number of airports to find.
+
+        Returns:
+            Iterable[Airport]: The result airport collection.
+        """
+
     @abstractmethod
     async def add_airport(self, data: AirportIn) -> Airport | None:
         """The method adding new airport to the data storage.
@@ -0,0 +1,24 @@
+"""Module containing airport import service abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+from airportapi.core.domain.airport import AirportImportReport
+
+
+class IAirportImportService(ABC):
+    """An abstract class representing protocol of airport import service."""
+
+    @abstractmethod
+    async def import_csv(
+        self,
+        chunks: AsyncIterator[bytes],
+    ) -> AirportImportReport:
+        """The abstract importing airports from a CSV document.
+
+        Args:
+            chunks (AsyncIterator[bytes]): The chunks of the CSV document.
+
+        Returns:
+            AirportImportReport: The outcome of the import.
+        """
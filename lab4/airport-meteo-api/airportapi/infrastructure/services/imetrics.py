@@ -0,0 +1,15 @@
+"""Module containing metrics service abstractions."""
+
+from abc import ABC, abstractmethod
+
+
+class IMetricsService(ABC):
+    """An abstract class representing protocol of metrics service."""
+
+    @abstractmethod
+    def render(self) -> str:
+        """The abstract collecting the metrics of the app.
+
+        Returns:
+            str: The metrics in the Prometheus text format.
+        """
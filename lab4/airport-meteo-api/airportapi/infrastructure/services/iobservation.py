@@ -0,0 +1,82 @@
+"""Module containing observation service abstractions."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, Iterable
+
+from airportapi.core.domain.observation import (
+    LatestObservation,
+    Observation,
+    ObservationStats,
+    RawMetar,
+)
+
+
+class IObservationService(ABC):
+    """An abstract class representing protocol of observation service."""
+
+    @abstractmethod
+    async def ingest(self, reports: Iterable[RawMetar]) -> int:
+        """The abstract decoding and storing fetched METAR reports.
+
+        Args:
+            reports (Iterable[RawMetar]): The raw reports.
+
+        Returns:
+            int: The number of newly stored observations.
+        """
+
+    @abstractmethod
+    def get_history(
+        self,
+        icao_code: str,
+        start: datetime,
+        end: datetime,
+        after: tuple[datetime, int] | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[Observation]:
+        """The abstract iterating observations of the station in the period.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+            start (datetime): The beginning of the period (inclusive).
+            end (datetime): The end of the period (exclusive).
+            after (tuple[datetime, int] | None, optional): The observation
+                time and id of the last already received observation.
+                Defaults to None.
+            limit (int | None, optional): The maximal number
+                of observations. Defaults to None.
+
+        Returns:
+            AsyncIterator[Observation]: The observations ordered by time.
+        """
+
+    @abstractmethod
+    def get_latest(self, icao_code: str) -> LatestObservation | None:
+        """The abstract getting the latest observation of the station.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+
+        Returns:
+            LatestObservation | None: The observation with its age,
+                None if unknown.
+        """
+
+    @abstractmethod
+    async def get_stats(
+        self,
+        icao_code: str,
+        start: datetime,
+        end: datetime,
+    ) -> ObservationStats:
+        """The abstract computing weather statistics of the station.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+            start (datetime): The beginning of the period (inclusive).
+            end (datetime): The end of the period (exclusive).
+
+        Returns:
+            ObservationStats: The statistics of the period.
+        """
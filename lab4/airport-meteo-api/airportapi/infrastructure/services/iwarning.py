@@ -0,0 +1,41 @@
+"""Module containing warning service abstractions."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterable, Sequence
+
+from airportapi.core.domain.observation import ObservationIn
+from airportapi.core.domain.warning import WeatherWarning
+
+
+class IWarningService(ABC):
+    """An abstract class representing protocol of warning service."""
+
+    @abstractmethod
+    async def archive(self, observations: Sequence[ObservationIn]) -> int:
+        """The abstract evaluating rules and storing triggered warnings.
+
+        Args:
+            observations (Sequence[ObservationIn]): The observations.
+
+        Returns:
+            int: The number of newly stored warnings.
+        """
+
+    @abstractmethod
+    async def get_by_icao(
+        self,
+        icao_code: str,
+        start: datetime,
+        end: datetime,
+    ) -> Iterable[WeatherWarning]:
+        """The abstract getting warnings of the station in the period.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+            start (datetime): The beginning of the period (inclusive).
+            end (datetime): The end of the period (exclusive).
+
+        Returns:
+            Iterable[WeatherWarning]: The warnings ordered by time.
+        """
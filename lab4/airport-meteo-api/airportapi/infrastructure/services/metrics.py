@@ -0,0 +1,310 @@
+"""Module containing metrics service implementation."""
+
+import time
+from typing import Mapping, Optional
+
+from airportapi.infrastructure.ingestion.scheduler import MetarScheduler
+from airportapi.infrastructure.services.imetrics import IMetricsService
+from airportapi.utils.cache import TTLCache
+from airportapi.utils.metrics import (
+    MetricsDirectory,
+    MetricsWriter,
+    RequestMetrics,
+    merge_documents,
+)
+from airportapi.utils.pool import PooledDatabase
+
+PREFIX = "airportapi"
+
+
+class MetricsService(IMetricsService):
+    """A class implementing the metrics service.
+
+    Counters are kept by the measured components themselves and only
+    read here on scrape, so collecting costs nothing between scrapes.
+    With the shared directory, the samples are labelled with the worker
+    and the documents of all workers are returned, since a scrape is
+    answered by any of them.
+    """
+
+    _requests: RequestMetrics
+    _databases: Mapping[str, PooledDatabase]
+    _caches: Mapping[str, TTLCache]
+    _scheduler: Optional[MetarScheduler]
+    _directory: Optional[MetricsDirectory]
+    _worker: str
+
+    def __init__(
+        self,
+        requests: RequestMetrics,
+        databases: Mapping[str, PooledDatabase],
+        caches: Mapping[str, TTLCache],
+        scheduler: Optional[MetarScheduler] = None,
+        directory: Optional[MetricsDirectory] = None,
+        worker: str = "",
+    ) -> None:
+        """The initializer of the `metrics service`.
+
+        Args:
+            requests (RequestMetrics): The metrics of HTTP requests.
+            databases (Mapping[str, PooledDatabase]): The databases
+                by their names.
+            caches (Mapping[str, TTLCache]): The caches by their names.
+            scheduler (Optional[MetarScheduler], optional): The METAR
+                scheduler if ingestion is enabled. Defaults to None.
+            directory (Optional[MetricsDirectory], optional): The
+                directory shared with the other workers. Defaults to None,
+                which means only this process is reported.
+            worker (str, optional): The identifier of this process.
+                Defaults to "".
+        """
+
+        self._requests = requests
+        self._databases = databases
+        self._caches = caches
+        self._scheduler = scheduler
+        self._directory = directory
+        self._worker = worker
+
+    def render(self) -> str:
+        """The method collecting the metrics of the app.
+
+        Returns:
+            str: The metrics in the Prometheus text format.
+        """
+
+        document = self.render_worker()
+
+        if self._directory is None:
+            return document
+
+        self._directory.write(self._worker, document)
+
+        return merge_documents(
+            [document, *self._directory.read(exclude=self._worker)]
+        )
+
+    def render_worker(self) -> str:
+        """The method collecting the metrics of this process.
+
+        Returns:
+            str: The metrics in the Prometheus text format.
+        """
+
+        writer = MetricsWriter(
+            None if self._directory is None else {"worker": self._worker}
+        )
+        self._write_requests(writer)
+        self._write_databases(writer)
+        self._write_caches(writer)
+
+        if self._scheduler is not None:
+            self._write_scheduler(writer, self._scheduler)
+
+        return writer.render()
+
+    def _write_requests(self, writer: MetricsWriter) -> None:
+        """A private method writing the metrics of HTTP requests.
+
+        Args:
+            writer (MetricsWriter): The metrics document.
+        """
+
+        name = f"{PREFIX}_http_request_duration_seconds"
+        writer.family(name, "histogram", "Duration of HTTP requests.")
+
+        for (method, route, status), latency in \
+                list(self._requests.latencies.items()):
+            writer.histogram(
+                name,
+                latency.bounds,
+                latency.buckets,
+                latency.count,
+                latency.total,
+                {"method": method, "route": route, "status": status},
+            )
+
+        name = f"{PREFIX}_http_requests_in_flight"
+        writer.family(name, "gauge", "HTTP requests being served.")
+        writer.sample(name, self._requests.in_flight)
+
+    def _write_databases(self, writer: MetricsWriter) -> None:
+        """A private method writing the metrics of the connection pools.
+
+        Args:
+            writer (MetricsWriter): The metrics document.
+        """
+
+        connections = f"{PREFIX}_db_pool_connections"
+        writer.family(connections, "gauge", "Open pool connections.")
+
+        for database, db in self._databases.items():
+            size, idle, _ = db.backend.pool_usage()
+            writer.sample(
+                connections,
+                size - idle,
+                {"database": database, "state": "busy"},
+            )
+            writer.sample(
+                connections,
+                idle,
+                {"database": database, "state": "idle"},
+            )
+
+        maximum = f"{PREFIX}_db_pool_max_connections"
+        writer.family(maximum, "gauge", "Maximal size of the pool.")
+
+        for database, db in self._databases.items():
+            writer.sample(
+                maximum,
+                db.backend.pool_usage()[2],
+                {"database": database},
+            )
+
+        wait = f"{PREFIX}_db_pool_acquire_seconds"
+        writer.family(wait, "histogram", "Wait for a pool connection.")
+
+        for database, db in self._databases.items():
+            histogram = db.backend.acquire_wait
+            writer.histogram(
+                wait,
+                histogram.bounds,
+                histogram.buckets,
+                histogram.count,
+                histogram.total,
+                {"database": database},
+            )
+
+        duration = f"{PREFIX}_db_query_duration_seconds"
+        rows = f"{PREFIX}_db_query_rows_total"
+        statements = [
+            (database, shape, stats)
+            for database, db in self._databases.items()
+            if db.query_stats is not None
+            for shape, stats in list(db.query_stats.statements.items())
+        ]
+
+        if not statements:
+            return
+
+        writer.family(duration, "histogram", "Duration of SQL statements.")
+
+        for database, shape, stats in statements:
+            writer.histogram(
+                duration,
+                stats.latency.bounds,
+                stats.latency.buckets,
+                stats.latency.count,
+                stats.latency.total,
+                {"database": database, "shape": shape},
+            )
+
+        writer.family(rows, "counter", "Rows returned by SQL statements.")
+
+        for database, shape, stats in statements:
+            writer.sample(
+                rows,
+                stats.rows,
+                {"database": database, "shape": shape},
+            )
+
+    def _write_caches(self, writer: MetricsWriter) -> None:
+        """A private method writing the metrics of the caches.
+
+        Args:
+            writer (MetricsWriter): The metrics document.
+        """
+
+        for suffix, kind, documentation, value in (
+            ("hits_total", "counter", "Cache hits.", lambda c: c.hits),
+            ("misses_total", "counter", "Cache misses.", lambda c: c.misses),
+            ("entries", "gauge", "Cached entries.", len),
+            ("hit_ratio", "gauge", "Ratio of hits to lookups.", _hit_ratio),
+        ):
+            name = f"{PREFIX}_cache_{suffix}"
+            writer.family(name, kind, documentation)
+
+            for cache_name, cache in self._caches.items():
+                writer.sample(name, value(cache), {"cache": cache_name})
+
+    @staticmethod
+    def _write_scheduler(
+        writer: MetricsWriter,
+        scheduler: MetarScheduler,
+    ) -> None:
+        """A private method writing the metrics of METAR ingestion.
+
+        Args:
+            writer (MetricsWriter): The metrics document.
+            scheduler (MetarScheduler): The METAR scheduler.
+        """
+
+        name = f"{PREFIX}_metar_leader"
+        writer.family(name, "gauge", "Whether this process polls METAR.")
+        writer.sample(name, int(scheduler.leading))
+
+        name = f"{PREFIX}_metar_cycles_total"
+        writer.family(name, "counter", "Finished METAR polling cycles.")
+        writer.sample(
+            name,
+            scheduler.succeeded_cycles,
+            {"outcome": "success"},
+        )
+        writer.sample(name, scheduler.failed_cycles, {"outcome": "failure"})
+
+        name = f"{PREFIX}_metar_reports_total"
+        writer.family(name, "counter", "Station polls by their result.")
+        totals = scheduler.totals
+
+        for result, value in (
+            ("fetched", totals.fetched),
+            ("not_modified", totals.not_modified),
+            ("failed", totals.failed),
+        ):
+            writer.sample(name, value, {"result": result})
+
+        last = scheduler.last_cycle
+
+        if last is None:
+            return
+
+        finished = last.started_at + last.duration
+
+        for suffix, kind, documentation, seconds in (
+            (
+                "last_cycle_timestamp_seconds",
+                "gauge",
+                "End of the last successful cycle.",
+                finished,
+            ),
+            (
+                "last_cycle_duration_seconds",
+                "gauge",
+                "Duration of the last successful cycle.",
+                last.duration,
+            ),
+            (
+                "ingestion_lag_seconds",
+                "gauge",
+                "Time since the last successful cycle ended.",
+                max(time.time() - finished, 0.0),
+            ),
+        ):
+            name = f"{PREFIX}_metar_{suffix}"
+            writer.family(name, kind, documentation)
+            writer.sample(name, seconds)
+
+
+def _hit_ratio(cache: TTLCache) -> float:
+    """A private function computing the hit ratio of the cache.
+
+    Args:
+        cache (TTLCache): The cache.
+
+    Returns:
+        float: The ratio of hits to all lookups, 0.0 without lookups.
+    """
+
+    lookups = cache.hits + cache.misses
+
+    return cache.hits / lookups if lookups else 0.0
@@ -0,0 +1,184 @@
+"""Module containing observation service implementation."""
+
+from datetime import datetime, timezone
+from typing import AsyncIterator, Iterable
+
+from airportapi.core.domain.observation import (
+    LatestObservation,
+    MetricStats,
+    Observation,
+    ObservationIn,
+    ObservationStats,
+    RawMetar,
+)
+from airportapi.core.repositories.iobservation import IObservationRepository
+from airportapi.infrastructure.ingestion.decoder import decode_report
+from airportapi.infrastructure.ingestion.pool import DecodePool
+from airportapi.infrastructure.repositories.observationcache import \
+    LatestObservations
+from airportapi.infrastructure.services.iobservation import \
+    IObservationService
+from airportapi.infrastructure.services.iwarning import IWarningService
+
+
+class ObservationService(IObservationService):
+    """A class implementing the observation service."""
+
+    _repository: IObservationRepository
+    _warning_service: IWarningService | None
+    _decoder: DecodePool | None
+    _latest: LatestObservations | None
+
+    def __init__(
+        self,
+        repository: IObservationRepository,
+        warning_service: IWarningService | None = None,
+        decoder: DecodePool | None = None,
+        latest: LatestObservations | None = None,
+    ) -> None:
+        """The initializer of the `observation service`.
+
+        Args:
+            repository (IObservationRepository): The reference to
+                the repository.
+            warning_service (IWarningService | None, optional): The service
+                archiving warnings of ingested observations.
+                Defaults to None.
+            decoder (DecodePool | None, optional): The process pool
+                decoding the reports. Defaults to None, which decodes
+                in the calling thread.
+            latest (LatestObservations | None, optional): The in-memory
+                map of the latest observations, updated with every batch.
+                Defaults to None.
+        """
+
+        self._repository = repository
+        self._warning_service = warning_service
+        self._decoder = decoder
+        self._latest = latest
+
+    async def ingest(self, reports: Iterable[RawMetar]) -> int:
+        """The method decoding and storing fetched METAR reports.
+
+        Warnings triggered by the batch are archived as well.
+
+        Args:
+            reports (Iterable[RawMetar]): The raw reports.
+
+        Returns:
+            int: The number of newly stored observations.
+        """
+
+        if self._decoder:
+            observations = await self._decoder.decode(reports)
+        else:
+            observations = [
+                observation
+                for report in reports
+                if (observation := decode_report(report))
+            ]
+
+        stored = await self._repository.add_observations(observations)
+
+        if self._latest is not None:
+            self._latest.update(observations)
+
+        if self._warning_service:
+            await self._warning_service.archive(observations)
+
+        return stored
+
+    def get_history(
+        self,
+        icao_code: str,
+        start: datetime,
+        end: datetime,
+        after: tuple[datetime, int] | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[Observation]:
+        """The method iterating observations of the station in the period.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+            start (datetime): The beginning of the period (inclusive).
+            end (datetime): The end of the period (exclusive).
+            after (tuple[datetime, int] | None, optional): The observation
+                time and id of the last already received observation.
+                Defaults to None.
+            limit (int | None, optional): The maximal number
+                of observations. Defaults to None.
+
+        Returns:
+            AsyncIterator[Observation]: The observations ordered by time.
+        """
+
+        return self._repository.iterate_by_icao(
+            icao_code=icao_code,
+            start=start,
+            end=end,
+            after=after,
+            limit=limit,
+        )
+
+    def get_latest(self, icao_code: str) -> LatestObservation | None:
+        """The method getting the latest observation from memory.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+
+        Returns:
+            LatestObservation | None: The observation with its age,
+                None if unknown.
+        """
+
+        if self._latest is None \
+                or (observation := self._latest.get(icao_code)) is None:
+            return None
+
+        age = datetime.now(timezone.utc) - observation.observation_time
+
+        return LatestObservation(
+            **observation.model_dump(include=set(ObservationIn.model_fields)),
+            age_seconds=round(age.total_seconds(), 3),
+        )
+
+    async def get_stats(
+        self,
+        icao_code: str,
+        start: datetime,
+        end: datetime,
+    ) -> ObservationStats:
+        """The method computing weather statistics of the station.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+            start (datetime): The beginning of the period (inclusive).
+            end (datetime): The end of the period (exclusive).
+
+        Returns:
+            ObservationStats: The statistics of the period.
+        """
+
+        stats = ObservationStats(icao_code=icao_code, start=start, end=end)
+        row = await self._repository.get_stats(icao_code, start, end)
+
+        if not row or not row.observations:
+            return stats
+
+        stats.observations = int(row.observations)
+
+        for metric, field in ObservationStats.model_fields.items():
+            if field.annotation is not MetricStats:
+                continue
+
+            count = int(getattr(row, f"{metric}_count"))
+
+            if count:
+                setattr(stats, metric, MetricStats(
+                    count=count,
+                    min=getattr(row, f"{metric}_min"),
+                    max=getattr(row, f"{metric}_max"),
+                    mean=float(getattr(row, f"{metric}_sum")) / count,
+                ))
+
+        return stats
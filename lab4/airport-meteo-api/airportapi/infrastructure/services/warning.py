@@ -0,0 +1,65 @@
+"""Module containing warning service implementation."""
+
+from datetime import datetime
+from typing import Iterable, Sequence
+
+from airportapi.core.domain.observation import ObservationIn
+from airportapi.core.domain.warning import WeatherWarning
+from airportapi.core.repositories.iwarning import IWarningRepository
+from airportapi.infrastructure.ingestion.rules import RuleEngine
+from airportapi.infrastructure.services.iwarning import IWarningService
+
+
+class WarningService(IWarningService):
+    """A class implementing the warning service."""
+
+    _repository: IWarningRepository
+    _engine: RuleEngine
+
+    def __init__(
+        self,
+        repository: IWarningRepository,
+        engine: RuleEngine,
+    ) -> None:
+        """The initializer of the `warning service`.
+
+        Args:
+            repository (IWarningRepository): The reference to the repository.
+            engine (RuleEngine): The engine evaluating warning rules.
+        """
+
+        self._repository = repository
+        self._engine = engine
+
+    async def archive(self, observations: Sequence[ObservationIn]) -> int:
+        """The method evaluating rules and storing triggered warnings.
+
+        Args:
+            observations (Sequence[ObservationIn]): The observations.
+
+        Returns:
+            int: The number of newly stored warnings.
+        """
+
+        return await self._repository.add_warnings(
+            self._engine.evaluate(observations)
+        )
+
+    async def get_by_icao(
+        self,
+        icao_code: str,
+        start: datetime,
+        end: datetime,
+    ) -> Iterable[WeatherWarning]:
+        """The method getting warnings of the station in the period.
+
+        Args:
+            icao_code (str): The ICAO code of the station.
+            start (datetime): The beginning of the period (inclusive).
+            end (datetime): The end of the period (exclusive).
+
+        Returns:
+            Iterable[WeatherWarning]: The warnings ordered by time.
+        """
+
+        return await self._repository.get_by_icao(icao_code, start, end)
@@ -5,35 +5,72 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import JSONResponse
 
+from airportapi.api.middleware import MetricsMiddleware
 from airportapi.api.routers.airport import router as airport_router
 from airportapi.api.routers.continent import router as continent_router
 from airportapi.api.routers.country import router as country_router
+from airportapi.api.routers.metrics import router as metrics_router
+from airportapi.api.routers.observation import router as observation_router
+from airportapi.api.routers.warning import router as warning_router
+from airportapi.config import config
 from airportapi.container import Container
-from airportapi.db import database
+from airportapi.db import database, replica
 from airportapi.db import init_db
+from airportapi.utils.pool import PoolTimeoutError
 
 container = Container()
 container.wire(modules=[
     "airportapi.api.routers.continent",
     "airportapi.api.routers.country",
     "airportapi.api.routers.airport",
+    "airportapi.api.routers.observation",
+    "airportapi.api.routers.warning",
+    "airportapi.api.routers.metrics",
+    "airportapi.api.utils.conditional",
 ])
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncGenerator:
     """Lifespan function working on app startup."""
-    await init_db()
+    if config.DB_MIGRATE_ON_STARTUP:
+        await init_db()
     await database.connect()
+    await replica.connect()
+    if config.CACHE_INVALIDATION_ENABLED:
+        container.invalidation_listener().start()
+    await container.reference_data().load()
+    await container.table_versions().load()
+    await container.latest_observations().load()
+    if config.SPATIAL_INDEX_ENABLED:
+        await container.airport_db_repository().load_index()
+    if config.METAR_ENABLED:
+        container.metar_scheduler().start()
+    if config.METRICS_DIR:
+        container.metrics_snapshots().start()
     yield
+    if config.METRICS_DIR:
+        await container.metrics_snapshots().stop()
+    if config.METAR_ENABLED:
+        await container.metar_scheduler().stop()
+        await container.metar_client().aclose()
+    container.metar_decoder().shutdown()
+    if config.CACHE_INVALIDATION_ENABLED:
+        await container.invalidation_listener().stop()
+    await replica.disconnect()
     await database.disconnect()
 
 
 app = FastAPI(lifespan=lifespan)
 app.include_router(airport_router, prefix="/airport")
+app.include_router(observation_router, prefix="/airport")
+app.include_router(warning_router, prefix="/airport")
 app.include_router(continent_router, prefix="/continent")
 app.include_router(country_router, prefix="/country")
+app.include_router(metrics_router)
+app.add_middleware(MetricsMiddleware, metrics=container.request_metrics())
 
 
 @app.exception_handler(HTTPException)
@@ -51,3 +88,23 @@ async def http_exception_handle_logging(
         Response: The HTTP response.
     """
     return await http_exception_handler(request, exception)
+
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(
+    _: Request,
+    exception: PoolTimeoutError,
+) -> Response:
+    """A function turning pool exhaustion into a retryable response.
+
+    Args:
+        exception (PoolTimeoutError): A related exception.
+
+    Returns:
+        Response: The 503 response asking to retry later.
+    """
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exception)},
+        headers={"Retry-After": "1"},
+    )
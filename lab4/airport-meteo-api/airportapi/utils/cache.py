@@ -0,0 +1,161 @@
+"""Module containing the in-process TTL/LRU cache."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable
+
+
+class TTLCache:
+    """A class representing a bounded cache with per-key expiration.
+
+    Entries are kept in LRU order, so when the cache is full the least
+    recently used entry is evicted. Every entry can carry tags, which allow
+    invalidating all entries derived from the same object at once.
+    """
+
+    _max_size: int
+    _ttl: float
+    _clock: Callable[[], float]
+    _entries: OrderedDict[Hashable, tuple[float, Any, tuple[Hashable, ...]]]
+    _tags: dict[Hashable, set[Hashable]]
+    hits: int
+    misses: int
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """The initializer of the `TTL cache`.
+
+        Args:
+            max_size (int, optional): The maximal number of entries.
+                Defaults to 1024.
+            ttl (float, optional): The default time to live of the entry
+                in seconds. Defaults to 300.0.
+            clock (Callable[[], float], optional): The source of the
+                current time. Defaults to time.monotonic.
+        """
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._tags = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """The method returning the number of entries.
+
+        Returns:
+            int: The number of entries, including not yet purged
+                expired ones.
+        """
+
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """The method getting the value of the key if not expired.
+
+        Args:
+            key (Hashable): The key.
+            default (Any, optional): The value returned on miss.
+                Defaults to None.
+
+        Returns:
+            Any: The cached value or the default.
+        """
+
+        entry = self._entries.get(key)
+
+        if entry is None or entry[0] <= self._clock():
+            if entry is not None:
+                self._discard(key)
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return entry[1]
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: float | None = None,
+        tags: Iterable[Hashable] = (),
+    ) -> None:
+        """The method storing the value, evicting the oldest if full.
+
+        Args:
+            key (Hashable): The key.
+            value (Any): The value.
+            ttl (float | None, optional): The time to live of the entry
+                in seconds. Defaults to None, which means the cache default.
+            tags (Iterable[Hashable], optional): The tags of the entry.
+                Defaults to ().
+        """
+
+        if self._max_size <= 0:
+            return
+
+        self._discard(key)
+
+        while len(self._entries) >= self._max_size:
+            self._discard(next(iter(self._entries)))
+
+        tags = tuple(tags)
+        expires = self._clock() + (self._ttl if ttl is None else ttl)
+        self._entries[key] = (expires, value, tags)
+
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+    def invalidate(self, key: Hashable) -> None:
+        """The method removing the entry of the key.
+
+        Args:
+            key (Hashable): The key.
+        """
+
+        self._discard(key)
+
+    def invalidate_tag(self, tag: Hashable) -> None:
+        """The method removing all entries with the tag.
+
+        Args:
+            tag (Hashable): The tag.
+        """
+
+        for key in list(self._tags.get(tag, ())):
+            self._discard(key)
+
+    def clear(self) -> None:
+        """The method removing all entries."""
+
+        self._entries.clear()
+        self._tags.clear()
+
+    def _discard(self, key: Hashable) -> None:
+        """A private method removing the entry together with its tags.
+
+        Args:
+            key (Hashable): The key.
+        """
+
+        entry = self._entries.pop(key, None)
+
+        if entry is None:
+            return
+
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+
+            if keys is not None:
+                keys.discard(key)
+
+                if not keys:
+                    del self._tags[tag]
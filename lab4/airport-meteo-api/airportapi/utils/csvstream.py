@@ -0,0 +1,71 @@
+"""Module containing the incremental CSV reader."""
+
+import codecs
+import csv
+from typing import AsyncIterator
+
+
+async def iter_csv_rows(
+    chunks: AsyncIterator[bytes],
+    encoding: str = "utf-8-sig",
+) -> AsyncIterator[list[str]]:
+    """Function parsing CSV rows from a stream of byte chunks.
+
+    Only complete records are parsed, so a chunk may end anywhere,
+    including inside a multi-byte character or a quoted field spanning
+    several lines.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The chunks of the CSV document.
+        encoding (str, optional): The encoding of the document.
+            Defaults to "utf-8-sig", which skips the BOM.
+
+    Yields:
+        list[str]: The fields of the next row.
+    """
+
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        records, pending = _split_records(pending)
+
+        for row in csv.reader(records):
+            yield row
+
+    pending += decoder.decode(b"", final=True)
+
+    if pending.strip():
+        for row in csv.reader([pending]):
+            yield row
+
+
+def _split_records(text: str) -> tuple[list[str], str]:
+    """A private function cutting complete CSV records off the text.
+
+    A line ends the record only if the quotes read so far are balanced,
+    which holds for RFC 4180 escaping of quotes by doubling them.
+
+    Args:
+        text (str): The decoded text.
+
+    Returns:
+        tuple[list[str], str]: The complete records and the remainder.
+    """
+
+    records = []
+    start = 0
+    quotes = 0
+    position = 0
+
+    while (end := text.find("\n", position)) != -1:
+        quotes += text.count('"', position, end)
+        position = end + 1
+
+        if quotes % 2 == 0:
+            records.append(text[start:position])
+            start = position
+            quotes = 0
+
+    return records, text[start:]
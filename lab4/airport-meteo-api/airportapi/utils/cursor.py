@@ -0,0 +1,58 @@
+"""Module containing encoding of opaque keyset pagination cursors."""
+
+import base64
+from typing import Any
+
+import orjson
+
+from airportapi.core.domain.page import PageRequest
+
+
+def encode_cursor(page: PageRequest, after: tuple[Any, int]) -> str:
+    """Function encoding the cursor continuing the page after the key.
+
+    Args:
+        page (PageRequest): The request of the current page.
+        after (tuple[Any, int]): The sort value and the id of the last
+            item of the page.
+
+    Returns:
+        str: The URL-safe cursor.
+    """
+
+    payload = orjson.dumps({
+        "sort": page.sort,
+        "descending": page.descending,
+        "after": after,
+    })
+
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, limit: int) -> PageRequest:
+    """Function decoding the request of the page following the cursor.
+
+    Args:
+        cursor (str): The cursor returned with the previous page.
+        limit (int): The maximal number of items of the page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+
+    Returns:
+        PageRequest: The request of the page.
+    """
+
+    try:
+        payload = orjson.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+
+        return PageRequest(
+            sort=payload["sort"],
+            descending=payload["descending"],
+            limit=limit,
+            after=payload["after"],
+        )
+    except (ValueError, TypeError, KeyError) as error:
+        raise ValueError("Invalid cursor") from error
@@ -0,0 +1,179 @@
+"""Module containing geographical helper functions."""
+
+import math
+import re
+
+EARTH_RADIUS_KM = 6371.0088
+HALF_CIRCUMFERENCE_KM = math.pi * EARTH_RADIUS_KM
+
+_DMS_PATTERN = re.compile(
+    r"^\s*([NSEW])?\s*(\d+(?:[.,]\d+)?)"
+    r"(?:[°\s:]+(\d+(?:[.,]\d+)?))?"
+    r"(?:['′\s:]+(\d+(?:[.,]\d+)?))?"
+    r"[\"″'′\s]*([NSEW])?\s*$",
+    re.IGNORECASE,
+)
+
+
+def parse_coordinate(value: str | float | None) -> float | None:
+    """Function parsing a coordinate written as decimal degrees or DMS.
+
+    Supported notations are e.g. `52.1657`, `-0.4614`, `52°09'56"N`,
+    `N52 09 56` and `020 58 01E`.
+
+    Args:
+        value (str | float | None): The raw coordinate value.
+
+    Returns:
+        float | None: The coordinate in decimal degrees if parsable.
+    """
+
+    if value is None:
+        return None
+
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    text = value.strip()
+
+    try:
+        return float(text.replace(",", "."))
+    except ValueError:
+        pass
+
+    if not (match := _DMS_PATTERN.match(text)):
+        return None
+
+    prefix, degrees, minutes, seconds, suffix = match.groups()
+    result = float(degrees.replace(",", "."))
+    result += float(minutes.replace(",", ".")) / 60 if minutes else 0.0
+    result += float(seconds.replace(",", ".")) / 3600 if seconds else 0.0
+
+    hemisphere = (prefix or suffix or "").upper()
+
+    return -result if hemisphere in ("S", "W") else result
+
+
+def to_unit_vector(
+    latitude: float,
+    longitude: float,
+) -> tuple[float, float, float]:
+    """Function converting geographical coordinates to a unit-sphere vector.
+
+    Args:
+        latitude (float): The latitude in degrees.
+        longitude (float): The longitude in degrees.
+
+    Returns:
+        tuple[float, float, float]: The cartesian coordinates.
+    """
+
+    lat = math.radians(latitude)
+    lon = math.radians(longitude)
+    cos_lat = math.cos(lat)
+
+    return cos_lat * math.cos(lon), cos_lat * math.sin(lon), math.sin(lat)
+
+
+def chord_for_distance(distance_km: float) -> float:
+    """Function converting a great-circle distance to a unit-sphere chord.
+
+    Args:
+        distance_km (float): The great-circle distance in kilometres.
+
+    Returns:
+        float: The length of the chord on the unit sphere.
+    """
+
+    angle = min(distance_km / EARTH_RADIUS_KM, math.pi)
+
+    return 2 * math.sin(angle / 2)
+
+
+def distance_for_chord(chord: float) -> float:
+    """Function converting a unit-sphere chord to a great-circle distance.
+
+    Args:
+        chord (float): The length of the chord on the unit sphere.
+
+    Returns:
+        float: The great-circle distance in kilometres.
+    """
+
+    return 2 * EARTH_RADIUS_KM * math.asin(min(chord / 2, 1.0))
+
+
+def haversine(
+    latitude_1: float,
+    longitude_1: float,
+    latitude_2: float,
+    longitude_2: float,
+) -> float:
+    """Function calculating the great-circle distance between two points.
+
+    Args:
+        latitude_1 (float): The latitude of the first point.
+        longitude_1 (float): The longitude of the first point.
+        latitude_2 (float): The latitude of the second point.
+        longitude_2 (float): The longitude of the second point.
+
+    Returns:
+        float: The distance in kilometres.
+    """
+
+    lat_1 = math.radians(latitude_1)
+    lat_2 = math.radians(latitude_2)
+    half_dlat = (lat_2 - lat_1) / 2
+    half_dlon = math.radians(longitude_2 - longitude_1) / 2
+
+    a = math.sin(half_dlat) ** 2 \
+        + math.cos(lat_1) * math.cos(lat_2) * math.sin(half_dlon) ** 2
+
+    return 2 * EARTH_RADIUS_KM * math.asin(min(math.sqrt(a), 1.0))
+
+
+def bounding_box(
+    latitude: float,
+    longitude: float,
+    radius_km: float,
+) -> tuple[float, float, float, float]:
+    """Function calculating the lat/lon box enclosing a search circle.
+
+    If the circle contains a pole the whole longitude range is returned.
+    If it crosses the antimeridian the minimal longitude is greater than
+    the maximal one.
+
+    Args:
+        latitude (float): The latitude of the circle center.
+        longitude (float): The longitude of the circle center.
+        radius_km (float): The radius of the circle in kilometres.
+
+    Returns:
+        tuple[float, float, float, float]: The minimal and maximal latitude
+            followed by the minimal and maximal longitude.
+    """
+
+    angle = radius_km / EARTH_RADIUS_KM
+    lat = math.radians(latitude)
+    min_lat = lat - angle
+    max_lat = lat + angle
+
+    if min_lat <= -math.pi / 2 or max_lat >= math.pi / 2 \
+            or angle >= math.pi / 2:
+        return (
+            math.degrees(max(min_lat, -math.pi / 2)),
+            math.degrees(min(max_lat, math.pi / 2)),
+            -180.0,
+            180.0,
+        )
+
+    delta_lon = math.degrees(math.asin(math.sin(angle) / math.cos(lat)))
+    min_lon = longitude - delta_lon
+    max_lon = longitude + delta_lon
+
+    if min_lon < -180.0:
+        min_lon += 360.0
+    if max_lon > 180.0:
+        max_lon -= 360.0
+
+    return math.degrees(min_lat), math.degrees(max_lat), min_lon, max_lon
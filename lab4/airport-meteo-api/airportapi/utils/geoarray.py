@@ -0,0 +1,206 @@
+"""Module containing vectorized geographical functions.
+
+Points are kept as rows of unit-sphere vectors, so distances of whole
+sets are a few array operations instead of a loop of trigonometry.
+"""
+
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from airportapi.utils.geo import EARTH_RADIUS_KM
+
+MIN_ROUTE_SINE = 1e-9
+
+
+def to_unit_vectors(latitudes: ArrayLike, longitudes: ArrayLike) -> np.ndarray:
+    """Function converting coordinates to rows of unit-sphere vectors.
+
+    Args:
+        latitudes (ArrayLike): The latitudes in degrees.
+        longitudes (ArrayLike): The longitudes in degrees.
+
+    Returns:
+        np.ndarray: The `(n, 3)` array of the cartesian coordinates.
+    """
+
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+    cos_lat = np.cos(lat)
+
+    return np.stack(
+        (cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)),
+        axis=-1,
+    )
+
+
+def distances_for_chords(chords: ArrayLike) -> np.ndarray:
+    """Function converting unit-sphere chords to great-circle distances.
+
+    Args:
+        chords (ArrayLike): The lengths of the chords.
+
+    Returns:
+        np.ndarray: The distances in kilometres.
+    """
+
+    return 2 * EARTH_RADIUS_KM * np.arcsin(
+        np.minimum(np.asarray(chords) / 2, 1.0)
+    )
+
+
+def distance_matrix(vectors: np.ndarray) -> np.ndarray:
+    """Function calculating great-circle distances between all points.
+
+    The chords are taken from the differences of the vectors, which
+    is the haversine formula without its loss of precision for close
+    points.
+
+    Args:
+        vectors (np.ndarray): The `(n, 3)` unit-sphere vectors.
+
+    Returns:
+        np.ndarray: The symmetric `(n, n)` distances in kilometres.
+    """
+
+    differences = vectors[:, np.newaxis, :] - vectors[np.newaxis, :, :]
+
+    return distances_for_chords(np.sqrt(np.einsum(
+        "ijk,ijk->ij",
+        differences,
+        differences,
+    )))
+
+
+def route_length(start: np.ndarray, end: np.ndarray) -> float:
+    """Function calculating the great-circle distance of the route.
+
+    Args:
+        start (np.ndarray): The unit-sphere vector of the start.
+        end (np.ndarray): The unit-sphere vector of the end.
+
+    Returns:
+        float: The distance in kilometres.
+    """
+
+    return float(distances_for_chords(np.linalg.norm(end - start)))
+
+
+def route_points(
+    start: np.ndarray,
+    end: np.ndarray,
+    step: float,
+) -> np.ndarray:
+    """Function placing evenly spaced points along the great-circle route.
+
+    Args:
+        start (np.ndarray): The unit-sphere vector of the start.
+        end (np.ndarray): The unit-sphere vector of the end.
+        step (float): The maximal distance between the points
+            in kilometres.
+
+    Returns:
+        np.ndarray: The `(n, 3)` vectors including both ends.
+    """
+
+    length = route_length(start, end)
+    count = max(int(np.ceil(length / step)), 1) + 1
+    fractions = np.linspace(0.0, 1.0, count)[:, np.newaxis]
+    angle = length / EARTH_RADIUS_KM
+
+    if np.sin(angle) < MIN_ROUTE_SINE:
+        return np.repeat(start[np.newaxis, :], count, axis=0)
+
+    return (
+        np.sin((1 - fractions) * angle) * start
+        + np.sin(fractions * angle) * end
+    ) / np.sin(angle)
+
+
+def route_distances(
+    vectors: np.ndarray,
+    start: np.ndarray,
+    end: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Function calculating distances of points from the route segment.
+
+    Points abeam of the segment get the cross-track distance from its
+    great circle, the others the distance to the closer end. The
+    along-track distance is the position of the closest point of the
+    segment.
+
+    Args:
+        vectors (np.ndarray): The `(n, 3)` unit-sphere vectors.
+        start (np.ndarray): The unit-sphere vector of the start.
+        end (np.ndarray): The unit-sphere vector of the end.
+
+    Raises:
+        ValueError: If the ends are the same or antipodal points, so the
+            great circle is not defined.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The distances from the segment
+            and along it in kilometres.
+    """
+
+    normal = np.cross(start, end)
+    sine = np.linalg.norm(normal)
+
+    if sine < MIN_ROUTE_SINE:
+        raise ValueError("The route ends are the same or antipodal points")
+
+    normal /= sine
+    length = route_length(start, end)
+    ahead = np.cross(normal, start)
+    along = EARTH_RADIUS_KM * np.arctan2(vectors @ ahead, vectors @ start)
+    cross = EARTH_RADIUS_KM * np.abs(
+        np.arcsin(np.clip(vectors @ normal, -1.0, 1.0))
+    )
+    to_start = distances_for_chords(np.linalg.norm(vectors - start, axis=1))
+    to_end = distances_for_chords(np.linalg.norm(vectors - end, axis=1))
+    abeam = (along >= 0) & (along <= length)
+
+    return (
+        np.where(abeam, cross, np.minimum(to_start, to_end)),
+        np.where(abeam, along, np.where(to_start <= to_end, 0.0, length)),
+    )
+
+
+def points_along_route(
+    keys: Sequence[int],
+    vectors: np.ndarray,
+    start: np.ndarray,
+    end: np.ndarray,
+    width: float,
+) -> list[tuple[int, float, float]]:
+    """Function selecting points close to the route segment.
+
+    Args:
+        keys (Sequence[int]): The keys of the points.
+        vectors (np.ndarray): The `(n, 3)` unit-sphere vectors
+            of the points.
+        start (np.ndarray): The unit-sphere vector of the start.
+        end (np.ndarray): The unit-sphere vector of the end.
+        width (float): The maximal distance from the route
+            in kilometres.
+
+    Raises:
+        ValueError: If the ends are the same or antipodal points.
+
+    Returns:
+        list[tuple[int, float, float]]: The keys with distances from
+            and along the route in kilometres, ordered along it.
+    """
+
+    if not len(keys):
+        return []
+
+    cross, along = route_distances(vectors, start, end)
+    found = np.flatnonzero(cross <= width)
+    found = found[np.lexsort((cross[found], along[found]))]
+
+    return [
+        (keys[index], float(cross[index]), float(along[index]))
+        for index in found.tolist()
+    ]
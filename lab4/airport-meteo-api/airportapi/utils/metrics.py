@@ -0,0 +1,418 @@
+"""Module containing metric primitives and the Prometheus text format.
+
+The collectors are updated from the event loop only, so they use plain
+counters without any locks. Processes serving the same app share their
+documents through a directory, so any of them answers for all.
+"""
+
+import asyncio
+import bisect
+import contextlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Mapping, Sequence
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+
+class Histogram:
+    """A class counting observations in buckets of fixed bounds."""
+
+    bounds: tuple[float, ...]
+    buckets: list[int]
+    count: int
+    total: float
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS) -> None:
+        """The initializer of the `histogram`.
+
+        Args:
+            bounds (Sequence[float], optional): The sorted upper bounds
+                of the buckets. Defaults to LATENCY_BUCKETS.
+        """
+
+        self.bounds = tuple(bounds)
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """The method recording the value.
+
+        Args:
+            value (float): The observed value.
+        """
+
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+
+class MetricsWriter:
+    """A class building a document in the Prometheus text format."""
+
+    _labels: dict[str, str]
+    _lines: list[str]
+
+    def __init__(self, labels: Mapping[str, str] | None = None) -> None:
+        """The initializer of the `metrics writer`.
+
+        Args:
+            labels (Mapping[str, str] | None, optional): The labels added
+                to every sample, e.g. the worker. Defaults to None.
+        """
+
+        self._labels = dict(labels or {})
+        self._lines = []
+
+    def family(self, name: str, kind: str, documentation: str) -> None:
+        """The method starting the metric family.
+
+        Args:
+            name (str): The name of the metric.
+            kind (str): The type, e.g. `counter`, `gauge`, `histogram`.
+            documentation (str): The help text.
+        """
+
+        self._lines.append(f"# HELP {name} {documentation}")
+        self._lines.append(f"# TYPE {name} {kind}")
+
+    def sample(
+        self,
+        name: str,
+        value: float,
+        labels: Mapping[str, str] | None = None,
+    ) -> None:
+        """The method adding the sample.
+
+        Args:
+            name (str): The name of the sample.
+            value (float): The value.
+            labels (Mapping[str, str] | None, optional): The labels.
+                Defaults to None.
+        """
+
+        labels = {**self._labels, **(labels or {})}
+        self._lines.append(f"{name}{_labels(labels)} {_number(value)}")
+
+    def histogram(
+        self,
+        name: str,
+        bounds: Sequence[float],
+        buckets: Sequence[int],
+        count: int,
+        total: float,
+        labels: Mapping[str, str] | None = None,
+    ) -> None:
+        """The method adding the samples of the histogram.
+
+        Args:
+            name (str): The name of the histogram.
+            bounds (Sequence[float]): The upper bounds of the buckets.
+            buckets (Sequence[int]): The not cumulative counts including
+                the overflow bucket.
+            count (int): The number of observations.
+            total (float): The sum of observations.
+            labels (Mapping[str, str] | None, optional): The labels.
+                Defaults to None.
+        """
+
+        labels = dict(labels or {})
+        cumulative = 0
+
+        for bound, bucket in zip((*bounds, float("inf")), buckets):
+            cumulative += bucket
+            self.sample(
+                f"{name}_bucket",
+                cumulative,
+                {**labels, "le": _number(bound)},
+            )
+
+        self.sample(f"{name}_sum", total, labels)
+        self.sample(f"{name}_count", count, labels)
+
+    def render(self) -> str:
+        """The method returning the document.
+
+        Returns:
+            str: The metrics in the text format.
+        """
+
+        return "\n".join(self._lines) + "\n"
+
+
+class MetricsDirectory:
+    """A class sharing the metrics documents of the app processes.
+
+    Every process writes its document labelled with its worker to its own
+    file, so a scrape answered by any of them covers all. Documents
+    of processes which stopped writing them are removed after the
+    maximal age.
+    """
+
+    _path: Path
+    _max_age: float
+
+    def __init__(self, path: str | Path, max_age: float = 30.0) -> None:
+        """The initializer of the `metrics directory`.
+
+        Args:
+            path (str | Path): The directory shared by the processes.
+            max_age (float, optional): The age in seconds after which
+                the document is treated as left by a dead process.
+                Defaults to 30.0.
+        """
+
+        self._path = Path(path)
+        self._max_age = max_age
+
+    def write(self, worker: str, document: str) -> None:
+        """The method replacing the document of the worker at once.
+
+        Args:
+            worker (str): The identifier of the process.
+            document (str): The metrics in the text format.
+        """
+
+        self._path.mkdir(parents=True, exist_ok=True)
+        temporary = self._path / f".{worker}.prom"
+        temporary.write_text(document)
+        os.replace(temporary, self._path / f"{worker}.prom")
+
+    def remove(self, worker: str) -> None:
+        """The method removing the document of the stopped worker.
+
+        Args:
+            worker (str): The identifier of the process.
+        """
+
+        (self._path / f"{worker}.prom").unlink(missing_ok=True)
+
+    def read(self, exclude: str | None = None) -> list[str]:
+        """The method reading the documents of the live workers.
+
+        Args:
+            exclude (str | None, optional): The worker to skip, usually
+                the reading one. Defaults to None.
+
+        Returns:
+            list[str]: The documents.
+        """
+
+        documents = []
+        oldest = time.time() - self._max_age
+
+        for path in sorted(self._path.glob("*.prom")):
+            if path.stem == exclude:
+                continue
+
+            try:
+                if path.stat().st_mtime < oldest:
+                    path.unlink(missing_ok=True)
+                else:
+                    documents.append(path.read_text())
+            except FileNotFoundError:
+                continue
+
+        return documents
+
+
+class MetricsSnapshots:
+    """A class writing the document of the process periodically.
+
+    Without it, a process which is never scraped itself would vanish
+    from the documents of the others.
+    """
+
+    _directory: MetricsDirectory
+    _render: Callable[[], str]
+    _interval: float
+    _worker: str
+    _task: asyncio.Task | None
+
+    def __init__(
+        self,
+        directory: MetricsDirectory,
+        render: Callable[[], str],
+        worker: str,
+        interval: float = 5.0,
+    ) -> None:
+        """The initializer of the `metrics snapshots`.
+
+        Args:
+            directory (MetricsDirectory): The shared directory.
+            render (Callable[[], str]): The function rendering
+                the document of the process.
+            worker (str): The identifier of the process.
+            interval (float, optional): The time between writes
+                in seconds. Defaults to 5.0.
+        """
+
+        self._directory = directory
+        self._render = render
+        self._worker = worker
+        self._interval = interval
+        self._task = None
+
+    def start(self) -> None:
+        """The method starting the writes in the background."""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(
+                self._run(),
+                name="metrics-snapshots",
+            )
+
+    async def stop(self) -> None:
+        """The method stopping the writes and removing the document."""
+
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        self._directory.remove(self._worker)
+
+    async def _run(self) -> None:
+        """A private method writing the document until cancelled."""
+
+        while True:
+            try:
+                self._directory.write(self._worker, self._render())
+            except OSError as error:
+                logger.warning("Writing metrics snapshot failed: %s", error)
+
+            await asyncio.sleep(self._interval)
+
+
+def merge_documents(documents: Iterable[str]) -> str:
+    """Function merging the documents into one of grouped families.
+
+    The text format requires the samples of a family to follow its
+    header, so the samples of every document are moved under the first
+    header of their family.
+
+    Args:
+        documents (Iterable[str]): The metrics in the text format.
+
+    Returns:
+        str: The merged metrics.
+    """
+
+    families: dict[str, list[str]] = {}
+
+    for document in documents:
+        lines: list[str] = []
+
+        for line in document.splitlines():
+            if line.startswith("# HELP "):
+                name = line.split(" ", 3)[2]
+                lines = families.get(name) or []
+
+                if not lines:
+                    families[name] = lines
+                    lines.append(line)
+            elif line.startswith("# TYPE "):
+                if len(lines) == 1:
+                    lines.append(line)
+            elif line:
+                lines.append(line)
+
+    return "".join(
+        "\n".join(lines) + "\n" for lines in families.values()
+    )
+
+
+def _labels(labels: Mapping[str, str] | None) -> str:
+    """A private function formatting the labels of the sample.
+
+    Args:
+        labels (Mapping[str, str] | None): The labels.
+
+    Returns:
+        str: The `{name="value",...}` part, empty without labels.
+    """
+
+    if not labels:
+        return ""
+
+    return "{" + ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in labels.items()
+    ) + "}"
+
+
+def _escape(value: str) -> str:
+    """A private function escaping the label value.
+
+    Args:
+        value (str): The value.
+
+    Returns:
+        str: The value with backslashes, quotes and newlines escaped.
+    """
+
+    return (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
+
+
+def _number(value: float) -> str:
+    """A private function formatting the sample value.
+
+    Args:
+        value (float): The value.
+
+    Returns:
+        str: The value, `+Inf` for infinity.
+    """
+
+    if value == float("inf"):
+        return "+Inf"
+
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class RequestMetrics:
+    """A class collecting latencies of HTTP requests per route."""
+
+    latencies: dict[tuple[str, str, str], Histogram]
+    in_flight: int
+
+    def __init__(self) -> None:
+        """The initializer of the `request metrics`."""
+
+        self.latencies = {}
+        self.in_flight = 0
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+    ) -> None:
+        """The method recording the finished request.
+
+        Args:
+            method (str): The HTTP method.
+            route (str): The path template of the matched route.
+            status (int): The status code of the response.
+            seconds (float): The duration of the request.
+        """
+
+        key = (method, route, str(status))
+        histogram = self.latencies.get(key)
+
+        if histogram is None:
+            histogram = self.latencies[key] = Histogram()
+
+        histogram.observe(seconds)
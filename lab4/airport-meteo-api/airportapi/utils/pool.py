@@ -0,0 +1,285 @@
+"""Module containing the database with a bounded connection pool."""
+
+import asyncio
+import time
+from typing import Any, AsyncGenerator, Optional, Sequence
+
+import databases
+from databases.backends.postgres import PostgresBackend, PostgresConnection
+from sqlalchemy.sql import ClauseElement
+
+from airportapi.utils.metrics import Histogram
+from airportapi.utils.querystats import QueryStats
+from airportapi.utils.statements import BoundStatement
+
+
+class PoolTimeoutError(Exception):
+    """An exception raised when no pooled connection becomes free."""
+
+
+class PooledPostgresBackend(PostgresBackend):
+    """A class of the asyncpg backend limiting the connection wait.
+
+    The remaining options are passed to `asyncpg.create_pool`, e.g.
+    `min_size`, `max_size` and `statement_cache_size`.
+    """
+
+    acquire_timeout: Optional[float]
+    acquire_wait: Histogram
+    query_stats: Optional[QueryStats]
+
+    def __init__(
+        self,
+        database_url: Any,
+        acquire_timeout: Optional[float] = None,
+        query_stats: Optional[QueryStats] = None,
+        **options: Any,
+    ) -> None:
+        """The initializer of the `pooled postgres backend`.
+
+        Args:
+            database_url (Any): The URL of the database.
+            acquire_timeout (Optional[float], optional): The maximal wait
+                for a free connection in seconds. Defaults to None, which
+                means waiting forever.
+            query_stats (Optional[QueryStats], optional): The statistics
+                recording every executed statement. Defaults to None,
+                which disables the instrumentation.
+            **options (Any): The options of the asyncpg pool.
+        """
+
+        super().__init__(database_url, **options)
+        self.acquire_timeout = acquire_timeout
+        self.acquire_wait = Histogram()
+        self.query_stats = query_stats
+
+    def pool_usage(self) -> tuple[int, int, int]:
+        """The method reading the utilization of the pool.
+
+        Returns:
+            tuple[int, int, int]: The numbers of open and idle
+                connections and the maximal size, zeros if not connected.
+        """
+
+        if self._pool is None:
+            return 0, 0, 0
+
+        return (
+            self._pool.get_size(),
+            self._pool.get_idle_size(),
+            self._pool.get_max_size(),
+        )
+
+    def connection(self) -> "PooledPostgresConnection":
+        """The method creating a not yet acquired connection.
+
+        Returns:
+            PooledPostgresConnection: The connection.
+        """
+
+        return PooledPostgresConnection(self, self._dialect)
+
+
+class PooledPostgresConnection(PostgresConnection):
+    """A class of the asyncpg connection acquired with a timeout.
+
+    Besides SQLAlchemy queries it runs precompiled statements, which
+    skip the compilation. Their result columns are taken from the first
+    compilation of the query shape. If the backend has query statistics,
+    every statement is timed and recorded with the number of its rows.
+    """
+
+    _database: PooledPostgresBackend
+    _compiled: tuple[str, str, Sequence[Any]] = ("", "", ())
+    _result_columns: dict[str, Any] = {}
+
+    async def acquire(self) -> None:
+        """The method taking a connection from the pool.
+
+        The wait for the connection is recorded, timeouts included.
+
+        Raises:
+            PoolTimeoutError: If no connection was freed in time.
+        """
+
+        assert self._connection is None, "Connection is already acquired"
+        assert self._database._pool is not None, "Backend is not running"
+
+        started = time.perf_counter()
+
+        try:
+            self._connection = await self._database._pool.acquire(
+                timeout=self._database.acquire_timeout,
+            )
+        except asyncio.TimeoutError as error:
+            raise PoolTimeoutError(
+                "No database connection available in "
+                f"{self._database.acquire_timeout}s"
+            ) from error
+        finally:
+            self._database.acquire_wait.observe(
+                time.perf_counter() - started,
+            )
+
+    async def fetch_all(self, query: ClauseElement) -> list[Any]:
+        """The method fetching all rows of the query.
+
+        Args:
+            query (ClauseElement): The query.
+
+        Returns:
+            list[Any]: The rows.
+        """
+
+        started = time.perf_counter()
+        rows = await super().fetch_all(query)
+        self._record(started, len(rows))
+
+        return rows
+
+    async def fetch_one(self, query: ClauseElement) -> Any | None:
+        """The method fetching the first row of the query.
+
+        Args:
+            query (ClauseElement): The query.
+
+        Returns:
+            Any | None: The row if any.
+        """
+
+        started = time.perf_counter()
+        row = await super().fetch_one(query)
+        self._record(started, int(row is not None))
+
+        return row
+
+    async def execute(self, query: ClauseElement) -> Any:
+        """The method executing the statement.
+
+        Args:
+            query (ClauseElement): The statement.
+
+        Returns:
+            Any: The first value of the result.
+        """
+
+        started = time.perf_counter()
+        result = await super().execute(query)
+        self._record(started, 0)
+
+        return result
+
+    async def execute_many(self, queries: list[ClauseElement]) -> None:
+        """The method executing the statements, recorded as one.
+
+        Args:
+            queries (list[ClauseElement]): The statements.
+        """
+
+        started = time.perf_counter()
+        await super().execute_many(queries)
+        self._record(started, 0)
+
+    async def iterate(
+        self,
+        query: ClauseElement,
+    ) -> AsyncGenerator[Any, None]:
+        """The method iterating the rows of the query with a cursor.
+
+        The recorded duration includes the time the rows are consumed.
+
+        Args:
+            query (ClauseElement): The query.
+
+        Yields:
+            Any: The next row.
+        """
+
+        started = time.perf_counter()
+        rows = 0
+
+        try:
+            async for row in super().iterate(query):
+                rows += 1
+                yield row
+        finally:
+            self._record(started, rows)
+
+    def _compile(
+        self,
+        query: ClauseElement | BoundStatement,
+    ) -> tuple[str, list, Any]:
+        """A private method compiling the query unless precompiled.
+
+        Args:
+            query (ClauseElement | BoundStatement): The query.
+
+        Returns:
+            tuple[str, list, Any]: The SQL, its arguments and the result
+                columns.
+        """
+
+        if isinstance(query, BoundStatement):
+            statement = query.statement
+
+            if statement.name not in self._result_columns:
+                self._result_columns[statement.name] = \
+                    super()._compile(statement.query)[2]
+
+            self._compiled = (statement.name, statement.sql, query.args)
+
+            return (
+                statement.sql,
+                query.args,
+                self._result_columns[statement.name],
+            )
+
+        sql, args, result_columns = super()._compile(query)
+        self._compiled = ("", sql, args)
+
+        return sql, args, result_columns
+
+    def _record(self, started: float, rows: int) -> None:
+        """A private method recording the last compiled statement.
+
+        Args:
+            started (float): The `perf_counter` value at the start.
+            rows (int): The number of returned rows.
+        """
+
+        if self._database.query_stats is not None:
+            self._database.query_stats.record(
+                *self._compiled,
+                seconds=time.perf_counter() - started,
+                rows=rows,
+            )
+
+
+class PooledDatabase(databases.Database):
+    """A class of the database using the pooled postgres backend."""
+
+    SUPPORTED_BACKENDS = {
+        **databases.Database.SUPPORTED_BACKENDS,
+        "postgresql": "airportapi.utils.pool:PooledPostgresBackend",
+        "postgres": "airportapi.utils.pool:PooledPostgresBackend",
+    }
+
+    @property
+    def backend(self) -> PooledPostgresBackend:
+        """The property returning the backend with its pool statistics.
+
+        Returns:
+            PooledPostgresBackend: The backend.
+        """
+
+        return self._backend  # type: ignore
+
+    @property
+    def query_stats(self) -> Optional[QueryStats]:
+        """The property returning the statistics of the statements.
+
+        Returns:
+            Optional[QueryStats]: The statistics, None if disabled.
+        """
+
+        return self.backend.query_stats
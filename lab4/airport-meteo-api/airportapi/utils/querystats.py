@@ -0,0 +1,170 @@
+"""Module containing the statistics of executed SQL statements."""
+
+import logging
+import re
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+from airportapi.utils.metrics import LATENCY_BUCKETS, Histogram
+
+logger = logging.getLogger(__name__)
+
+OTHER_SHAPE = "other"
+
+_WHITESPACE = re.compile(r"\s+")
+_PARAMETER_LIST = re.compile(r"\$\d+(?:, \$\d+)+")
+
+
+class StatementStats:
+    """A class aggregating executions of a single statement shape."""
+
+    latency: Histogram
+    rows: int
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        """The initializer of the `statement stats`.
+
+        Args:
+            bounds (Sequence[float]): The upper bounds of the latency
+                buckets in seconds.
+        """
+
+        self.latency = Histogram(bounds)
+        self.rows = 0
+
+
+class QueryStats:
+    """A class recording latency histograms and row counts of statements.
+
+    Statements are grouped by shape, which is the name of a precompiled
+    statement or the SQL text with its placeholders. Lists of
+    placeholders, e.g. of `IN` clauses, are collapsed, so their length
+    does not make a new shape. Statements slower than the threshold are
+    logged with the values of their parameters redacted.
+    """
+
+    bounds: tuple[float, ...]
+    _slow_threshold: Optional[float]
+    _max_shapes: int
+    _statements: dict[str, StatementStats]
+
+    def __init__(
+        self,
+        slow_threshold: Optional[float] = None,
+        max_shapes: int = 500,
+        bounds: Iterable[float] = LATENCY_BUCKETS,
+    ) -> None:
+        """The initializer of the `query stats`.
+
+        Args:
+            slow_threshold (Optional[float], optional): The duration
+                in seconds above which the statement is logged.
+                Defaults to None, which disables the log.
+            max_shapes (int, optional): The maximal number of tracked
+                shapes, further ones are counted as `other`.
+                Defaults to 500.
+            bounds (Iterable[float], optional): The upper bounds
+                of the latency buckets in seconds.
+                Defaults to LATENCY_BUCKETS.
+        """
+
+        self.bounds = tuple(sorted(bounds))
+        self._slow_threshold = slow_threshold
+        self._max_shapes = max_shapes
+        self._statements = {}
+
+    @property
+    def statements(self) -> Mapping[str, StatementStats]:
+        """The property returning the statistics by statement shapes.
+
+        Returns:
+            Mapping[str, StatementStats]: The statistics.
+        """
+
+        return self._statements
+
+    def record(
+        self,
+        shape: str,
+        sql: str,
+        args: Sequence[Any],
+        seconds: float,
+        rows: int,
+    ) -> None:
+        """The method recording an execution of the statement.
+
+        Args:
+            shape (str): The name of the statement, empty if not named.
+            sql (str): The executed SQL.
+            args (Sequence[Any]): The values of the parameters.
+            seconds (float): The duration of the execution.
+            rows (int): The number of returned rows.
+        """
+
+        shape = shape or self.shape(sql)
+        stats = self._statements.get(shape)
+
+        if stats is None:
+            if len(self._statements) >= self._max_shapes:
+                shape = OTHER_SHAPE
+
+            stats = self._statements.setdefault(
+                shape,
+                StatementStats(self.bounds),
+            )
+
+        stats.latency.observe(seconds)
+        stats.rows += rows
+
+        if self._slow_threshold is not None \
+                and seconds >= self._slow_threshold:
+            logger.warning(
+                "Slow query %.1fms, %d rows: %s; params: %s",
+                seconds * 1000,
+                rows,
+                shape,
+                redact(args),
+                extra={
+                    "query_shape": shape,
+                    "duration_ms": round(seconds * 1000, 3),
+                    "rows": rows,
+                },
+            )
+
+    def reset(self) -> None:
+        """The method removing all recorded statistics."""
+
+        self._statements.clear()
+
+    @staticmethod
+    def shape(sql: str) -> str:
+        """The method normalizing the SQL into the statement shape.
+
+        Args:
+            sql (str): The SQL with `$n` placeholders.
+
+        Returns:
+            str: The single-line SQL with placeholder lists collapsed.
+        """
+
+        return _PARAMETER_LIST.sub(
+            "$n, ...",
+            _WHITESPACE.sub(" ", sql).strip(),
+        )
+
+
+def redact(args: Sequence[Any]) -> list[str]:
+    """Function replacing the values of parameters with their types.
+
+    Args:
+        args (Sequence[Any]): The values of the parameters.
+
+    Returns:
+        list[str]: The type names, with lengths of sized values.
+    """
+
+    return [
+        f"{type(arg).__name__}[{len(arg)}]"
+        if isinstance(arg, (str, bytes, list, tuple))
+        else type(arg).__name__
+        for arg in args
+    ]
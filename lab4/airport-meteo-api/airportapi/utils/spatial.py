@@ -0,0 +1,317 @@
+"""Module containing the in-memory spatial index of airports."""
+
+import math
+from typing import Iterable
+
+import numpy as np
+
+from airportapi.utils.geo import (
+    EARTH_RADIUS_KM,
+    HALF_CIRCUMFERENCE_KM,
+    bounding_box,
+    chord_for_distance,
+    distance_for_chord,
+    to_unit_vector,
+)
+from airportapi.utils.geoarray import (
+    points_along_route,
+    route_points,
+    to_unit_vectors,
+)
+
+
+class SpatialIndex:
+    """A class representing a lat/lon grid index over unit-sphere points.
+
+    Every point is kept in the grid cell covering its coordinates together
+    with its unit-sphere vector, so the exact distance check of a candidate
+    is a few multiplications instead of trigonometry.
+    """
+
+    _cell_size: float
+    _rows: int
+    _columns: int
+    _cells: dict[tuple[int, int], set[int]]
+    _points: dict[int, tuple[tuple[int, int], float, float, float]]
+
+    def __init__(self, cell_size: float = 1.0) -> None:
+        """The initializer of the `spatial index`.
+
+        Args:
+            cell_size (float, optional): The size of the grid cell
+                in degrees. Defaults to 1.0.
+        """
+
+        self._cell_size = cell_size
+        self._rows = math.ceil(180 / cell_size)
+        self._columns = math.ceil(360 / cell_size)
+        self._cells = {}
+        self._points = {}
+
+    def __len__(self) -> int:
+        """The method returning number of indexed points.
+
+        Returns:
+            int: The number of points.
+        """
+
+        return len(self._points)
+
+    def __contains__(self, key: object) -> bool:
+        """The method checking if the key is indexed.
+
+        Args:
+            key (object): The key of the point.
+
+        Returns:
+            bool: True if the point is indexed.
+        """
+
+        return key in self._points
+
+    def clear(self) -> None:
+        """The method removing all points from the index."""
+
+        self._cells = {}
+        self._points = {}
+
+    def rebuild(self, points: Iterable[tuple[int, float, float]]) -> None:
+        """The method replacing the index content with provided points.
+
+        Args:
+            points (Iterable[tuple[int, float, float]]): The keys
+                with latitudes and longitudes.
+        """
+
+        self.clear()
+
+        for key, latitude, longitude in points:
+            self.insert(key, latitude, longitude)
+
+    def insert(self, key: int, latitude: float, longitude: float) -> None:
+        """The method adding a point or moving an existing one.
+
+        Args:
+            key (int): The key of the point.
+            latitude (float): The latitude of the point.
+            longitude (float): The longitude of the point.
+        """
+
+        self.remove(key)
+
+        cell = self._cell_of(latitude, longitude)
+        self._cells.setdefault(cell, set()).add(key)
+        self._points[key] = (cell, *to_unit_vector(latitude, longitude))
+
+    def remove(self, key: int) -> bool:
+        """The method removing a point from the index.
+
+        Args:
+            key (int): The key of the point.
+
+        Returns:
+            bool: True if the point was indexed.
+        """
+
+        if not (point := self._points.pop(key, None)):
+            return False
+
+        cell = self._cells[point[0]]
+        cell.discard(key)
+
+        if not cell:
+            del self._cells[point[0]]
+
+        return True
+
+    def within(
+        self,
+        latitude: float,
+        longitude: float,
+        radius: float,
+    ) -> list[tuple[int, float]]:
+        """The method finding points in the radius of the location.
+
+        Args:
+            latitude (float): The latitude of the search center.
+            longitude (float): The longitude of the search center.
+            radius (float): The radius of the search in kilometres.
+
+        Returns:
+            list[tuple[int, float]]: The keys with distances in kilometres,
+                ordered from the closest one.
+        """
+
+        x, y, z = to_unit_vector(latitude, longitude)
+        max_chord = chord_for_distance(radius) ** 2
+        found = []
+
+        for key in self._candidates(latitude, longitude, radius):
+            _, px, py, pz = self._points[key]
+            chord = (px - x) ** 2 + (py - y) ** 2 + (pz - z) ** 2
+
+            if chord <= max_chord:
+                found.append((chord, key))
+
+        found.sort()
+
+        return [(key, distance_for_chord(math.sqrt(chord)))
+                for chord, key in found]
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        count: int,
+        radius: float = 100.0,
+    ) -> list[tuple[int, float]]:
+        """The method finding points closest to the location.
+
+        The search radius starts small and is doubled until enough points
+        are found, so dense areas never look beyond neighbouring cells.
+
+        Args:
+            latitude (float): The latitude of the search center.
+            longitude (float): The longitude of the search center.
+            count (int): The number of points to find.
+            radius (float, optional): The initial search radius
+                in kilometres. Defaults to 100.0.
+
+        Returns:
+            list[tuple[int, float]]: The keys with distances in kilometres,
+                ordered from the closest one.
+        """
+
+        if count <= 0:
+            return []
+
+        while True:
+            found = self.within(latitude, longitude, radius)
+
+            if len(found) >= count or radius >= HALF_CIRCUMFERENCE_KM:
+                return found[:count]
+
+            radius *= 2
+
+    def along_route(
+        self,
+        start: tuple[float, float],
+        end: tuple[float, float],
+        width: float,
+    ) -> list[tuple[int, float, float]]:
+        """The method finding points close to the great-circle route.
+
+        Circles covering the corridor are placed along the route, so only
+        points of the cells around it are checked. Their distances
+        from the route are calculated at once.
+
+        Args:
+            start (tuple[float, float]): The latitude and longitude
+                of the start.
+            end (tuple[float, float]): The latitude and longitude
+                of the end.
+            width (float): The maximal distance from the route
+                in kilometres.
+
+        Raises:
+            ValueError: If the ends are the same or antipodal points.
+
+        Returns:
+            list[tuple[int, float, float]]: The keys with distances from
+                and along the route in kilometres, ordered along it.
+        """
+
+        start_vector, end_vector = to_unit_vectors(
+            (start[0], end[0]),
+            (start[1], end[1]),
+        )
+        step = max(width, math.radians(self._cell_size) * EARTH_RADIUS_KM)
+        cells: set[tuple[int, int]] = set()
+
+        for x, y, z in route_points(start_vector, end_vector, step):
+            latitude = math.degrees(math.asin(max(-1.0, min(z, 1.0))))
+            longitude = math.degrees(math.atan2(y, x))
+            cells.update(
+                self._cells_around(latitude, longitude, width + step / 2)
+            )
+
+        keys = [key for cell in cells for key in self._cells.get(cell, ())]
+
+        return points_along_route(
+            keys,
+            np.array([self._points[key][1:] for key in keys]),
+            start_vector,
+            end_vector,
+            width,
+        )
+
+    def _candidates(
+        self,
+        latitude: float,
+        longitude: float,
+        radius: float,
+    ) -> Iterable[int]:
+        """A private method yielding keys from cells covering the circle.
+
+        Args:
+            latitude (float): The latitude of the circle center.
+            longitude (float): The longitude of the circle center.
+            radius (float): The radius of the circle in kilometres.
+
+        Yields:
+            int: The keys of the candidate points.
+        """
+
+        for cell in self._cells_around(latitude, longitude, radius):
+            if keys := self._cells.get(cell):
+                yield from keys
+
+    def _cells_around(
+        self,
+        latitude: float,
+        longitude: float,
+        radius: float,
+    ) -> Iterable[tuple[int, int]]:
+        """A private method yielding grid cells covering the circle.
+
+        Args:
+            latitude (float): The latitude of the circle center.
+            longitude (float): The longitude of the circle center.
+            radius (float): The radius of the circle in kilometres.
+
+        Yields:
+            tuple[int, int]: The row and column of the cell.
+        """
+
+        min_lat, max_lat, min_lon, max_lon = \
+            bounding_box(latitude, longitude, radius)
+        first_row, first_column = self._cell_of(min_lat, min_lon)
+        last_row, last_column = self._cell_of(max_lat, max_lon)
+
+        if max_lon - min_lon >= 360 - self._cell_size:
+            columns = list(range(self._columns))
+        elif min_lon > max_lon or first_column > last_column:
+            columns = [*range(first_column, self._columns),
+                       *range(0, last_column + 1)]
+        else:
+            columns = list(range(first_column, last_column + 1))
+
+        for row in range(first_row, last_row + 1):
+            for column in columns:
+                yield row, column
+
+    def _cell_of(self, latitude: float, longitude: float) -> tuple[int, int]:
+        """A private method calculating the grid cell of the location.
+
+        Args:
+            latitude (float): The latitude of the location.
+            longitude (float): The longitude of the location.
+
+        Returns:
+            tuple[int, int]: The row and column of the cell.
+        """
+
+        row = int((latitude + 90) // self._cell_size)
+        column = int((longitude + 180) // self._cell_size)
+
+        return min(max(row, 0), self._rows - 1), column % self._columns
@@ -0,0 +1,129 @@
+"""Module containing the registry of precompiled query shapes."""
+
+from typing import Any, Callable, Optional
+
+from databases.backends.dialects.psycopg import dialect as psycopg_dialect
+from sqlalchemy.sql import ClauseElement
+from sqlalchemy.sql.compiler import SQLCompiler
+
+# The dialect the `databases` asyncpg backend compiles queries with.
+DIALECT = psycopg_dialect(paramstyle="pyformat")
+
+
+class BoundStatement(ClauseElement):
+    """A class of the precompiled query with its positional arguments.
+
+    It is a clause element, so it is accepted wherever `databases` takes
+    a query. The pooled backend runs it without compiling.
+    """
+
+    statement: "Statement"
+    args: list[Any]
+
+    def __init__(self, statement: "Statement", args: list[Any]) -> None:
+        """The initializer of the `bound statement`.
+
+        Args:
+            statement (Statement): The precompiled query shape.
+            args (list[Any]): The processed values of the parameters.
+        """
+
+        self.statement = statement
+        self.args = args
+
+
+class Statement:
+    """A class of a fixed query shape compiled once.
+
+    The SQL text with `$n` placeholders, the order of the parameters
+    and the result columns are prepared upfront, so running the query
+    only binds the values. asyncpg keeps the statement prepared per
+    connection in its statement cache keyed by the SQL text.
+    """
+
+    name: str
+    sql: str
+    query: ClauseElement
+    _params: tuple[str, ...]
+    _defaults: dict[str, Any]
+    _processors: tuple[Optional[Callable[[Any], Any]], ...]
+
+    def __init__(self, name: str, query: ClauseElement) -> None:
+        """The initializer of the `statement`.
+
+        Args:
+            name (str): The name of the query shape.
+            query (ClauseElement): The query with named bind parameters.
+        """
+
+        compiled = query.compile(dialect=DIALECT)
+        assert isinstance(compiled, SQLCompiler), "Query is not a statement"
+        values = compiled.params
+        params = sorted(values)
+
+        self.name = name
+        self.sql = compiled.string % {
+            param: f"${position}"
+            for position, param in enumerate(params, start=1)
+        }
+        self.query = query
+        self._params = tuple(params)
+        self._defaults = {
+            param: value
+            for param, value in values.items()
+            if value is not None
+        }
+        self._processors = tuple(
+            compiled.binds[param].type
+            .dialect_impl(DIALECT)
+            .bind_processor(DIALECT)
+            for param in params
+        )
+
+    def bind(self, **values: Any) -> BoundStatement:
+        """The method binding the values of the parameters.
+
+        Literal values of the query, e.g. of `LIMIT`, are used unless
+        overridden.
+
+        Args:
+            **values (Any): The values by the parameter names.
+
+        Raises:
+            KeyError: If a parameter has no value.
+
+        Returns:
+            BoundStatement: The statement ready to run.
+        """
+
+        values = {**self._defaults, **values}
+
+        return BoundStatement(self, [
+            process(values[param]) if process else values[param]
+            for param, process in zip(self._params, self._processors)
+        ])
+
+
+STATEMENTS: dict[str, Statement] = {}
+
+
+def register(name: str, query: ClauseElement) -> Statement:
+    """Function compiling the query shape and adding it to the registry.
+
+    Args:
+        name (str): The unique name of the query shape.
+        query (ClauseElement): The query with named bind parameters.
+
+    Raises:
+        ValueError: If the name is already registered.
+
+    Returns:
+        Statement: The compiled statement.
+    """
+
+    if name in STATEMENTS:
+        raise ValueError(f"Statement {name} is already registered")
+
+    STATEMENTS[name] = Statement(name, query)
+
+    return STATEMENTS[name]
@@ -0,0 +1,277 @@
+"""A benchmark of mapping airport rows and of `GET /airport/all`.
+
+Run from the project directory against an initialized database:
+
+    python -m benchmarks.airports --airports 20000
+
+The app is served by uvicorn on a local port, so the response is really
+streamed to the client. Peak memory is the one traced by `tracemalloc`
+while serving the requests.
+
+The synthetic airports are inserted in the rolled back transaction
+of the app database, so the stored data is left untouched.
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import Any, Callable, Sequence
+
+import httpx
+import uvicorn
+from sqlalchemy import join, select
+
+from airportapi.db import (
+    airport_table,
+    continent_table,
+    country_table,
+    database,
+    init_db,
+)
+from airportapi.core.domain.location import Continent
+from airportapi.infrastructure.dto.airportdto import AirportDTO
+from airportapi.infrastructure.dto.countrydto import CountryDTO
+from airportapi.infrastructure.repositories.airportdb import (
+    AIRPORT_DETAILS,
+    DETAIL_COLUMNS,
+)
+from airportapi.infrastructure.repositories.reference import ReferenceData
+from airportapi.main import app
+
+JOINED_DETAILS = (
+    select(
+        airport_table,
+        country_table.c.name.label("country_name"),
+        country_table.c.alias.label("country_alias"),
+        continent_table.c.id.label("continent_id"),
+        continent_table.c.name.label("continent_name"),
+        continent_table.c.alias.label("continent_alias"),
+    )
+    .select_from(
+        join(
+            airport_table,
+            join(
+                country_table,
+                continent_table,
+                country_table.c.continent_id == continent_table.c.id,
+            ),
+            airport_table.c.country_id == country_table.c.id,
+        )
+    )
+)
+
+AIRPORT_FIELDS = tuple(
+    field for field in AirportDTO.model_fields if field != "country"
+)
+COUNTRY_LABELS = {
+    "id": "country_id",
+    "name": "country_name",
+    "alias": "country_alias",
+}
+CONTINENT_LABELS = {
+    "id": "continent_id",
+    "name": "continent_name",
+    "alias": "continent_alias",
+}
+
+
+def from_joined_record(record: Any) -> AirportDTO:
+    """Function building the validated DTO of a joined airport row.
+
+    This is the mapping used before the reference map, kept as the
+    baseline of the benchmark.
+
+    Args:
+        record (Any): The row of `JOINED_DETAILS`.
+
+    Returns:
+        AirportDTO: The airport details with the country.
+    """
+
+    return AirportDTO(
+        **{field: record[field] for field in AIRPORT_FIELDS},
+        country=CountryDTO(
+            **{
+                field: record[label]
+                for field, label in COUNTRY_LABELS.items()
+            },
+            continent=Continent(**{
+                field: record[label]
+                for field, label in CONTINENT_LABELS.items()
+            }),
+        ),
+    )
+
+
+def measure(name: str, rows: int, function: Callable[[], Any]) -> None:
+    """Function timing the function and printing rows per second.
+
+    Args:
+        name (str): The name of the variant.
+        rows (int): The number of processed rows.
+        function (Callable[[], Any]): The measured function.
+    """
+
+    started = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{name:<28} {rows:>7} rows {elapsed:8.3f}s "
+        f"{rows / elapsed:10.0f}/s"
+    )
+
+
+async def request(
+    client: httpx.AsyncClient,
+    params: dict[str, str],
+) -> tuple[float, float]:
+    """Function reading `GET /airport/all` as a stream.
+
+    Args:
+        client (httpx.AsyncClient): The client of the app.
+        params (dict[str, str]): The query parameters.
+
+    Returns:
+        tuple[float, float]: The time to the first byte and the total time.
+    """
+
+    started = time.perf_counter()
+    first_byte = None
+
+    async with client.stream("GET", "/airport/all", params=params) as response:
+        response.raise_for_status()
+
+        async for _ in response.aiter_raw():
+            if first_byte is None:
+                first_byte = time.perf_counter() - started
+
+    elapsed = time.perf_counter() - started
+
+    return first_byte or elapsed, elapsed
+
+
+async def seed(count: int) -> None:
+    """Function inserting synthetic airports of the first country.
+
+    Args:
+        count (int): The number of airports.
+    """
+
+    country_id = await database.fetch_val(select(country_table.c.id).limit(1))
+
+    if country_id is None:
+        raise SystemExit("The database holds no countries to attach to.")
+
+    await database.execute_many(
+        airport_table.insert(),
+        [
+            {
+                "name": f"Benchmark {index}",
+                "icao_code": f"B{index:05d}",
+                "iata_code": f"{index:05d}",
+                "country_id": country_id,
+                "latitude": (index % 180) - 89.5,
+                "longitude": (index % 360) - 179.5,
+                "elevation": index % 3000,
+            }
+            for index in range(count)
+        ],
+    )
+
+
+async def main(airports: int, requests: int, port: int) -> None:
+    """Function running the benchmark.
+
+    Args:
+        airports (int): The number of synthetic airports.
+        requests (int): The number of timed `GET /airport/all` requests.
+        port (int): The local port of the benchmarked server.
+    """
+
+    await init_db()
+    await database.connect()
+
+    try:
+        await seed(airports)
+        reference = ReferenceData()
+        await reference.load()
+        to_airport_dto = AirportDTO.converter(
+            DETAIL_COLUMNS,
+            reference.country,
+        )
+
+        started = time.perf_counter()
+        records = await database.fetch_all(JOINED_DETAILS)
+        print(f"{'joined query':<28} {time.perf_counter() - started:8.3f}s")
+        started = time.perf_counter()
+        rows: Sequence[Any] = [
+            record._mapping
+            for record in await database.fetch_all(AIRPORT_DETAILS)
+        ]
+        print(f"{'airports query':<28} {time.perf_counter() - started:8.3f}s")
+
+        measure(
+            "validated (joined)",
+            len(records),
+            lambda: [from_joined_record(record) for record in records],
+        )
+        measure(
+            "converter (reference map)",
+            len(rows),
+            lambda: [to_airport_dto(row) for row in rows],
+        )
+
+        server = uvicorn.Server(uvicorn.Config(
+            app,
+            port=port,
+            lifespan="off",
+            log_level="warning",
+        ))
+        serving = asyncio.create_task(server.serve())
+
+        while not server.started:
+            await asyncio.sleep(0.01)
+
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}",
+            timeout=None,
+        ) as client:
+            for name, params in (
+                ("GET /airport/all", {}),
+                ("GET /airport/all?stream", {"stream": "true"}),
+            ):
+                await request(client, params)
+                tracemalloc.start()
+                first_byte = elapsed = 0.0
+
+                for _ in range(requests):
+                    first, total = await request(client, params)
+                    first_byte += first
+                    elapsed += total
+
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                count = len(records) * requests
+                print(
+                    f"{name:<28} {count:>7} rows {elapsed:8.3f}s "
+                    f"{count / elapsed:10.0f}/s  first byte "
+                    f"{first_byte / requests * 1000:7.1f}ms  "
+                    f"peak {peak / 2 ** 20:6.1f}MiB"
+                )
+
+        server.should_exit = True
+        await serving
+    finally:
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--airports", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=3)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.airports, args.requests, args.port))
@@ -0,0 +1,126 @@
+"""A benchmark comparing inline and process-pool METAR decoding.
+
+Run from the project directory:
+
+    python -m benchmarks.decode --reports 20000 --workers 4
+
+Besides the throughput, the longest stall of the event loop is measured
+with a heartbeat task, which shows how long API requests would wait.
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from airportapi.core.domain.observation import RawMetar
+from airportapi.infrastructure.ingestion.decoder import decode_report
+from airportapi.infrastructure.ingestion.pool import DecodePool
+
+CORPUS = Path(__file__).with_name("metar_corpus.txt")
+HEARTBEAT = 0.001
+
+
+def load_corpus(count: int) -> list[RawMetar]:
+    """Function loading the bundled reports repeated up to the count.
+
+    Args:
+        count (int): The number of reports.
+
+    Returns:
+        list[RawMetar]: The reports.
+    """
+
+    reports = []
+
+    for line in CORPUS.read_text().splitlines():
+        day, hour, raw = line.split(" ", 2)
+        reports.append(RawMetar(
+            icao_code=raw[:4],
+            observation_time=datetime.strptime(
+                f"{day} {hour}",
+                "%Y/%m/%d %H:%M",
+            ).replace(tzinfo=timezone.utc),
+            raw=raw,
+        ))
+
+    return [reports[index % len(reports)] for index in range(count)]
+
+
+async def measure(
+    name: str,
+    decode: Callable[[], Awaitable[int]],
+) -> None:
+    """Function timing the decoding and the longest event loop stall.
+
+    Args:
+        name (str): The name of the variant.
+        decode (Callable[[], Awaitable[int]]): The decoding coroutine
+            returning the number of decoded reports.
+    """
+
+    stall = 0.0
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        nonlocal stall
+        loop = asyncio.get_running_loop()
+
+        while not done.is_set():
+            started = loop.time()
+            await asyncio.sleep(HEARTBEAT)
+            stall = max(stall, loop.time() - started - HEARTBEAT)
+
+    task = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    decoded = await decode()
+    elapsed = time.perf_counter() - started
+
+    done.set()
+    await task
+
+    print(
+        f"{name:<22} {decoded:>7} reports {elapsed:8.3f}s "
+        f"{decoded / elapsed:10.0f}/s  max loop stall {stall * 1000:8.1f}ms"
+    )
+
+
+async def main(reports: int, workers: int | None, chunk_size: int) -> None:
+    """Function running the benchmark.
+
+    Args:
+        reports (int): The number of decoded reports.
+        workers (int | None): The number of worker processes.
+        chunk_size (int): The number of reports sent to a worker at once.
+    """
+
+    corpus = load_corpus(reports)
+
+    async def inline() -> int:
+        return sum(1 for report in corpus if decode_report(report))
+
+    pool = DecodePool(workers=workers, chunk_size=chunk_size)
+
+    async def pooled() -> int:
+        return len(await pool.decode(corpus))
+
+    try:
+        await pool.decode(corpus[:1])
+        await measure("inline", inline)
+        await measure(f"pool ({pool.workers} workers)", pooled)
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.reports, args.workers, args.chunk_size))
@@ -0,0 +1,109 @@
+"""A benchmark of the vectorized distance matrix and route corridor.
+
+Run from the project directory, no database is needed:
+
+    python -m benchmarks.routes --airports 60000 --matrix 200 --width 50
+
+Random airports are put into the spatial index. The distance matrix
+is calculated with the scalar haversine function per pair and with
+the vectorized one, then airports along a transatlantic route are
+searched by checking every airport at once and with the index.
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable
+
+from airportapi.utils.geo import haversine
+from airportapi.utils.geoarray import (
+    distance_matrix,
+    route_distances,
+    to_unit_vectors,
+)
+from airportapi.utils.spatial import SpatialIndex
+
+ROUTE = ((52.1657, 20.9671), (40.6413, -73.7781))
+
+
+def measure(name: str, function: Callable[[], Any], repeats: int) -> Any:
+    """Function printing the mean duration of the function.
+
+    Args:
+        name (str): The name of the variant.
+        function (Callable[[], Any]): The measured function.
+        repeats (int): The number of calls.
+
+    Returns:
+        Any: The result of the last call.
+    """
+
+    started = time.perf_counter()
+
+    for _ in range(repeats):
+        result = function()
+
+    elapsed = (time.perf_counter() - started) / repeats
+    print(f"{name:<28} {elapsed * 1000:9.3f}ms")
+
+    return result
+
+
+def main(airports: int, matrix: int, width: float, repeats: int) -> None:
+    """Function running the benchmark.
+
+    Args:
+        airports (int): The number of indexed airports.
+        matrix (int): The number of airports of the distance matrix.
+        width (float): The width of the corridor in kilometres.
+        repeats (int): The number of calls per variant.
+    """
+
+    random.seed(0)
+    points = [
+        (random.uniform(-90, 90), random.uniform(-180, 180))
+        for _ in range(airports)
+    ]
+    index = SpatialIndex()
+    index.rebuild(
+        (key, latitude, longitude)
+        for key, (latitude, longitude) in enumerate(points)
+    )
+    chosen = points[:matrix]
+
+    measure(
+        f"matrix {matrix}x{matrix} scalar",
+        lambda: [[haversine(*a, *b) for b in chosen] for a in chosen],
+        1,
+    )
+    measure(
+        f"matrix {matrix}x{matrix} vectorized",
+        lambda: distance_matrix(to_unit_vectors(*zip(*chosen))).tolist(),
+        repeats,
+    )
+
+    vectors = to_unit_vectors(*zip(*points))
+    start, end = to_unit_vectors(*zip(*ROUTE))
+
+    measure(
+        f"corridor {width:g}km full scan",
+        lambda: (route_distances(vectors, start, end)[0] <= width).sum(),
+        repeats,
+    )
+    found = measure(
+        f"corridor {width:g}km indexed",
+        lambda: index.along_route(ROUTE[0], ROUTE[1], width),
+        repeats,
+    )
+    print(f"{len(found)} of {airports} airports along the route")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--airports", type=int, default=60000)
+    parser.add_argument("--matrix", type=int, default=200)
+    parser.add_argument("--width", type=float, default=50.0)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    main(args.airports, args.matrix, args.width, args.repeats)
@@ -0,0 +1,129 @@
+"""A benchmark of precompiled statements against per-call compilation.
+
+Run from the project directory against an initialized database:
+
+    python -m benchmarks.statements --lookups 20000 --concurrency 32
+
+Airports are looked up by id and ICAO code the way the repository
+does on a cache miss, first with the query expression built and
+compiled per call, as the repository did before, then with
+the precompiled statement. CPU time of the process is reported per
+lookup, so the saved compilation shows regardless of the DB latency.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import select
+
+from airportapi.db import airport_table, database, init_db
+from airportapi.infrastructure.repositories.airportdb import (
+    AIRPORT_BY_ICAO,
+    AIRPORT_BY_ID,
+    AIRPORT_DETAILS,
+)
+
+Lookup = Callable[[Any], Awaitable[Any]]
+
+
+async def load(
+    lookup: Lookup,
+    keys: list[Any],
+    lookups: int,
+    concurrency: int,
+) -> tuple[float, float]:
+    """Function running the lookups by concurrent workers.
+
+    Args:
+        lookup (Lookup): The lookup of the airport by the key.
+        keys (list[Any]): The looked up keys, used in turn.
+        lookups (int): The number of lookups.
+        concurrency (int): The number of concurrent workers.
+
+    Returns:
+        tuple[float, float]: The elapsed time and the CPU time.
+    """
+
+    async def worker(offset: int) -> None:
+        for index in range(offset, lookups, concurrency):
+            await lookup(keys[index % len(keys)])
+
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    await asyncio.gather(*(worker(offset) for offset in range(concurrency)))
+    cpu = time.process_time() - cpu_started
+
+    return time.perf_counter() - started, cpu
+
+
+async def main(lookups: int, concurrency: int) -> None:
+    """Function running the benchmark.
+
+    Args:
+        lookups (int): The number of lookups per variant.
+        concurrency (int): The number of concurrent workers.
+    """
+
+    await init_db()
+    await database.connect()
+
+    try:
+        airports = await database.fetch_all(
+            select(airport_table.c.id, airport_table.c.icao_code)
+        )
+
+        if not airports:
+            raise SystemExit("The database holds no airports to look up.")
+
+        ids = [airport["id"] for airport in airports]
+        codes = [airport["icao_code"] for airport in airports]
+        variants: list[tuple[str, Lookup, list[Any]]] = [
+            (
+                "get_by_id compiled",
+                lambda key: database.fetch_one(
+                    AIRPORT_DETAILS.where(airport_table.c.id == key)
+                ),
+                ids,
+            ),
+            (
+                "get_by_id precompiled",
+                lambda key: database.fetch_one(
+                    AIRPORT_BY_ID.bind(airport_id=key)
+                ),
+                ids,
+            ),
+            (
+                "get_by_icao compiled",
+                lambda key: database.fetch_one(
+                    AIRPORT_DETAILS.where(airport_table.c.icao_code == key)
+                ),
+                codes,
+            ),
+            (
+                "get_by_icao precompiled",
+                lambda key: database.fetch_one(AIRPORT_BY_ICAO.bind(code=key)),
+                codes,
+            ),
+        ]
+
+        for name, lookup, keys in variants:
+            await load(lookup, keys, concurrency, concurrency)
+            elapsed, cpu = await load(lookup, keys, lookups, concurrency)
+            print(
+                f"{name:<24} {lookups:>7} lookups {elapsed:8.3f}s "
+                f"{lookups / elapsed:9.0f}/s  "
+                f"CPU {cpu / lookups * 1e6:7.1f}us/lookup"
+            )
+    finally:
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.lookups, args.concurrency))
@@ -0,0 +1,228 @@
+"""Tests of the airport import from CSV documents."""
+
+import asyncio
+from typing import AsyncIterator, Sequence
+
+import pytest
+
+from airportapi.core.domain.airport import AirportImportReport, AirportIn
+from airportapi.core.domain.location import Country
+from airportapi.infrastructure.services.airportimport import (
+    AirportImportService,
+)
+
+HEADER = "icao_code,name,iata_code,latitude,longitude,elevation,country\n"
+
+
+class AirportRepositoryStub:
+    """A class storing upserted airports, rejecting the duplicated IATA."""
+
+    airports: dict[str, AirportIn]
+    batches: list[int]
+
+    def __init__(self) -> None:
+        """The initializer of the `airport repository stub`."""
+
+        self.airports = {}
+        self.batches = []
+
+    async def upsert_airports(self, airports: Sequence[AirportIn]) -> int:
+        """The method storing the airports like the DB would.
+
+        Args:
+            airports (Sequence[AirportIn]): The airports.
+
+        Raises:
+            ValueError: If an IATA code is used by another airport.
+
+        Returns:
+            int: The number of upserted airports.
+        """
+
+        self.batches.append(len(airports))
+        taken = {
+            airport.iata_code: airport.icao_code
+            for airport in self.airports.values()
+            if airport.iata_code
+        }
+
+        for airport in airports:
+            if taken.setdefault(airport.iata_code, airport.icao_code) \
+                    != airport.icao_code:
+                raise ValueError(f"Key (iata_code)=({airport.iata_code})")
+
+        self.airports.update(
+            (airport.icao_code, airport) for airport in airports
+        )
+
+        return len(airports)
+
+
+class CountryRepositoryStub:
+    """A class returning the known countries."""
+
+    async def get_all_countries(self) -> list[Country]:
+        """The method returning two countries.
+
+        Returns:
+            list[Country]: The countries.
+        """
+
+        return [
+            Country(id=1, name="Poland", alias="PL", continent_id=1),
+            Country(id=2, name="United States", alias="US", continent_id=2),
+        ]
+
+
+async def _chunks(text: str, size: int = 7) -> AsyncIterator[bytes]:
+    """A private function splitting the document into small chunks.
+
+    Args:
+        text (str): The CSV document.
+        size (int, optional): The size of the chunks. Defaults to 7.
+
+    Yields:
+        bytes: The next chunk.
+    """
+
+    data = text.encode()
+
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+def _import(
+    text: str,
+    repository: AirportRepositoryStub,
+    chunk_size: int = 1000,
+) -> AirportImportReport:
+    """A private function importing the document into the repository.
+
+    Args:
+        text (str): The CSV document.
+        repository (AirportRepositoryStub): The airport repository.
+        chunk_size (int, optional): The number of rows upserted at once.
+            Defaults to 1000.
+
+    Returns:
+        AirportImportReport: The outcome of the import.
+    """
+
+    service = AirportImportService(
+        repository,  # type: ignore[arg-type]
+        CountryRepositoryStub(),  # type: ignore[arg-type]
+        chunk_size=chunk_size,
+    )
+
+    return asyncio.run(service.import_csv(_chunks(text)))
+
+
+@pytest.fixture
+def repository() -> AirportRepositoryStub:
+    """Fixture preparing the empty airport repository.
+
+    Returns:
+        AirportRepositoryStub: The repository.
+    """
+
+    return AirportRepositoryStub()
+
+
+def test_rows_are_parsed(repository: AirportRepositoryStub) -> None:
+    """Test importing airports with quoted fields and DMS coordinates."""
+
+    report = _import(
+        HEADER
+        + 'EPWA,"Warsaw Chopin, Okęcie",WAW,52.1657,20.9671,361,Poland\n'
+        + 'KJFK,"John F. Kennedy ""JFK""",JFK,40°38\'23"N,73°46\'44"W,13,us\n'
+        + "\n",
+        repository,
+    )
+
+    assert report == AirportImportReport(rows=2, imported=2)
+    assert repository.airports["EPWA"].name == "Warsaw Chopin, Okęcie"
+    assert repository.airports["EPWA"].country_id == 1
+    assert repository.airports["KJFK"].name == 'John F. Kennedy "JFK"'
+    assert repository.airports["KJFK"].country_id == 2
+    assert repository.airports["KJFK"].latitude == pytest.approx(40.6397, 1e-4)
+    assert repository.airports["KJFK"].longitude \
+        == pytest.approx(-73.7789, 1e-4)
+
+
+def test_ourairports_header_is_mapped(
+    repository: AirportRepositoryStub,
+) -> None:
+    """Test preferring the GPS code and reading the dataset columns."""
+
+    report = _import(
+        "id,ident,type,name,latitude_deg,longitude_deg,elevation_ft,"
+        "iso_country,gps_code,iata_code\n"
+        "1,PL-0001,small_airport,Kraków,50.0777,19.7848,791,PL,EPKK,KRK\n"
+        "2,US-0002,heliport,Pad,40.0,-74.0,10,US,,\n",
+        repository,
+    )
+
+    assert report.imported == 2
+    assert repository.airports["EPKK"].iata_code == "KRK"
+    assert repository.airports["EPKK"].elevation == 791
+    assert repository.airports["US-0002"].iata_code == ""
+    assert repository.airports["US-0002"].country_id == 2
+
+
+def test_missing_column_is_rejected(
+    repository: AirportRepositoryStub,
+) -> None:
+    """Test failing the whole import without a required column."""
+
+    with pytest.raises(ValueError, match="latitude, country"):
+        _import("icao_code,name,longitude,elevation\n", repository)
+
+
+def test_invalid_rows_are_reported(repository: AirportRepositoryStub) -> None:
+    """Test rejecting invalid rows without aborting the import."""
+
+    report = _import(
+        HEADER
+        + "EPWA,Warsaw,WAW,52.1657,20.9671,361,1\n"
+        + "EPKK,Kraków,KRK,50.0777,19.7848,791,999\n"
+        + "EPGD,Gdańsk,GDN,95.0,18.4662,489,PL\n"
+        + "EPPO,Poznań,POZ,52.4211,16.8263,308,Narnia\n"
+        + "EPWR,Wrocław,WRO,51.1027,16.8858,404,\n"
+        + "EPKT,Katowice,KTW,50.4743,19.08,995,002\n",
+        repository,
+    )
+
+    assert (report.rows, report.imported, report.failed) == (6, 2, 4)
+    assert [(error.line, error.icao_code) for error in report.errors] == [
+        (3, "EPKK"),
+        (4, "EPGD"),
+        (5, "EPPO"),
+        (6, "EPWR"),
+    ]
+    assert report.errors[0].message == "country: Unknown country '999'"
+    assert report.errors[1].message.startswith("latitude: ")
+    assert report.errors[3].message == "country: Field required"
+    assert sorted(repository.airports) == ["EPKT", "EPWA"]
+
+
+def test_rejected_batch_is_upserted_row_by_row(
+    repository: AirportRepositoryStub,
+) -> None:
+    """Test finding the row rejected by the repository."""
+
+    report = _import(
+        HEADER
+        + "EPWA,Warsaw,WAW,52.1657,20.9671,361,PL\n"
+        + "EPKK,Kraków,WAW,50.0777,19.7848,791,PL\n"
+        + "EPGD,Gdańsk,GDN,54.3776,18.4662,489,PL\n"
+        + "EPPO,Poznań,POZ,52.4211,16.8263,308,PL\n",
+        repository,
+        chunk_size=3,
+    )
+
+    assert (report.imported, report.failed) == (3, 1)
+    assert [(error.line, error.icao_code) for error in report.errors] \
+        == [(3, "EPKK")]
+    assert report.errors[0].message == "Key (iata_code)=(WAW)"
+    assert sorted(repository.airports) == ["EPGD", "EPPO", "EPWA"]
+    assert repository.batches == [3, 1, 1, 1, 1]
@@ -0,0 +1,276 @@
+"""Tests of the TTL/LRU cache and the cached airport repository."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Sequence
+
+import pytest
+
+from airportapi.infrastructure.repositories.airportcache import \
+    CachedAirportRepository
+from airportapi.utils.cache import TTLCache
+
+
+class Clock:
+    """A class representing the time moved by the tests."""
+
+    now: float
+
+    def __init__(self) -> None:
+        """The initializer of the `clock`."""
+
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """The method returning the current time.
+
+        Returns:
+            float: The time in seconds.
+        """
+
+        return self.now
+
+
+class AirportRepositoryStub:
+    """A class counting the lookups reaching the wrapped repository."""
+
+    airports: dict[int, SimpleNamespace]
+    calls: list[tuple[str, Any]]
+
+    def __init__(self) -> None:
+        """The initializer of the `airport repository stub`."""
+
+        self.airports = {
+            1: SimpleNamespace(id=1, icao_code="EPWA", name="Warsaw"),
+            2: SimpleNamespace(id=2, icao_code="EPKK", name="Kraków"),
+        }
+        self.calls = []
+
+    async def get_by_id(self, airport_id: int) -> SimpleNamespace | None:
+        """The method getting the airport by its id.
+
+        Args:
+            airport_id (int): The id of the airport.
+
+        Returns:
+            SimpleNamespace | None: The airport if exists.
+        """
+
+        self.calls.append(("id", airport_id))
+
+        return self.airports.get(airport_id)
+
+    async def get_by_icao(self, icao_code: str) -> SimpleNamespace | None:
+        """The method getting the airport by its ICAO code.
+
+        Args:
+            icao_code (str): The ICAO code of the airport.
+
+        Returns:
+            SimpleNamespace | None: The airport if exists.
+        """
+
+        self.calls.append(("icao", icao_code))
+
+        return next(
+            (
+                airport for airport in self.airports.values()
+                if airport.icao_code == icao_code
+            ),
+            None,
+        )
+
+    async def get_by_icao_codes(
+        self,
+        icao_codes: Sequence[str],
+    ) -> dict[str, SimpleNamespace]:
+        """The method getting the airports by their ICAO codes.
+
+        Args:
+            icao_codes (Sequence[str]): The ICAO codes.
+
+        Returns:
+            dict[str, SimpleNamespace]: The found airports by the codes.
+        """
+
+        self.calls.append(("icao_codes", list(icao_codes)))
+
+        return {
+            airport.icao_code: airport
+            for airport in self.airports.values()
+            if airport.icao_code in icao_codes
+        }
+
+    async def update_airport(
+        self,
+        airport_id: int,
+        data: Any,
+    ) -> SimpleNamespace:
+        """The method renaming the airport.
+
+        Args:
+            airport_id (int): The id of the airport.
+            data (Any): The new name.
+
+        Returns:
+            SimpleNamespace: The updated airport.
+        """
+
+        self.airports[airport_id].name = data
+
+        return self.airports[airport_id]
+
+
+@pytest.fixture
+def clock() -> Clock:
+    """Fixture preparing the clock.
+
+    Returns:
+        Clock: The clock at zero.
+    """
+
+    return Clock()
+
+
+def test_entries_expire_after_their_ttl(clock: Clock) -> None:
+    """Test expiring entries with the default and their own TTL."""
+
+    cache = TTLCache(max_size=10, ttl=10.0, clock=clock)
+    cache.set("default", 1)
+    cache.set("short", 2, ttl=1.0)
+    clock.now = 1.0
+
+    assert cache.get("short") is None
+    assert cache.get("default") == 1
+
+    clock.now = 10.0
+
+    assert cache.get("default", "expired") == "expired"
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_least_recently_used_entry_is_evicted(clock: Clock) -> None:
+    """Test evicting the entry which was not read for the longest."""
+
+    cache = TTLCache(max_size=2, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+    cache.set("a", 4)
+    cache.set("d", 5)
+
+    assert (cache.get("a"), cache.get("c"), cache.get("d")) == (4, None, 5)
+
+
+def test_entries_are_invalidated_by_tag(clock: Clock) -> None:
+    """Test removing all entries of the tag and only them."""
+
+    cache = TTLCache(clock=clock)
+    cache.set(("id", 1), "Warsaw", tags=(1,))
+    cache.set(("icao", "EPWA"), "Warsaw", tags=(1,))
+    cache.set(("id", 2), "Kraków", tags=(2,))
+    cache.set(("id", 1), "Warsaw", tags=(3,))
+    cache.invalidate_tag(1)
+
+    assert cache.get(("icao", "EPWA")) is None
+    assert cache.get(("id", 1)) == "Warsaw"
+    assert cache.get(("id", 2)) == "Kraków"
+
+    cache.invalidate_tag(3)
+    cache.invalidate("missing")
+
+    assert len(cache) == 1
+
+
+def test_cache_without_size_stores_nothing(clock: Clock) -> None:
+    """Test disabling the cache with zero size."""
+
+    cache = TTLCache(max_size=0, clock=clock)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+
+
+def test_repository_serves_lookups_from_the_cache(clock: Clock) -> None:
+    """Test reaching the wrapped repository once per lookup."""
+
+    stub = AirportRepositoryStub()
+    repository = CachedAirportRepository(
+        stub,  # type: ignore[arg-type]
+        TTLCache(clock=clock),
+    )
+
+    async def run() -> None:
+        for _ in range(2):
+            assert await repository.get_by_id(1) is stub.airports[1]
+            assert await repository.get_by_icao("EPWA") is stub.airports[1]
+            assert await repository.get_by_id(3) is None
+
+        clock.now = 300.0
+        await repository.get_by_id(1)
+
+    asyncio.run(run())
+
+    assert stub.calls == [
+        ("id", 1),
+        ("icao", "EPWA"),
+        ("id", 3),
+        ("id", 3),
+        ("id", 1),
+    ]
+
+
+def test_update_invalidates_all_lookups_of_the_airport(clock: Clock) -> None:
+    """Test evicting the lookups by id and code of the changed airport."""
+
+    stub = AirportRepositoryStub()
+    repository = CachedAirportRepository(
+        stub,  # type: ignore[arg-type]
+        TTLCache(clock=clock),
+    )
+
+    async def run() -> list[Any]:
+        await repository.get_by_id(1)
+        await repository.get_by_icao("EPWA")
+        await repository.get_by_id(2)
+        await repository.update_airport(1, "Chopin")  # type: ignore[arg-type]
+
+        return [
+            await repository.get_by_id(1),
+            await repository.get_by_icao("EPWA"),
+            await repository.get_by_id(2),
+        ]
+
+    assert [airport.name for airport in asyncio.run(run())] \
+        == ["Chopin", "Chopin", "Kraków"]
+    assert stub.calls[3:] == [("id", 1), ("icao", "EPWA")]
+
+
+def test_invalidation_of_other_processes(clock: Clock) -> None:
+    """Test evicting one airport by its id and all of them by None."""
+
+    stub = AirportRepositoryStub()
+    repository = CachedAirportRepository(
+        stub,  # type: ignore[arg-type]
+        TTLCache(clock=clock),
+    )
+
+    async def run() -> None:
+        await repository.get_by_icao_codes(["EPWA", "EPKK", "XXXX"])
+        repository.invalidate(2)
+        await repository.get_by_icao_codes(["EPWA", "EPKK"])
+        repository.invalidate(None)
+        await repository.get_by_icao_codes(["EPWA"])
+
+    asyncio.run(run())
+
+    assert stub.calls == [
+        ("icao_codes", ["EPWA", "EPKK", "XXXX"]),
+        ("icao_codes", ["EPKK"]),
+        ("icao_codes", ["EPWA"]),
+    ]
@@ -0,0 +1,312 @@
+"""Tests of the conditional GET of the reference data."""
+
+import asyncio
+from types import MappingProxyType
+from typing import Any, Iterator
+
+import pytest
+from dependency_injector import providers
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from airportapi.api.routers import continent
+from airportapi.api.utils import conditional
+from airportapi.api.utils.conditional import _matches
+from airportapi.config import config
+from airportapi.container import Container
+from airportapi.core.domain.location import Continent
+from airportapi.infrastructure.repositories.continentdb import \
+    ContinentRepository
+from airportapi.infrastructure.repositories.invalidation import \
+    InvalidationPublisher
+from airportapi.infrastructure.repositories.versions import TableVersions
+
+REPOSITORIES = "airportapi.infrastructure.repositories"
+
+
+class ContinentServiceStub:
+    """A class returning continents without the database."""
+
+    calls: int
+
+    def __init__(self) -> None:
+        """The initializer of the `continent service stub`."""
+
+        self.calls = 0
+
+    async def get_all_continents(self) -> list[Continent]:
+        """The method counting the reads and returning one continent.
+
+        Returns:
+            list[Continent]: The continents.
+        """
+
+        self.calls += 1
+
+        return [Continent(id=1, name="Europe", alias="EU")]
+
+
+class TablesStub:
+    """A class emulating the continents table and its version trigger."""
+
+    continents: list[dict[str, Any]]
+    versions: dict[str, int]
+
+    def __init__(self) -> None:
+        """The initializer of the `tables stub`."""
+
+        self.continents = [{"id": 1, "name": "Europe", "alias": "EU"}]
+        self.versions = {"continents": 3}
+
+    async def fetch_one(self, query: Any) -> dict[str, Any]:
+        """The method inserting the continent and bumping the version.
+
+        Args:
+            query (Any): The insert statement.
+
+        Returns:
+            dict[str, Any]: The inserted row.
+        """
+
+        row = {"id": len(self.continents) + 1, **query.compile().params}
+        self.continents.append(row)
+        self.versions["continents"] += 1
+
+        return row
+
+    async def fetch_all(self, query: Any) -> list[dict[str, Any]]:
+        """The method reading the versions of the tables.
+
+        Args:
+            query (Any): The statement of the table versions.
+
+        Returns:
+            list[dict[str, Any]]: The rows of the versions.
+        """
+
+        return [
+            {"table_name": name, "version": version}
+            for name, version in self.versions.items()
+        ]
+
+
+class ReplicaStub:
+    """A class reading the continents of the tables stub."""
+
+    tables: TablesStub
+
+    def __init__(self, tables: TablesStub) -> None:
+        """The initializer of the `replica stub`.
+
+        Args:
+            tables (TablesStub): The emulated tables.
+        """
+
+        self.tables = tables
+
+    async def fetch_all(self, query: Any) -> list[dict[str, Any]]:
+        """The method reading all continents.
+
+        Args:
+            query (Any): The select statement.
+
+        Returns:
+            list[dict[str, Any]]: The rows of the continents.
+        """
+
+        return list(self.tables.continents)
+
+
+class ReferenceDataStub:
+    """A class skipping the reload of the reference map."""
+
+    async def load(self) -> None:
+        """The method doing nothing instead of reading the DB."""
+
+
+@pytest.fixture
+def versions() -> TableVersions:
+    """Fixture preparing the versions without loading them from the DB.
+
+    Returns:
+        TableVersions: The versions.
+    """
+
+    versions = TableVersions()
+    versions._versions = MappingProxyType({"continents": 3})
+
+    return versions
+
+
+@pytest.fixture
+def service() -> ContinentServiceStub:
+    """Fixture preparing the continent service.
+
+    Returns:
+        ContinentServiceStub: The service.
+    """
+
+    return ContinentServiceStub()
+
+
+@pytest.fixture
+def client(
+    versions: TableVersions,
+    service: ContinentServiceStub,
+) -> Iterator[TestClient]:
+    """Fixture serving the continent router with the injected stubs.
+
+    Args:
+        versions (TableVersions): The versions of the tables.
+        service (ContinentServiceStub): The continent service.
+
+    Yields:
+        TestClient: The client of the app.
+    """
+
+    container = Container()
+    container.table_versions.override(providers.Object(versions))
+    container.continent_service.override(providers.Object(service))
+    container.wire(modules=[continent, conditional])
+    app = FastAPI()
+    app.include_router(continent.router, prefix="/continent")
+
+    with TestClient(app) as client:
+        yield client
+
+    container.unwire()
+
+
+def test_response_has_the_tag_and_cache_control(
+    client: TestClient,
+) -> None:
+    """Test sending the validators with the data."""
+
+    response = client.get("/continent/all")
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": 1, "name": "Europe", "alias": "EU"}]
+    assert response.headers["etag"] == '"continents.3"'
+    assert response.headers["cache-control"] \
+        == f"public, max-age={config.HTTP_CACHE_MAX_AGE}"
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    ['"continents.3"', 'W/"continents.3"', '"old", "continents.3"', "*"],
+)
+def test_current_tag_is_answered_with_not_modified(
+    client: TestClient,
+    service: ContinentServiceStub,
+    if_none_match: str,
+) -> None:
+    """Test answering 304 without reading the continents."""
+
+    response = client.get(
+        "/continent/all",
+        headers={"If-None-Match": if_none_match},
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == '"continents.3"'
+    assert service.calls == 0
+
+
+def test_changed_table_invalidates_the_tag(
+    client: TestClient,
+    versions: TableVersions,
+    service: ContinentServiceStub,
+) -> None:
+    """Test sending the data again after the table was written."""
+
+    versions._versions = MappingProxyType({"continents": 4})
+    response = client.get(
+        "/continent/all",
+        headers={"If-None-Match": '"continents.3"'},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"continents.4"'
+    assert service.calls == 1
+
+
+def test_created_continent_changes_the_tag(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test reloading the versions after a continent is created."""
+
+    tables = TablesStub()
+    monkeypatch.setattr(f"{REPOSITORIES}.continentdb.database", tables)
+    monkeypatch.setattr(
+        f"{REPOSITORIES}.continentdb.replica",
+        ReplicaStub(tables),
+    )
+    monkeypatch.setattr(f"{REPOSITORIES}.versions.database", tables)
+
+    table_versions = TableVersions()
+    asyncio.run(table_versions.load())
+    container = Container()
+    container.table_versions.override(providers.Object(table_versions))
+    container.continent_repository.override(providers.Object(
+        ContinentRepository(
+            reference=ReferenceDataStub(),  # type: ignore[arg-type]
+            publisher=InvalidationPublisher(
+                "test",
+                enabled=False,
+                listeners=[table_versions.load],
+            ),
+        )
+    ))
+    container.wire(modules=[continent, conditional])
+    app = FastAPI()
+    app.include_router(continent.router, prefix="/continent")
+
+    try:
+        with TestClient(app) as client:
+            etag = client.get("/continent/all").headers["etag"]
+
+            created = client.post(
+                "/continent/create",
+                json={"name": "Asia", "alias": "AS"},
+            )
+            response = client.get(
+                "/continent/all",
+                headers={"If-None-Match": etag},
+            )
+    finally:
+        container.unwire()
+
+    assert etag == '"continents.3"'
+    assert created.status_code == 201
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"continents.4"'
+    assert [row["name"] for row in response.json()] == ["Europe", "Asia"]
+
+
+def test_tag_covers_all_tables_of_the_response() -> None:
+    """Test building the tag of unknown tables with the zero version."""
+
+    versions = TableVersions()
+    versions._versions = MappingProxyType({"airports": 7, "countries": 2})
+
+    assert versions.etag("airports", "countries", "continents") \
+        == '"airports.7-countries.2-continents.0"'
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "matches"),
+    [
+        (None, False),
+        ("", False),
+        ('"a.1"', True),
+        ('W/"a.1"', True),
+        (' "b.1" ,  "a.1" ', True),
+        ('"a.2"', False),
+        ("a.1", False),
+    ],
+)
+def test_matches(if_none_match: str | None, matches: bool) -> None:
+    """Test comparing the tags weakly."""
+
+    assert _matches(if_none_match, '"a.1"') is matches
@@ -0,0 +1,329 @@
+"""Tests of the METAR fetcher against a local stub HTTP server."""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+import httpx
+import pytest
+
+from airportapi.infrastructure.ingestion.fetcher import (
+    FetchResult,
+    MetarFetcher,
+)
+from airportapi.infrastructure.ingestion.scheduler import MetarScheduler
+
+REPORT = "2024/11/05 12:30\n{icao} 051230Z 24008KT 9999 FEW030 08/04 Q1021\n"
+
+
+class StationServer(ThreadingHTTPServer):
+    """A class serving station files like the NOAA server.
+
+    Stations in `etags` answer with the tag and 304 for a matching
+    `If-None-Match`, stations in `errors` with the status, the others
+    with 404.
+    """
+
+    etags: dict[str, str]
+    errors: dict[str, int]
+    requests: list[tuple[str, str | None]]
+
+    @property
+    def endpoint(self) -> str:
+        """The property returning the URL template of the stations.
+
+        Returns:
+            str: The template with `{icao}` placeholder.
+        """
+
+        host, port = self.server_address[:2]
+
+        return f"http://{host!s}:{port}/{{icao}}.TXT"
+
+
+class StationHandler(BaseHTTPRequestHandler):
+    """A class handling requests of the station server."""
+
+    server: StationServer
+
+    def do_GET(self) -> None:
+        """The method answering the request of the station file."""
+
+        icao_code = self.path.strip("/").removesuffix(".TXT")
+        if_none_match = self.headers.get("If-None-Match")
+        self.server.requests.append((icao_code, if_none_match))
+
+        if status := self.server.errors.get(icao_code):
+            self.send_response(status)
+            self.end_headers()
+            return
+
+        if (etag := self.server.etags.get(icao_code)) is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        if if_none_match == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = REPORT.format(icao=icao_code).encode()
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        """The method silencing the request log."""
+
+
+class AirportRepositoryStub:
+    """A class returning the polled stations."""
+
+    async def get_icao_codes(self) -> list[str]:
+        """The method returning the ICAO codes of the stations.
+
+        Returns:
+            list[str]: The ICAO codes.
+        """
+
+        return ["EPWA"]
+
+
+class LockStub:
+    """A class granting the lock to its first holder only."""
+
+    owner: object | None
+
+    def __init__(self) -> None:
+        """The initializer of the `lock stub`."""
+
+        self.owner = None
+
+    def holder(self) -> "LockHolderStub":
+        """The method preparing a lock of another process.
+
+        Returns:
+            LockHolderStub: The lock of the process.
+        """
+
+        return LockHolderStub(self)
+
+
+class LockHolderStub:
+    """A class representing the shared lock in one process."""
+
+    lock: LockStub
+
+    def __init__(self, lock: LockStub) -> None:
+        """The initializer of the `lock holder stub`.
+
+        Args:
+            lock (LockStub): The shared lock.
+        """
+
+        self.lock = lock
+
+    @property
+    def held(self) -> bool:
+        """The property telling if this process holds the lock.
+
+        Returns:
+            bool: True if the lock is held.
+        """
+
+        return self.lock.owner is self
+
+    async def acquire(self) -> bool:
+        """The method taking the lock if it is free.
+
+        Returns:
+            bool: True if this process holds the lock.
+        """
+
+        if self.lock.owner is None:
+            self.lock.owner = self
+
+        return self.held
+
+    async def release(self) -> None:
+        """The method releasing the lock held by this process."""
+
+        if self.held:
+            self.lock.owner = None
+
+
+@pytest.fixture
+def server() -> Iterator[StationServer]:
+    """Fixture running the station server in a thread.
+
+    Yields:
+        StationServer: The running server.
+    """
+
+    server = StationServer(("127.0.0.1", 0), StationHandler)
+    server.etags = {}
+    server.errors = {}
+    server.requests = []
+    thread = threading.Thread(
+        target=server.serve_forever,
+        kwargs={"poll_interval": 0.05},
+        daemon=True,
+    )
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+async def _fetch(
+    fetcher: MetarFetcher,
+    *icao_codes: str,
+    remember: bool = True,
+) -> FetchResult:
+    """A private function fetching the stations as a polling cycle does.
+
+    Args:
+        fetcher (MetarFetcher): The fetcher.
+        *icao_codes (str): The ICAO codes of the stations.
+        remember (bool, optional): Whether the reports count as stored.
+            Defaults to True.
+
+    Returns:
+        FetchResult: The outcome of the cycle.
+    """
+
+    result = await fetcher.fetch_many(icao_codes)
+
+    if remember:
+        fetcher.remember(result)
+
+    return result
+
+
+def test_unchanged_station_is_answered_with_not_modified(
+    server: StationServer,
+) -> None:
+    """Test sending the ETag back and counting the 304 answer."""
+
+    server.etags["EPWA"] = '"v1"'
+
+    async def run() -> tuple[FetchResult, FetchResult]:
+        async with httpx.AsyncClient() as client:
+            fetcher = MetarFetcher(client, server.endpoint)
+
+            return await _fetch(fetcher, "EPWA"), await _fetch(fetcher, "EPWA")
+
+    first, second = asyncio.run(run())
+
+    assert [report.raw for report in first.reports] == [
+        "EPWA 051230Z 24008KT 9999 FEW030 08/04 Q1021",
+    ]
+    assert first.validators == {"EPWA": {"If-None-Match": '"v1"'}}
+    assert (second.reports, second.not_modified) == ([], 1)
+    assert server.requests == [("EPWA", None), ("EPWA", '"v1"')]
+
+
+def test_validators_wait_until_reports_are_stored(
+    server: StationServer,
+) -> None:
+    """Test fetching the report again if it was not stored."""
+
+    server.etags["EPWA"] = '"v1"'
+
+    async def run() -> FetchResult:
+        async with httpx.AsyncClient() as client:
+            fetcher = MetarFetcher(client, server.endpoint)
+            await _fetch(fetcher, "EPWA", remember=False)
+
+            return await _fetch(fetcher, "EPWA")
+
+    assert len(asyncio.run(run()).reports) == 1
+    assert server.requests == [("EPWA", None), ("EPWA", None)]
+
+
+def test_failed_stations_are_counted_and_retried(
+    server: StationServer,
+) -> None:
+    """Test isolating errors of single stations within the cycle."""
+
+    server.etags.update({"EPWA": '"v1"', "EPKK": '"v1"'})
+    server.errors["EPKK"] = 503
+
+    async def run() -> tuple[FetchResult, FetchResult]:
+        async with httpx.AsyncClient() as client:
+            fetcher = MetarFetcher(client, server.endpoint)
+            failed = await _fetch(fetcher, "EPWA", "EPKK", "XXXX")
+            del server.errors["EPKK"]
+
+            return failed, await _fetch(fetcher, "EPWA", "EPKK")
+
+    failed, recovered = asyncio.run(run())
+
+    assert (len(failed.reports), failed.failed) == (1, 2)
+    assert [report.icao_code for report in recovered.reports] == ["EPKK"]
+    assert recovered.not_modified == 1
+    assert ("EPKK", None) in server.requests[3:]
+
+
+def test_requests_are_spaced_by_the_rate_limit(
+    server: StationServer,
+) -> None:
+    """Test backing off the host to the configured rate."""
+
+    codes = [f"K{index:03d}" for index in range(6)]
+    server.etags.update({code: '"v1"' for code in codes})
+
+    async def run() -> FetchResult:
+        async with httpx.AsyncClient() as client:
+            fetcher = MetarFetcher(client, server.endpoint, rate_limit=25.0)
+
+            return await _fetch(fetcher, *codes)
+
+    started = time.monotonic()
+    result = asyncio.run(run())
+
+    assert len(result.reports) == 6
+    assert time.monotonic() - started >= 5 / 25.0
+
+
+def test_only_the_lock_holder_polls(server: StationServer) -> None:
+    """Test polling by a single process of several ones."""
+
+    server.etags["EPWA"] = '"v1"'
+    lock = LockStub()
+
+    async def run() -> list[MetarScheduler]:
+        async with httpx.AsyncClient() as client:
+            schedulers = [
+                MetarScheduler(
+                    AirportRepositoryStub(),  # type: ignore[arg-type]
+                    MetarFetcher(client, server.endpoint),
+                    interval=0.05,
+                    lock=lock.holder(),  # type: ignore[arg-type]
+                )
+                for _ in range(3)
+            ]
+
+            for scheduler in schedulers:
+                scheduler.start()
+
+            await asyncio.sleep(0.3)
+
+            for scheduler in schedulers:
+                await scheduler.stop()
+
+            return schedulers
+
+    schedulers = asyncio.run(run())
+
+    assert [scheduler.succeeded_cycles > 0 for scheduler in schedulers] \
+        == [True, False, False]
+    assert lock.owner is None
+    assert not any(scheduler.leading for scheduler in schedulers)
@@ -0,0 +1,82 @@
+"""Tests of the metrics documents shared by the workers."""
+
+import os
+import time
+from pathlib import Path
+
+from airportapi.utils.metrics import (
+    MetricsDirectory,
+    MetricsWriter,
+    merge_documents,
+)
+
+
+def _document(worker: str, requests: int, in_flight: int) -> str:
+    """A private function rendering the document of the worker.
+
+    Args:
+        worker (str): The identifier of the worker.
+        requests (int): The value of the counter.
+        in_flight (int): The value of the gauge.
+
+    Returns:
+        str: The document.
+    """
+
+    writer = MetricsWriter({"worker": worker})
+    writer.family("requests_total", "counter", "Requests.")
+    writer.sample("requests_total", requests, {"status": "200"})
+    writer.family("in_flight", "gauge", "Requests in flight.")
+    writer.sample("in_flight", in_flight)
+
+    return writer.render()
+
+
+def test_samples_are_labelled_with_the_worker() -> None:
+    """Test putting the constant labels before the sample ones."""
+
+    assert _document("7", 3, 1).splitlines() == [
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{worker="7",status="200"} 3',
+        "# HELP in_flight Requests in flight.",
+        "# TYPE in_flight gauge",
+        'in_flight{worker="7"} 1',
+    ]
+
+
+def test_documents_are_merged_by_families() -> None:
+    """Test grouping the samples of all workers under one header."""
+
+    merged = merge_documents([_document("1", 3, 1), _document("2", 5, 0)])
+
+    assert merged.splitlines() == [
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{worker="1",status="200"} 3',
+        'requests_total{worker="2",status="200"} 5',
+        "# HELP in_flight Requests in flight.",
+        "# TYPE in_flight gauge",
+        'in_flight{worker="1"} 1',
+        'in_flight{worker="2"} 0',
+    ]
+
+
+def test_directory_skips_the_reader_and_dead_workers(tmp_path: Path) -> None:
+    """Test reading live documents and removing the stale ones."""
+
+    directory = MetricsDirectory(tmp_path / "metrics", max_age=30.0)
+    directory.write("1", _document("1", 1, 0))
+    directory.write("2", _document("2", 2, 0))
+    directory.write("3", _document("3", 3, 0))
+    stale = time.time() - 60
+    os.utime(tmp_path / "metrics" / "3.prom", (stale, stale))
+
+    assert directory.read(exclude="1") == [_document("2", 2, 0)]
+    assert sorted(path.name for path in (tmp_path / "metrics").iterdir()) \
+        == ["1.prom", "2.prom"]
+
+    directory.remove("2")
+    directory.remove("2")
+
+    assert directory.read() == [_document("1", 1, 0)]
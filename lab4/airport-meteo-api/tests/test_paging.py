@@ -0,0 +1,180 @@
+"""Tests of the keyset pagination cursors."""
+
+import base64
+
+import orjson
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from airportapi.api.utils.paging import page_request
+from airportapi.core.domain.airport import Airport
+from airportapi.core.domain.page import PageRequest
+from airportapi.db import airport_table
+from airportapi.infrastructure.repositories.airportdb import \
+    AirportRepository
+from airportapi.infrastructure.repositories.airportmock import \
+    AirportMockRepository
+from airportapi.infrastructure.services.airport import AirportService
+from airportapi.utils.cursor import decode_cursor, encode_cursor
+
+
+def _cursor(payload: object) -> str:
+    """A private function encoding the payload like a cursor.
+
+    Args:
+        payload (object): The JSON payload.
+
+    Returns:
+        str: The cursor.
+    """
+
+    return base64.urlsafe_b64encode(orjson.dumps(payload)).decode()
+
+
+def _airport(airport_id: int, name: str) -> Airport:
+    """A private function building the airport with the name.
+
+    Args:
+        airport_id (int): The id of the airport.
+        name (str): The name of the airport.
+
+    Returns:
+        Airport: The airport.
+    """
+
+    return Airport(
+        id=airport_id,
+        name=name,
+        icao_code=f"X{airport_id:03d}",
+        iata_code="",
+        country_id=1,
+        latitude=0.0,
+        longitude=0.0,
+        elevation=0,
+    )
+
+
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("after", [("Kraków, Balice", 7), ("", 0)])
+def test_cursor_round_trip(descending: bool, after: tuple[str, int]) -> None:
+    """Test decoding the sort order and the key of the encoded cursor."""
+
+    page = PageRequest(sort="name", descending=descending, limit=10)
+    cursor = encode_cursor(page, after)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, 25) == PageRequest(
+        sort="name",
+        descending=descending,
+        limit=25,
+        after=after,
+    )
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor!",
+        base64.urlsafe_b64encode(b"plain text").decode(),
+        _cursor(["name", False, ["EPWA", 1]]),
+        _cursor({"sort": "name", "descending": False}),
+        _cursor({"sort": "name", "descending": False, "after": ["EPWA"]}),
+        _cursor({"sort": "name", "descending": False, "after": ["A", "x"]}),
+    ],
+)
+def test_invalid_cursor_is_rejected(cursor: str) -> None:
+    """Test answering 400 to the malformed cursor."""
+
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor, 10)
+
+    with pytest.raises(HTTPException) as error:
+        page_request(10, None, cursor)
+
+    assert error.value.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"sort": "id", "descending": False, "after": ["1", 1]},
+        {"sort": "name", "descending": False, "after": [1, 1]},
+        {"sort": "name", "descending": False, "after": [None, 1]},
+    ],
+)
+def test_tampered_cursor_is_rejected(payload: dict) -> None:
+    """Test rejecting cursors with keys the endpoints never issue."""
+
+    with pytest.raises(HTTPException) as error:
+        page_request(10, None, _cursor(payload))
+
+    assert error.value.status_code == 400
+
+
+def test_page_request_of_the_query() -> None:
+    """Test paginating only if any of the parameters is passed."""
+
+    assert page_request(None, None, None) is None
+    assert page_request(None, "-icao_code", None) == PageRequest(
+        sort="icao_code",
+        descending=True,
+        limit=100,
+    )
+
+    with pytest.raises(HTTPException):
+        page_request(5, "latitude", None)
+
+
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("limit", [1, 2, 3, 7])
+def test_pages_with_duplicate_names(descending: bool, limit: int) -> None:
+    """Test visiting every airport once when the names repeat."""
+
+    airports = [
+        _airport(airport_id, name)
+        for airport_id, name in enumerate(
+            ["Bravo", "Alpha", "Bravo", "Bravo", "Alpha", "Charlie", "Bravo"],
+            start=1,
+        )
+    ]
+    expected = sorted(
+        airports,
+        key=lambda airport: (airport.name, airport.id),
+        reverse=descending,
+    )
+    page = page_request(limit, "-name" if descending else "name", None)
+    visited = []
+
+    while page is not None:
+        result = AirportService._page(
+            AirportMockRepository._paginate(
+                airports,
+                page.model_copy(update={"limit": page.limit + 1}),
+            ),
+            page,
+        )
+        visited += result.items
+        page = page_request(limit, None, result.next) if result.next \
+            else None
+
+    assert [airport.id for airport in visited] \
+        == [airport.id for airport in expected]
+
+
+def test_query_continues_after_the_name_and_id() -> None:
+    """Test breaking ties of the sort key with the id in SQL."""
+
+    query = AirportRepository._paginate(
+        airport_table.select(),
+        PageRequest(sort="name", descending=True, limit=2, after=("B", 4)),
+    )
+    sql = " ".join(str(query.compile(
+        dialect=postgresql.dialect(),
+        compile_kwargs={"literal_binds": True},
+    )).split())
+
+    assert "WHERE (airports.name, airports.id) < ('B', 4)" in sql
+    assert sql.endswith(
+        "ORDER BY airports.name DESC, airports.id DESC LIMIT 2"
+    )
@@ -0,0 +1,110 @@
+"""Tests of splitting the statistics period by the source of aggregates."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from airportapi.db import daily_rollup_table, hourly_rollup_table
+from airportapi.infrastructure.repositories.observationdb import (
+    _split_period,
+)
+
+UTC = timezone.utc
+
+
+def _utc(
+    year: int,
+    month: int,
+    day: int,
+    hour: int = 0,
+    minute: int = 0,
+) -> datetime:
+    """A private function building the aware UTC time.
+
+    Args:
+        year (int): The year.
+        month (int): The month.
+        day (int): The day.
+        hour (int, optional): The hour. Defaults to 0.
+        minute (int, optional): The minute. Defaults to 0.
+
+    Returns:
+        datetime: The time.
+    """
+
+    return datetime(year, month, day, hour, minute, tzinfo=UTC)
+
+
+def test_period_within_an_hour_is_read_raw() -> None:
+    """Test reading a short period from the observations only."""
+
+    start, end = _utc(2024, 5, 1, 10, 5), _utc(2024, 5, 1, 10, 55)
+
+    assert _split_period(start, end) == [(None, start, end)]
+
+
+def test_period_of_hours_uses_the_hourly_rollup() -> None:
+    """Test reading only the partial hours from the observations."""
+
+    start, end = _utc(2024, 5, 1, 10, 30), _utc(2024, 5, 1, 14, 15)
+
+    assert _split_period(start, end) == [
+        (None, start, _utc(2024, 5, 1, 11)),
+        (hourly_rollup_table, _utc(2024, 5, 1, 11), _utc(2024, 5, 1, 14)),
+        (None, _utc(2024, 5, 1, 14), end),
+    ]
+
+
+def test_period_of_days_uses_the_daily_rollup() -> None:
+    """Test covering the whole days with the daily rollup."""
+
+    start, end = _utc(2024, 5, 1, 22, 30), _utc(2024, 5, 4, 1, 45)
+
+    assert _split_period(start, end) == [
+        (None, start, _utc(2024, 5, 1, 23)),
+        (hourly_rollup_table, _utc(2024, 5, 1, 23), _utc(2024, 5, 2)),
+        (daily_rollup_table, _utc(2024, 5, 2), _utc(2024, 5, 4)),
+        (hourly_rollup_table, _utc(2024, 5, 4), _utc(2024, 5, 4, 1)),
+        (None, _utc(2024, 5, 4, 1), end),
+    ]
+
+
+def test_aligned_bounds_skip_empty_parts() -> None:
+    """Test dropping the parts without any time."""
+
+    start, end = _utc(2024, 5, 1), _utc(2024, 5, 3)
+
+    assert _split_period(start, end) == [(daily_rollup_table, start, end)]
+
+
+def test_naive_and_offset_times_are_converted_to_utc() -> None:
+    """Test treating naive times as UTC and converting the other ones."""
+
+    warsaw = timezone(timedelta(hours=2))
+
+    assert _split_period(
+        datetime(2024, 5, 1, 10, 30),
+        datetime(2024, 5, 1, 14, 15, tzinfo=warsaw),
+    ) == [
+        (None, _utc(2024, 5, 1, 10, 30), _utc(2024, 5, 1, 11)),
+        (hourly_rollup_table, _utc(2024, 5, 1, 11), _utc(2024, 5, 1, 12)),
+        (None, _utc(2024, 5, 1, 12), _utc(2024, 5, 1, 12, 15)),
+    ]
+
+
+@pytest.mark.parametrize("hours", [0, 1, 5, 23, 24, 25, 47, 24 * 40 + 7])
+@pytest.mark.parametrize("minutes", [1, 43])
+def test_parts_cover_the_period_without_gaps(hours: int, minutes: int) -> None:
+    """Test joining the parts into exactly the requested period."""
+
+    start = _utc(2024, 2, 28, 23, 17)
+    end = start + timedelta(hours=hours, minutes=minutes)
+    parts = _split_period(start, end)
+
+    assert parts[0][1] == start
+    assert parts[-1][2] == end
+    assert all(
+        previous[2] == following[1]
+        for previous, following in zip(parts, parts[1:])
+    )
+    assert all(lower < upper for _, lower, upper in parts)
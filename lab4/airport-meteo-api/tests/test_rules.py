@@ -0,0 +1,107 @@
+"""Tests of the weather warning rule engine."""
+
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+from airportapi.core.domain.observation import ObservationIn
+from airportapi.infrastructure.ingestion.rules import (
+    ABOVE,
+    Rule,
+    RuleEngine,
+    default_rules,
+)
+
+TIME = datetime(2024, 5, 1, 12, tzinfo=timezone.utc)
+
+
+def _observation(icao_code: str, **values: Any) -> ObservationIn:
+    """A private function building the observation of the station.
+
+    Args:
+        icao_code (str): The ICAO code of the station.
+        **values (Any): The decoded attributes.
+
+    Returns:
+        ObservationIn: The observation.
+    """
+
+    return ObservationIn(
+        icao_code=icao_code,
+        observation_time=TIME,
+        raw=f"{icao_code} 011200Z",
+        **values,
+    )
+
+
+@pytest.mark.parametrize(
+    ("weather", "triggered"),
+    [
+        ("FZFG", False),
+        ("BCFG FZFG", False),
+        ("-FZRA", True),
+        ("+FZDZ", True),
+        ("FZUP", True),
+        ("-RA FZFG", False),
+        ("FZFG -FZDZ", True),
+        (None, False),
+    ],
+)
+def test_freezing_precipitation_ignores_freezing_fog(
+    weather: str | None,
+    triggered: bool,
+) -> None:
+    """Test warning of freezing precipitation but not of freezing fog."""
+
+    engine = RuleEngine(default_rules(freezing=True))
+    warnings = engine.evaluate([_observation("EPWA", weather=weather)])
+
+    assert [warning.rule for warning in warnings] \
+        == (["freezing_precipitation"] if triggered else [])
+
+
+def test_textual_warning_keeps_the_weather() -> None:
+    """Test passing the weather as the detail of the warning."""
+
+    engine = RuleEngine(default_rules(freezing=True))
+    warning, = engine.evaluate([_observation("EPWA", weather="-FZRA BR")])
+
+    assert warning.detail == "-FZRA BR"
+    assert warning.value is None
+    assert warning.threshold is None
+
+
+def test_numeric_thresholds() -> None:
+    """Test triggering at the threshold and skipping missing values."""
+
+    engine = RuleEngine(default_rules(gust=35.0, visibility=1500.0))
+    warnings = engine.evaluate([
+        _observation("EPWA", wind_gust=35.0, visibility=1500.0),
+        _observation("EPKK", wind_gust=34.0, visibility=1499.0),
+        _observation("KJFK"),
+    ])
+
+    assert [
+        (warning.icao_code, warning.rule, warning.value, warning.threshold)
+        for warning in warnings
+    ] == [
+        ("EPWA", "gust", 35.0, 35.0),
+        ("EPKK", "low_visibility", 1499.0, 1500.0),
+    ]
+
+
+def test_disabled_rules_and_empty_batches() -> None:
+    """Test returning no warnings without rules or observations."""
+
+    assert default_rules() == []
+    assert RuleEngine([]).evaluate([_observation("EPWA")]) == []
+    assert RuleEngine([Rule("gust", "wind_gust", ABOVE, 1.0)]) \
+        .evaluate([]) == []
+
+
+def test_unknown_comparison_is_rejected() -> None:
+    """Test validating the comparison of the rule."""
+
+    with pytest.raises(ValueError):
+        Rule("gust", "wind_gust", "equal", 1.0)
@@ -0,0 +1,181 @@
+"""Tests of the spatial index against the brute-force search."""
+
+import random
+
+import numpy as np
+import pytest
+
+from airportapi.utils.geo import haversine
+from airportapi.utils.geoarray import route_distances, to_unit_vectors
+from airportapi.utils.spatial import SpatialIndex
+
+ROUTES = (
+    ((52.1657, 20.9671), (40.6413, -73.7781)),
+    ((-33.9461, 151.1772), (33.9416, -118.4085)),
+    ((64.1333, -21.9406), (61.1743, -149.9982)),
+)
+
+
+@pytest.fixture(scope="module")
+def points() -> list[tuple[int, float, float]]:
+    """Fixture generating random points, some of them close to the poles.
+
+    Returns:
+        list[tuple[int, float, float]]: The keys with coordinates.
+    """
+
+    generator = random.Random(0)
+    points = [
+        (key, generator.uniform(-90, 90), generator.uniform(-180, 180))
+        for key in range(3000)
+    ]
+    points += [
+        (len(points) + key, generator.choice((-1, 1)) * 89.5,
+         generator.uniform(-180, 180))
+        for key in range(20)
+    ]
+
+    return points
+
+
+@pytest.fixture(scope="module")
+def index(points: list[tuple[int, float, float]]) -> SpatialIndex:
+    """Fixture building the index of the points.
+
+    Args:
+        points (list[tuple[int, float, float]]): The indexed points.
+
+    Returns:
+        SpatialIndex: The index.
+    """
+
+    index = SpatialIndex()
+    index.rebuild(points)
+
+    return index
+
+
+def _brute_force(
+    points: list[tuple[int, float, float]],
+    latitude: float,
+    longitude: float,
+) -> list[tuple[float, int]]:
+    """A private function calculating the distances of all points.
+
+    Args:
+        points (list[tuple[int, float, float]]): The points.
+        latitude (float): The latitude of the location.
+        longitude (float): The longitude of the location.
+
+    Returns:
+        list[tuple[float, int]]: The distances with keys, closest first.
+    """
+
+    return sorted(
+        (haversine(latitude, longitude, lat, lon), key)
+        for key, lat, lon in points
+    )
+
+
+@pytest.mark.parametrize(
+    ("latitude", "longitude", "radius"),
+    [
+        (50.0, 19.9, 300.0),
+        (0.0, 179.9, 500.0),
+        (0.0, -179.9, 500.0),
+        (89.9, 0.0, 800.0),
+        (-89.9, 45.0, 800.0),
+        (10.0, 10.0, 0.0),
+    ],
+)
+def test_within_matches_brute_force(
+    points: list[tuple[int, float, float]],
+    index: SpatialIndex,
+    latitude: float,
+    longitude: float,
+    radius: float,
+) -> None:
+    """Test finding the same points as checking every one of them."""
+
+    expected = [
+        (key, distance)
+        for distance, key in _brute_force(points, latitude, longitude)
+        if distance <= radius
+    ]
+    found = index.within(latitude, longitude, radius)
+
+    assert [key for key, _ in found] == [key for key, _ in expected]
+    assert [distance for _, distance in found] \
+        == pytest.approx([distance for _, distance in expected])
+
+
+@pytest.mark.parametrize("count", [1, 5, 50])
+@pytest.mark.parametrize(
+    ("latitude", "longitude"),
+    [(52.2, 21.0), (0.0, 180.0), (-89.0, -120.0)],
+)
+def test_nearest_matches_brute_force(
+    points: list[tuple[int, float, float]],
+    index: SpatialIndex,
+    latitude: float,
+    longitude: float,
+    count: int,
+) -> None:
+    """Test finding the same closest points as sorting all of them."""
+
+    expected = _brute_force(points, latitude, longitude)[:count]
+    found = index.nearest(latitude, longitude, count, radius=10.0)
+
+    assert [key for key, _ in found] == [key for _, key in expected]
+    assert [distance for _, distance in found] \
+        == pytest.approx([distance for distance, _ in expected])
+
+
+def test_nearest_returns_all_points_of_small_index() -> None:
+    """Test stopping the growing search at the half of the circumference."""
+
+    index = SpatialIndex()
+    index.rebuild([(1, 10.0, 10.0), (2, -10.0, -170.0)])
+
+    assert [key for key, _ in index.nearest(0.0, 0.0, 5)] == [1, 2]
+
+
+@pytest.mark.parametrize(("start", "end"), ROUTES)
+@pytest.mark.parametrize("width", [50.0, 300.0])
+def test_along_route_matches_brute_force(
+    points: list[tuple[int, float, float]],
+    index: SpatialIndex,
+    start: tuple[float, float],
+    end: tuple[float, float],
+    width: float,
+) -> None:
+    """Test finding the same points as checking the whole corridor."""
+
+    keys = np.array([key for key, _, _ in points])
+    vectors = to_unit_vectors(
+        [lat for _, lat, _ in points],
+        [lon for _, _, lon in points],
+    )
+    start_vector, end_vector = to_unit_vectors(*zip(start, end))
+    cross, _ = route_distances(vectors, start_vector, end_vector)
+
+    found = index.along_route(start, end, width)
+
+    assert sorted(key for key, _, _ in found) \
+        == sorted(keys[cross <= width].tolist())
+    assert [along for _, _, along in found] \
+        == sorted(along for _, _, along in found)
+
+
+def test_moved_and_removed_points_are_not_found() -> None:
+    """Test updating the cells when the point changes."""
+
+    index = SpatialIndex()
+    index.insert(1, 50.0, 20.0)
+    index.insert(1, -50.0, -20.0)
+
+    assert index.within(50.0, 20.0, 100.0) == []
+    assert [key for key, _ in index.within(-50.0, -20.0, 1.0)] == [1]
+    assert index.remove(1)
+    assert not index.remove(1)
+    assert len(index) == 0